@@ -0,0 +1 @@
+"""Airspeed velocity (asv) benchmarks of the conversion hot paths, built on the mock interfaces."""
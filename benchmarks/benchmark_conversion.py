@@ -0,0 +1,99 @@
+"""Benchmarks of end-to-end conversions and of the default backend configuration."""
+
+from pathlib import Path
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from neuroconv import ConverterPipe
+from neuroconv.tools.nwb_helpers import get_default_backend_configuration
+from neuroconv.tools.testing.mock_interfaces import (
+    MockImagingInterface,
+    MockRecordingInterface,
+    MockSegmentationInterface,
+    MockSortingInterface,
+)
+
+
+class EcephysConversionSuite:
+    """Write a Neuropixels-sized recording together with a sorting of several hundred units."""
+
+    params = (["hdf5", "zarr"],)
+    param_names = ["backend"]
+    timeout = 600
+
+    def setup(self, backend: str):
+        recording_interface = MockRecordingInterface(num_channels=384, durations=(10.0,))
+        sorting_interface = MockSortingInterface(num_units=500, durations=(600.0,))
+        self.converter = ConverterPipe(data_interfaces=dict(recording=recording_interface, sorting=sorting_interface))
+        self.metadata = self.converter.get_metadata()
+
+        self.tmpdir = Path(mkdtemp())
+        self.nwbfile_path = self.tmpdir / f"ecephys_{backend}.nwb"
+
+    def teardown(self, backend: str):
+        rmtree(self.tmpdir, ignore_errors=True)
+
+    def time_run_conversion(self, backend: str):
+        self.converter.run_conversion(
+            nwbfile_path=self.nwbfile_path, metadata=self.metadata, overwrite=True, backend=backend
+        )
+
+    def peakmem_run_conversion(self, backend: str):
+        self.converter.run_conversion(
+            nwbfile_path=self.nwbfile_path, metadata=self.metadata, overwrite=True, backend=backend
+        )
+
+
+class OphysConversionSuite:
+    """Write an imaging series together with its segmentation."""
+
+    params = (["hdf5", "zarr"],)
+    param_names = ["backend"]
+    timeout = 600
+
+    def setup(self, backend: str):
+        imaging_interface = MockImagingInterface(num_frames=3_000, num_rows=256, num_columns=256)
+        segmentation_interface = MockSegmentationInterface(
+            num_rois=1_000, num_frames=3_000, num_rows=256, num_columns=256
+        )
+        self.converter = ConverterPipe(
+            data_interfaces=dict(imaging=imaging_interface, segmentation=segmentation_interface)
+        )
+        self.metadata = self.converter.get_metadata()
+
+        self.tmpdir = Path(mkdtemp())
+        self.nwbfile_path = self.tmpdir / f"ophys_{backend}.nwb"
+
+    def teardown(self, backend: str):
+        rmtree(self.tmpdir, ignore_errors=True)
+
+    def time_run_conversion(self, backend: str):
+        self.converter.run_conversion(
+            nwbfile_path=self.nwbfile_path, metadata=self.metadata, overwrite=True, backend=backend
+        )
+
+    def peakmem_run_conversion(self, backend: str):
+        self.converter.run_conversion(
+            nwbfile_path=self.nwbfile_path, metadata=self.metadata, overwrite=True, backend=backend
+        )
+
+
+class BackendConfigurationSuite:
+    """Configure the datasets of an in-memory NWBFile holding large electrodes and units tables."""
+
+    params = (["hdf5", "zarr"],)
+    param_names = ["backend"]
+    timeout = 600
+
+    def setup(self, backend: str):
+        recording_interface = MockRecordingInterface(num_channels=384, durations=(3_600.0,))
+        sorting_interface = MockSortingInterface(num_units=2_000, durations=(3_600.0,))
+        converter = ConverterPipe(data_interfaces=dict(recording=recording_interface, sorting=sorting_interface))
+
+        self.nwbfile = converter.create_nwbfile(metadata=converter.get_metadata())
+
+    def time_get_default_backend_configuration(self, backend: str):
+        get_default_backend_configuration(nwbfile=self.nwbfile, backend=backend)
+
+    def peakmem_get_default_backend_configuration(self, backend: str):
+        get_default_backend_configuration(nwbfile=self.nwbfile, backend=backend)
@@ -0,0 +1,119 @@
+"""Benchmarks of the data chunk iterators and of the TTL signal processing at production scale."""
+
+from spikeinterface.core import NumpyRecording
+
+from neuroconv.tools.roiextractors.imagingextractordatachunkiterator import (
+    ImagingExtractorDataChunkIterator,
+)
+from neuroconv.tools.signal_processing import (
+    get_rising_frames_from_ttl,
+    get_ttl_frames_from_recording,
+)
+from neuroconv.tools.spikeinterface.spikeinterfacerecordingdatachunkiterator import (
+    SpikeInterfaceRecordingDataChunkIterator,
+)
+from neuroconv.tools.spikeinterface.spikeinterfacesortingdatachunkiterator import (
+    SpikeInterfaceSortingSpikeTimesDataChunkIterator,
+)
+from neuroconv.tools.testing.mock_interfaces import (
+    MockImagingInterface,
+    MockRecordingInterface,
+    MockSortingInterface,
+)
+from neuroconv.tools.testing.mock_ttl_signals import generate_mock_ttl_signal
+
+# Iterating over every buffer of an hour-long recording would mostly time the generation of the mock traces;
+# the first buffers are enough to track the per-buffer cost of the iterators
+NUMBER_OF_BUFFERS = 10
+
+
+class RecordingDataChunkIteratorSuite:
+    """Iterate over the buffers of an hour-long recording from one or several Neuropixels probes."""
+
+    params = ([384, 1_536],)
+    param_names = ["num_channels"]
+    timeout = 600
+
+    def setup(self, num_channels: int):
+        self.recording = MockRecordingInterface(num_channels=num_channels, durations=(3_600.0,)).recording_extractor
+
+    def time_initialize_iterator(self, num_channels: int):
+        SpikeInterfaceRecordingDataChunkIterator(recording=self.recording)
+
+    def time_iterate_buffers(self, num_channels: int):
+        iterator = SpikeInterfaceRecordingDataChunkIterator(recording=self.recording, buffer_gb=0.1)
+        for _, _ in zip(range(NUMBER_OF_BUFFERS), iterator):
+            pass
+
+    def peakmem_iterate_buffers(self, num_channels: int):
+        iterator = SpikeInterfaceRecordingDataChunkIterator(recording=self.recording, buffer_gb=0.1)
+        for _, _ in zip(range(NUMBER_OF_BUFFERS), iterator):
+            pass
+
+
+class SortingSpikeTimesDataChunkIteratorSuite:
+    """Iterate over the flattened spike times of an hour-long sorting."""
+
+    params = ([1_000],)
+    param_names = ["num_units"]
+    timeout = 600
+
+    def setup(self, num_units: int):
+        self.sorting = MockSortingInterface(num_units=num_units, durations=(3_600.0,)).sorting_extractor
+
+    def time_iterate_spike_times(self, num_units: int):
+        for _ in SpikeInterfaceSortingSpikeTimesDataChunkIterator(sorting=self.sorting):
+            pass
+
+    def peakmem_iterate_spike_times(self, num_units: int):
+        for _ in SpikeInterfaceSortingSpikeTimesDataChunkIterator(sorting=self.sorting):
+            pass
+
+
+class ImagingDataChunkIteratorSuite:
+    """Iterate over the buffers of a two-photon imaging series."""
+
+    params = ([(512, 512)],)
+    param_names = ["frame_shape"]
+    timeout = 600
+
+    def setup(self, frame_shape: tuple[int, int]):
+        num_rows, num_columns = frame_shape
+        self.imaging = MockImagingInterface(
+            num_frames=2_000, num_rows=num_rows, num_columns=num_columns
+        ).imaging_extractor
+
+    def time_iterate_buffers(self, frame_shape: tuple[int, int]):
+        for _ in ImagingExtractorDataChunkIterator(imaging_extractor=self.imaging, buffer_gb=0.1):
+            pass
+
+    def peakmem_iterate_buffers(self, frame_shape: tuple[int, int]):
+        for _ in ImagingExtractorDataChunkIterator(imaging_extractor=self.imaging, buffer_gb=0.1):
+            pass
+
+
+class TTLSignalSuite:
+    """Detect the rising edges of an hour-long TTL signal sampled by a NIDQ board."""
+
+    params = ([600.0, 3_600.0],)
+    param_names = ["signal_duration"]
+    timeout = 600
+
+    def setup(self, signal_duration: float):
+        ttl_times = [float(time) for time in range(1, int(signal_duration) - 1, 2)]
+        self.ttl_signal = generate_mock_ttl_signal(
+            signal_duration=signal_duration, ttl_times=ttl_times, ttl_duration=0.5, sampling_frequency_hz=25_000.0
+        )
+        self.recording = NumpyRecording(traces_list=[self.ttl_signal[:, None]], sampling_frequency=25_000.0)
+
+    def time_get_rising_frames_from_ttl(self, signal_duration: float):
+        get_rising_frames_from_ttl(trace=self.ttl_signal)
+
+    def peakmem_get_rising_frames_from_ttl(self, signal_duration: float):
+        get_rising_frames_from_ttl(trace=self.ttl_signal)
+
+    def time_get_ttl_frames_from_recording(self, signal_duration: float):
+        get_ttl_frames_from_recording(recording=self.recording, channel_ids=self.recording.get_channel_ids())
+
+    def peakmem_get_ttl_frames_from_recording(self, signal_duration: float):
+        get_ttl_frames_from_recording(recording=self.recording, channel_ids=self.recording.get_channel_ids())
@@ -0,0 +1,125 @@
+"""Benchmarks of the construction of the electrodes, units, time intervals and plane segmentation tables."""
+
+from pathlib import Path
+from shutil import rmtree
+from tempfile import mkdtemp
+
+import numpy as np
+import pandas as pd
+from pynwb.testing.mock.file import mock_NWBFile
+
+from neuroconv.datainterfaces import CsvTimeIntervalsInterface
+from neuroconv.tools.roiextractors import add_plane_segmentation_to_nwbfile
+from neuroconv.tools.spikeinterface import (
+    add_electrodes_to_nwbfile,
+    add_sorting_to_nwbfile,
+)
+from neuroconv.tools.testing.mock_interfaces import (
+    MockRecordingInterface,
+    MockSegmentationInterface,
+    MockSortingInterface,
+)
+
+
+class ElectrodesTableSuite:
+    """Add the electrodes of one or several probes to the electrodes table."""
+
+    params = ([384, 1_536, 6_144],)
+    param_names = ["num_channels"]
+
+    def setup(self, num_channels: int):
+        self.recording = MockRecordingInterface(num_channels=num_channels, durations=(1.0,)).recording_extractor
+        self.recording.set_property(key="brain_area", values=["CA1"] * num_channels)
+
+    def time_add_electrodes_to_nwbfile(self, num_channels: int):
+        add_electrodes_to_nwbfile(recording=self.recording, nwbfile=mock_NWBFile())
+
+    def peakmem_add_electrodes_to_nwbfile(self, num_channels: int):
+        add_electrodes_to_nwbfile(recording=self.recording, nwbfile=mock_NWBFile())
+
+    def time_append_electrodes_to_existing_table(self, num_channels: int):
+        nwbfile = mock_NWBFile()
+        add_electrodes_to_nwbfile(recording=self.recording, nwbfile=nwbfile)
+
+        renamed_channel_ids = [f"{channel_id}_second_probe" for channel_id in self.recording.get_channel_ids()]
+        second_recording = self.recording.rename_channels(new_channel_ids=renamed_channel_ids)
+        add_electrodes_to_nwbfile(recording=second_recording, nwbfile=nwbfile)
+
+
+class UnitsTableSuite:
+    """Add the units of an hour-long sorting to the units table."""
+
+    params = ([100, 1_000, 5_000],)
+    param_names = ["num_units"]
+    timeout = 600
+
+    def setup(self, num_units: int):
+        self.sorting = MockSortingInterface(num_units=num_units, durations=(3_600.0,)).sorting_extractor
+        self.sorting.set_property(key="quality", values=["good"] * num_units)
+
+    def time_add_sorting_to_nwbfile(self, num_units: int):
+        add_sorting_to_nwbfile(sorting=self.sorting, nwbfile=mock_NWBFile())
+
+    def peakmem_add_sorting_to_nwbfile(self, num_units: int):
+        add_sorting_to_nwbfile(sorting=self.sorting, nwbfile=mock_NWBFile())
+
+
+class TimeIntervalsTableSuite:
+    """Add the events of a CSV file with up to a million rows, such as licks or frame-level epochs, as time intervals."""
+
+    params = ([10_000, 1_000_000],)
+    param_names = ["num_rows"]
+    timeout = 600
+
+    def setup(self, num_rows: int):
+        random_number_generator = np.random.default_rng(seed=0)
+        start_times = np.cumsum(random_number_generator.exponential(scale=0.1, size=num_rows))
+        dataframe = pd.DataFrame(
+            dict(
+                start_time=start_times,
+                stop_time=start_times + 0.05,
+                lick_number=np.arange(num_rows),
+                spout=random_number_generator.choice(["left", "right"], size=num_rows),
+                rewarded=random_number_generator.random(size=num_rows) > 0.5,
+            )
+        )
+
+        self.tmpdir = Path(mkdtemp())
+        self.file_path = self.tmpdir / "licks.csv"
+        dataframe.to_csv(self.file_path, index=False)
+
+    def teardown(self, num_rows: int):
+        rmtree(self.tmpdir, ignore_errors=True)
+
+    def time_add_time_intervals_from_csv(self, num_rows: int):
+        interface = CsvTimeIntervalsInterface(file_path=self.file_path)
+        interface.add_to_nwbfile(nwbfile=mock_NWBFile())
+
+    def peakmem_add_time_intervals_from_csv(self, num_rows: int):
+        interface = CsvTimeIntervalsInterface(file_path=self.file_path)
+        interface.add_to_nwbfile(nwbfile=mock_NWBFile())
+
+
+class PlaneSegmentationTableSuite:
+    """Add the image masks of the ROIs of a segmentation to a plane segmentation table."""
+
+    params = ([100, 1_000],)
+    param_names = ["num_rois"]
+    timeout = 600
+
+    def setup(self, num_rois: int):
+        segmentation_interface = MockSegmentationInterface(
+            num_rois=num_rois, num_frames=10, num_rows=128, num_columns=128
+        )
+        self.segmentation_extractor = segmentation_interface.segmentation_extractor
+        self.metadata = segmentation_interface.get_metadata()
+
+    def time_add_plane_segmentation_to_nwbfile(self, num_rois: int):
+        add_plane_segmentation_to_nwbfile(
+            segmentation_extractor=self.segmentation_extractor, nwbfile=mock_NWBFile(), metadata=self.metadata
+        )
+
+    def peakmem_add_plane_segmentation_to_nwbfile(self, num_rois: int):
+        add_plane_segmentation_to_nwbfile(
+            segmentation_extractor=self.segmentation_extractor, nwbfile=mock_NWBFile(), metadata=self.metadata
+        )
@@ -3,4 +3,17 @@ from .baseextractorinterface import BaseExtractorInterface
 from .basetemporalalignmentinterface import BaseTemporalAlignmentInterface
 from .nwbconverter import ConverterPipe, NWBConverter
 from .tools import get_format_summaries
-from .tools.yaml_conversion_specification import run_conversion_from_yaml
+
+
+def __getattr__(name: str):
+    # The YAML runner is imported on first access since most sessions (and workers) never use it
+    if name == "run_conversion_from_yaml":
+        from .tools.yaml_conversion_specification import run_conversion_from_yaml
+
+        return run_conversion_from_yaml
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | {"run_conversion_from_yaml"})
@@ -5,7 +5,6 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Literal
 
-from jsonschema.validators import validate
 from pydantic import FilePath, validate_call
 from pynwb import NWBFile
 
@@ -26,7 +25,11 @@ from .utils import (
     load_dict_from_file,
 )
 from .utils.dict import DeepDict
-from .utils.json_schema import _NWBMetaDataEncoder, _NWBSourceDataEncoder
+from .utils.json_schema import (
+    _NWBMetaDataEncoder,
+    _NWBSourceDataEncoder,
+    _validate_against_schema,
+)
 
 
 class BaseDataInterface(ABC):
@@ -62,7 +65,7 @@ class BaseDataInterface(ABC):
         serialized_source_data = encoder.encode(source_data)
         decoded_source_data = json.loads(serialized_source_data)
         source_schema = self.get_source_schema()
-        validate(instance=decoded_source_data, schema=source_schema)
+        _validate_against_schema(instance=decoded_source_data, schema=source_schema)
         if verbose:
             print("Source data is valid!")
 
@@ -116,7 +119,7 @@ class BaseDataInterface(ABC):
             nwbfile_schema = metdata_schema["properties"]["NWBFile"]
             nwbfile_schema.pop("required", None)
 
-        validate(instance=decoded_metadata, schema=metdata_schema)
+        _validate_against_schema(instance=decoded_metadata, schema=metdata_schema)
 
     def get_conversion_options_schema(self) -> dict:
         """
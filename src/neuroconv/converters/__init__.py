@@ -4,24 +4,35 @@ Converters are easy-to-use all-in-one classes for handling multi-stream data.
 They are collections of particular data interfaces that commonly occur together (such as AP/LF bands of SpikeGLX
 or one photon and behavior videos of Miniscope), yet the objects behave just as a normal interfaces do (multiple
 converters can still be combined into a parent converter for a dataset).
+
+As for the data interfaces, the converters are imported lazily on first access, keyed by their class name.
 """
 
-from ..datainterfaces.behavior.lightningpose.lightningposeconverter import (
-    LightningPoseConverter,
-)
-from ..datainterfaces.ecephys.sortedrecordinginterface import SortedRecordingConverter
-from ..datainterfaces.ecephys.spikeglx.spikeglxconverter import SpikeGLXConverterPipe
-from ..datainterfaces.ophys.brukertiff.brukertiffconverter import (
-    BrukerTiffMultiPlaneConverter,
-    BrukerTiffSinglePlaneConverter,
-)
-from ..datainterfaces.ophys.miniscope.miniscopeconverter import MiniscopeConverter
-
-converter_list = [
-    LightningPoseConverter,
-    SpikeGLXConverterPipe,
-    BrukerTiffMultiPlaneConverter,
-    BrukerTiffSinglePlaneConverter,
-    MiniscopeConverter,
-    SortedRecordingConverter,
-]
+from importlib import import_module as _import_module
+
+_CONVERTER_MODULES = {
+    "LightningPoseConverter": "..datainterfaces.behavior.lightningpose.lightningposeconverter",
+    "SpikeGLXConverterPipe": "..datainterfaces.ecephys.spikeglx.spikeglxconverter",
+    "BrukerTiffMultiPlaneConverter": "..datainterfaces.ophys.brukertiff.brukertiffconverter",
+    "BrukerTiffSinglePlaneConverter": "..datainterfaces.ophys.brukertiff.brukertiffconverter",
+    "MiniscopeConverter": "..datainterfaces.ophys.miniscope.miniscopeconverter",
+    "SortedRecordingConverter": "..datainterfaces.ecephys.sortedrecordinginterface",
+}
+
+
+def __getattr__(name: str):
+    if name in _CONVERTER_MODULES:
+        module = _import_module(name=_CONVERTER_MODULES[name], package=__name__)
+        value = getattr(module, name)
+    elif name == "converter_list":
+        value = [__getattr__(converter_name) for converter_name in _CONVERTER_MODULES]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache the attribute on the module so that later accesses do not go through this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_CONVERTER_MODULES) | {"converter_list"})
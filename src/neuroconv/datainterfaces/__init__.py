@@ -1,235 +1,240 @@
-# Behavior
-from .behavior.audio.audiointerface import AudioInterface
-from .behavior.deeplabcut.deeplabcutdatainterface import DeepLabCutInterface
-from .behavior.fictrac.fictracdatainterface import FicTracDataInterface
-from .behavior.lightningpose.lightningposedatainterface import (
-    LightningPoseDataInterface,
-)
-from .behavior.medpc.medpcdatainterface import MedPCInterface
-from .behavior.miniscope.miniscopedatainterface import MiniscopeBehaviorInterface
-from .behavior.neuralynx.neuralynx_nvt_interface import NeuralynxNvtInterface
-from .behavior.sleap.sleapdatainterface import SLEAPInterface
-from .behavior.video.videodatainterface import VideoInterface
-from .behavior.video.externalvideointerface import ExternalVideoInterface
-from .behavior.video.internalvideointerface import InternalVideoInterface
+"""
+Data interfaces for every supported format.
 
-# Ecephys
-from .ecephys.alphaomega.alphaomegadatainterface import AlphaOmegaRecordingInterface
-from .ecephys.axona.axonadatainterface import (
-    AxonaLFPDataInterface,
-    AxonaPositionDataInterface,
-    AxonaRecordingInterface,
-    AxonaUnitRecordingInterface,
-)
-from .ecephys.biocam.biocamdatainterface import BiocamRecordingInterface
-from .ecephys.blackrock.blackrockdatainterface import (
-    BlackrockRecordingInterface,
-    BlackrockSortingInterface,
-)
-from .ecephys.cellexplorer.cellexplorerdatainterface import (
-    CellExplorerLFPInterface,
-    CellExplorerRecordingInterface,
-    CellExplorerSortingInterface,
-)
-from .ecephys.edf.edfdatainterface import EDFRecordingInterface
-from .ecephys.intan.intandatainterface import IntanRecordingInterface
-from .ecephys.kilosort.kilosortdatainterface import KiloSortSortingInterface
-from .ecephys.maxwell.maxonedatainterface import MaxOneRecordingInterface
-from .ecephys.mcsraw.mcsrawdatainterface import MCSRawRecordingInterface
-from .ecephys.mearec.mearecdatainterface import MEArecRecordingInterface
-from .ecephys.neuralynx.neuralynxdatainterface import (
-    NeuralynxRecordingInterface,
-    NeuralynxSortingInterface,
-)
-from .ecephys.neuroscope.neuroscopedatainterface import (
-    NeuroScopeLFPInterface,
-    NeuroScopeRecordingInterface,
-    NeuroScopeSortingInterface,
-)
-from .ecephys.openephys.openephybinarysanaloginterface import OpenEphysBinaryAnalogInterface
-from .ecephys.openephys.openephysbinarydatainterface import (
-    OpenEphysBinaryRecordingInterface,
-)
-from .ecephys.openephys.openephysdatainterface import OpenEphysRecordingInterface
-from .ecephys.openephys.openephyslegacydatainterface import (
-    OpenEphysLegacyRecordingInterface,
-)
-from .ecephys.openephys.openephyssortingdatainterface import OpenEphysSortingInterface
-from .ecephys.phy.phydatainterface import PhySortingInterface
-from .ecephys.plexon.plexondatainterface import (
-    Plexon2RecordingInterface,
-    PlexonRecordingInterface,
-    PlexonLFPInterface,
-    PlexonSortingInterface,
-)
-from .ecephys.spike2.spike2datainterface import Spike2RecordingInterface
-from .ecephys.spikegadgets.spikegadgetsdatainterface import (
-    SpikeGadgetsRecordingInterface,
-)
-from .ecephys.spikeglx.spikeglxdatainterface import SpikeGLXRecordingInterface
-from .ecephys.spikeglx.spikeglxnidqinterface import SpikeGLXNIDQInterface
-from .ecephys.tdt.tdtdatainterface import TdtRecordingInterface
-from .ecephys.whitematter.whitematterdatainterface import WhiteMatterRecordingInterface
+The interfaces are imported lazily on first access, keyed by their class name, so that importing one interface does not
+import the modules (and third-party dependencies) of all the others.
+"""
 
-# Icephys
-from .icephys.abf.abfdatainterface import AbfInterface
+from importlib import import_module as _import_module
 
-# Ophys
-from .ophys.brukertiff.brukertiffdatainterface import (
-    BrukerTiffMultiPlaneImagingInterface,
-    BrukerTiffSinglePlaneImagingInterface,
-)
-from .ophys.caiman.caimandatainterface import CaimanSegmentationInterface
-from .ophys.cnmfe.cnmfedatainterface import CnmfeSegmentationInterface
-from .ophys.extract.extractdatainterface import ExtractSegmentationInterface
-from .ophys.hdf5.hdf5datainterface import Hdf5ImagingInterface
-from .ophys.inscopix.inscopixsegmentationdatainterface import InscopixSegmentationInterface
-from .ophys.inscopix.inscopiximagingdatainterface import InscopixImagingInterface
-from .ophys.micromanagertiff.micromanagertiffdatainterface import (
-    MicroManagerTiffImagingInterface,
-)
-from .ophys.miniscope.miniscopeimagingdatainterface import MiniscopeImagingInterface
-from .ophys.sbx.sbxdatainterface import SbxImagingInterface
-from .ophys.scanimage.scanimageimaginginterfaces import (
-    ScanImageImagingInterface,
-    ScanImageMultiFileImagingInterface,
-    ScanImageLegacyImagingInterface,
-)
-from .ophys.sima.simadatainterface import SimaSegmentationInterface
-from .ophys.suite2p.suite2pdatainterface import Suite2pSegmentationInterface
-from .ophys.tdt_fp.tdtfiberphotometrydatainterface import TDTFiberPhotometryInterface
-from .ophys.tiff.tiffdatainterface import TiffImagingInterface
-from .ophys.thor.thordatainterface import ThorImagingInterface
-
-# Image
-from .image.imageinterface import ImageInterface
-
-# Text
-from .text.csv.csvtimeintervalsinterface import CsvTimeIntervalsInterface
-from .text.excel.exceltimeintervalsinterface import ExcelTimeIntervalsInterface
+_INTERFACE_MODULES = {
+    # Behavior
+    "AudioInterface": ".behavior.audio.audiointerface",
+    "DeepLabCutInterface": ".behavior.deeplabcut.deeplabcutdatainterface",
+    "FicTracDataInterface": ".behavior.fictrac.fictracdatainterface",
+    "LightningPoseDataInterface": ".behavior.lightningpose.lightningposedatainterface",
+    "MedPCInterface": ".behavior.medpc.medpcdatainterface",
+    "MiniscopeBehaviorInterface": ".behavior.miniscope.miniscopedatainterface",
+    "NeuralynxNvtInterface": ".behavior.neuralynx.neuralynx_nvt_interface",
+    "SLEAPInterface": ".behavior.sleap.sleapdatainterface",
+    "VideoInterface": ".behavior.video.videodatainterface",
+    "ExternalVideoInterface": ".behavior.video.externalvideointerface",
+    "InternalVideoInterface": ".behavior.video.internalvideointerface",
+    # Ecephys
+    "AlphaOmegaRecordingInterface": ".ecephys.alphaomega.alphaomegadatainterface",
+    "AxonaLFPDataInterface": ".ecephys.axona.axonadatainterface",
+    "AxonaPositionDataInterface": ".ecephys.axona.axonadatainterface",
+    "AxonaRecordingInterface": ".ecephys.axona.axonadatainterface",
+    "AxonaUnitRecordingInterface": ".ecephys.axona.axonadatainterface",
+    "BiocamRecordingInterface": ".ecephys.biocam.biocamdatainterface",
+    "BlackrockRecordingInterface": ".ecephys.blackrock.blackrockdatainterface",
+    "BlackrockSortingInterface": ".ecephys.blackrock.blackrockdatainterface",
+    "CellExplorerLFPInterface": ".ecephys.cellexplorer.cellexplorerdatainterface",
+    "CellExplorerRecordingInterface": ".ecephys.cellexplorer.cellexplorerdatainterface",
+    "CellExplorerSortingInterface": ".ecephys.cellexplorer.cellexplorerdatainterface",
+    "EDFRecordingInterface": ".ecephys.edf.edfdatainterface",
+    "IntanRecordingInterface": ".ecephys.intan.intandatainterface",
+    "KiloSortSortingInterface": ".ecephys.kilosort.kilosortdatainterface",
+    "MaxOneRecordingInterface": ".ecephys.maxwell.maxonedatainterface",
+    "MCSRawRecordingInterface": ".ecephys.mcsraw.mcsrawdatainterface",
+    "MEArecRecordingInterface": ".ecephys.mearec.mearecdatainterface",
+    "NeuralynxRecordingInterface": ".ecephys.neuralynx.neuralynxdatainterface",
+    "NeuralynxSortingInterface": ".ecephys.neuralynx.neuralynxdatainterface",
+    "NeuroScopeLFPInterface": ".ecephys.neuroscope.neuroscopedatainterface",
+    "NeuroScopeRecordingInterface": ".ecephys.neuroscope.neuroscopedatainterface",
+    "NeuroScopeSortingInterface": ".ecephys.neuroscope.neuroscopedatainterface",
+    "OpenEphysBinaryAnalogInterface": ".ecephys.openephys.openephybinarysanaloginterface",
+    "OpenEphysBinaryRecordingInterface": ".ecephys.openephys.openephysbinarydatainterface",
+    "OpenEphysRecordingInterface": ".ecephys.openephys.openephysdatainterface",
+    "OpenEphysLegacyRecordingInterface": ".ecephys.openephys.openephyslegacydatainterface",
+    "OpenEphysSortingInterface": ".ecephys.openephys.openephyssortingdatainterface",
+    "PhySortingInterface": ".ecephys.phy.phydatainterface",
+    "Plexon2RecordingInterface": ".ecephys.plexon.plexondatainterface",
+    "PlexonRecordingInterface": ".ecephys.plexon.plexondatainterface",
+    "PlexonLFPInterface": ".ecephys.plexon.plexondatainterface",
+    "PlexonSortingInterface": ".ecephys.plexon.plexondatainterface",
+    "Spike2RecordingInterface": ".ecephys.spike2.spike2datainterface",
+    "SpikeGadgetsRecordingInterface": ".ecephys.spikegadgets.spikegadgetsdatainterface",
+    "SpikeGLXRecordingInterface": ".ecephys.spikeglx.spikeglxdatainterface",
+    "SpikeGLXNIDQInterface": ".ecephys.spikeglx.spikeglxnidqinterface",
+    "TdtRecordingInterface": ".ecephys.tdt.tdtdatainterface",
+    "WhiteMatterRecordingInterface": ".ecephys.whitematter.whitematterdatainterface",
+    # Icephys
+    "AbfInterface": ".icephys.abf.abfdatainterface",
+    # Ophys
+    "BrukerTiffMultiPlaneImagingInterface": ".ophys.brukertiff.brukertiffdatainterface",
+    "BrukerTiffSinglePlaneImagingInterface": ".ophys.brukertiff.brukertiffdatainterface",
+    "CaimanSegmentationInterface": ".ophys.caiman.caimandatainterface",
+    "CnmfeSegmentationInterface": ".ophys.cnmfe.cnmfedatainterface",
+    "ExtractSegmentationInterface": ".ophys.extract.extractdatainterface",
+    "Hdf5ImagingInterface": ".ophys.hdf5.hdf5datainterface",
+    "InscopixSegmentationInterface": ".ophys.inscopix.inscopixsegmentationdatainterface",
+    "InscopixImagingInterface": ".ophys.inscopix.inscopiximagingdatainterface",
+    "MicroManagerTiffImagingInterface": ".ophys.micromanagertiff.micromanagertiffdatainterface",
+    "MiniscopeImagingInterface": ".ophys.miniscope.miniscopeimagingdatainterface",
+    "SbxImagingInterface": ".ophys.sbx.sbxdatainterface",
+    "ScanImageImagingInterface": ".ophys.scanimage.scanimageimaginginterfaces",
+    "ScanImageMultiFileImagingInterface": ".ophys.scanimage.scanimageimaginginterfaces",
+    "ScanImageLegacyImagingInterface": ".ophys.scanimage.scanimageimaginginterfaces",
+    "SimaSegmentationInterface": ".ophys.sima.simadatainterface",
+    "Suite2pSegmentationInterface": ".ophys.suite2p.suite2pdatainterface",
+    "TDTFiberPhotometryInterface": ".ophys.tdt_fp.tdtfiberphotometrydatainterface",
+    "TiffImagingInterface": ".ophys.tiff.tiffdatainterface",
+    "ThorImagingInterface": ".ophys.thor.thordatainterface",
+    # Image
+    "ImageInterface": ".image.imageinterface",
+    # Text
+    "CsvTimeIntervalsInterface": ".text.csv.csvtimeintervalsinterface",
+    "ExcelTimeIntervalsInterface": ".text.excel.exceltimeintervalsinterface",
+}
 
-interface_list = [
+_INTERFACE_NAMES = [
     # Ecephys
-    NeuralynxRecordingInterface,
-    NeuralynxSortingInterface,
-    NeuroScopeRecordingInterface,
-    NeuroScopeSortingInterface,
-    NeuroScopeLFPInterface,
-    Spike2RecordingInterface,
-    SpikeGLXRecordingInterface,
-    SpikeGLXNIDQInterface,
-    SpikeGadgetsRecordingInterface,
-    IntanRecordingInterface,
-    CellExplorerSortingInterface,
-    CellExplorerRecordingInterface,
-    CellExplorerLFPInterface,
-    BlackrockRecordingInterface,
-    BlackrockSortingInterface,
-    OpenEphysRecordingInterface,
-    OpenEphysBinaryRecordingInterface,
-    OpenEphysLegacyRecordingInterface,
-    OpenEphysSortingInterface,
-    OpenEphysBinaryAnalogInterface,
-    PhySortingInterface,
-    KiloSortSortingInterface,
-    AxonaRecordingInterface,
-    AxonaPositionDataInterface,
-    AxonaLFPDataInterface,
-    AxonaUnitRecordingInterface,
-    EDFRecordingInterface,
-    TdtRecordingInterface,
-    PlexonRecordingInterface,
-    PlexonLFPInterface,
-    Plexon2RecordingInterface,
-    PlexonSortingInterface,
-    BiocamRecordingInterface,
-    AlphaOmegaRecordingInterface,
-    MEArecRecordingInterface,
-    MCSRawRecordingInterface,
-    MaxOneRecordingInterface,
-    WhiteMatterRecordingInterface,
+    "NeuralynxRecordingInterface",
+    "NeuralynxSortingInterface",
+    "NeuroScopeRecordingInterface",
+    "NeuroScopeSortingInterface",
+    "NeuroScopeLFPInterface",
+    "Spike2RecordingInterface",
+    "SpikeGLXRecordingInterface",
+    "SpikeGLXNIDQInterface",
+    "SpikeGadgetsRecordingInterface",
+    "IntanRecordingInterface",
+    "CellExplorerSortingInterface",
+    "CellExplorerRecordingInterface",
+    "CellExplorerLFPInterface",
+    "BlackrockRecordingInterface",
+    "BlackrockSortingInterface",
+    "OpenEphysRecordingInterface",
+    "OpenEphysBinaryRecordingInterface",
+    "OpenEphysLegacyRecordingInterface",
+    "OpenEphysSortingInterface",
+    "OpenEphysBinaryAnalogInterface",
+    "PhySortingInterface",
+    "KiloSortSortingInterface",
+    "AxonaRecordingInterface",
+    "AxonaPositionDataInterface",
+    "AxonaLFPDataInterface",
+    "AxonaUnitRecordingInterface",
+    "EDFRecordingInterface",
+    "TdtRecordingInterface",
+    "PlexonRecordingInterface",
+    "PlexonLFPInterface",
+    "Plexon2RecordingInterface",
+    "PlexonSortingInterface",
+    "BiocamRecordingInterface",
+    "AlphaOmegaRecordingInterface",
+    "MEArecRecordingInterface",
+    "MCSRawRecordingInterface",
+    "MaxOneRecordingInterface",
+    "WhiteMatterRecordingInterface",
     # Icephys
-    AbfInterface,
+    "AbfInterface",
     # Ophys
-    CaimanSegmentationInterface,
-    CnmfeSegmentationInterface,
-    ExtractSegmentationInterface,
-    InscopixSegmentationInterface,
-    SimaSegmentationInterface,
-    Suite2pSegmentationInterface,
-    SbxImagingInterface,
-    TiffImagingInterface,
-    Hdf5ImagingInterface,
-    InscopixImagingInterface,
-    ScanImageImagingInterface,
-    ScanImageLegacyImagingInterface,
-    ScanImageMultiFileImagingInterface,
-    BrukerTiffMultiPlaneImagingInterface,
-    BrukerTiffSinglePlaneImagingInterface,
-    MicroManagerTiffImagingInterface,
-    MiniscopeImagingInterface,
-    TDTFiberPhotometryInterface,
-    ThorImagingInterface,
+    "CaimanSegmentationInterface",
+    "CnmfeSegmentationInterface",
+    "ExtractSegmentationInterface",
+    "InscopixSegmentationInterface",
+    "SimaSegmentationInterface",
+    "Suite2pSegmentationInterface",
+    "SbxImagingInterface",
+    "TiffImagingInterface",
+    "Hdf5ImagingInterface",
+    "InscopixImagingInterface",
+    "ScanImageImagingInterface",
+    "ScanImageLegacyImagingInterface",
+    "ScanImageMultiFileImagingInterface",
+    "BrukerTiffMultiPlaneImagingInterface",
+    "BrukerTiffSinglePlaneImagingInterface",
+    "MicroManagerTiffImagingInterface",
+    "MiniscopeImagingInterface",
+    "TDTFiberPhotometryInterface",
+    "ThorImagingInterface",
     # Behavior
-    VideoInterface,
-    ExternalVideoInterface,
-    InternalVideoInterface,
-    AudioInterface,
-    DeepLabCutInterface,
-    SLEAPInterface,
-    MiniscopeBehaviorInterface,
-    FicTracDataInterface,
-    NeuralynxNvtInterface,
-    LightningPoseDataInterface,
-    MedPCInterface,
+    "VideoInterface",
+    "ExternalVideoInterface",
+    "InternalVideoInterface",
+    "AudioInterface",
+    "DeepLabCutInterface",
+    "SLEAPInterface",
+    "MiniscopeBehaviorInterface",
+    "FicTracDataInterface",
+    "NeuralynxNvtInterface",
+    "LightningPoseDataInterface",
+    "MedPCInterface",
     # Text
-    CsvTimeIntervalsInterface,
-    ExcelTimeIntervalsInterface,
+    "CsvTimeIntervalsInterface",
+    "ExcelTimeIntervalsInterface",
     # Image
-    ImageInterface,
+    "ImageInterface",
 ]
 
-interfaces_by_category = dict(
-    ecephys={
-        interface.__name__.replace("RecordingInterface", ""): interface  # TODO: use removesuffix when 3.8 is dropped
-        for interface in interface_list
-        if "Recording" in interface.__name__
-    },
-    sorting={
-        interface.__name__.replace("SortingInterface", ""): interface
-        for interface in interface_list
-        if "Sorting" in interface.__name__
-    },
-    imaging={
-        interface.__name__.replace("ImagingInterface", ""): interface
-        for interface in interface_list
-        if "Imaging" in interface.__name__
-    },
-    segmentation={
-        interface.__name__.replace("SegmentationInterface", ""): interface
-        for interface in interface_list
-        if "Segmentation" in interface.__name__
-    },
-    fiber_photometry={"TDTFiberPhotometry": TDTFiberPhotometryInterface},
-    analog=dict(
-        OpenEphysAnalog=OpenEphysBinaryAnalogInterface,
-        SpikeGLXNIDQ=SpikeGLXNIDQInterface,
-    ),
-    icephys=dict(Abf=AbfInterface),
-    behavior=dict(
-        Video=VideoInterface,
-        ExternalVideo=ExternalVideoInterface,
-        InternalVideo=InternalVideoInterface,
-        DeepLabCut=DeepLabCutInterface,
-        SLEAP=SLEAPInterface,
-        FicTrac=FicTracDataInterface,
-        LightningPose=LightningPoseDataInterface,
-        # Text
-        CsvTimeIntervals=CsvTimeIntervalsInterface,
-        ExcelTimeIntervals=ExcelTimeIntervalsInterface,
-        MedPC=MedPCInterface,
-    ),
-    image=dict(
-        Image=ImageInterface,
-    ),
-)
+
+def _get_interfaces_by_category() -> dict:
+    interface_list = [__getattr__(name) for name in _INTERFACE_NAMES]
+    return dict(
+        ecephys={
+            interface.__name__.replace(
+                "RecordingInterface", ""
+            ): interface  # TODO: use removesuffix when 3.8 is dropped
+            for interface in interface_list
+            if "Recording" in interface.__name__
+        },
+        sorting={
+            interface.__name__.replace("SortingInterface", ""): interface
+            for interface in interface_list
+            if "Sorting" in interface.__name__
+        },
+        imaging={
+            interface.__name__.replace("ImagingInterface", ""): interface
+            for interface in interface_list
+            if "Imaging" in interface.__name__
+        },
+        segmentation={
+            interface.__name__.replace("SegmentationInterface", ""): interface
+            for interface in interface_list
+            if "Segmentation" in interface.__name__
+        },
+        fiber_photometry={"TDTFiberPhotometry": __getattr__("TDTFiberPhotometryInterface")},
+        analog=dict(
+            OpenEphysAnalog=__getattr__("OpenEphysBinaryAnalogInterface"),
+            SpikeGLXNIDQ=__getattr__("SpikeGLXNIDQInterface"),
+        ),
+        icephys=dict(Abf=__getattr__("AbfInterface")),
+        behavior=dict(
+            Video=__getattr__("VideoInterface"),
+            ExternalVideo=__getattr__("ExternalVideoInterface"),
+            InternalVideo=__getattr__("InternalVideoInterface"),
+            DeepLabCut=__getattr__("DeepLabCutInterface"),
+            SLEAP=__getattr__("SLEAPInterface"),
+            FicTrac=__getattr__("FicTracDataInterface"),
+            LightningPose=__getattr__("LightningPoseDataInterface"),
+            # Text
+            CsvTimeIntervals=__getattr__("CsvTimeIntervalsInterface"),
+            ExcelTimeIntervals=__getattr__("ExcelTimeIntervalsInterface"),
+            MedPC=__getattr__("MedPCInterface"),
+        ),
+        image=dict(
+            Image=__getattr__("ImageInterface"),
+        ),
+    )
+
+
+def __getattr__(name: str):
+    if name in _INTERFACE_MODULES:
+        module = _import_module(name=_INTERFACE_MODULES[name], package=__name__)
+        value = getattr(module, name)
+    elif name == "interface_list":
+        value = [__getattr__(interface_name) for interface_name in _INTERFACE_NAMES]
+    elif name == "interfaces_by_category":
+        value = _get_interfaces_by_category()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache the attribute on the module so that later accesses do not go through this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_INTERFACE_MODULES) | {"interface_list", "interfaces_by_category"})
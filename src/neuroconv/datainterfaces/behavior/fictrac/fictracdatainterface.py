@@ -10,6 +10,8 @@ from pynwb.file import NWBFile
 
 from ....basetemporalalignmentinterface import BaseTemporalAlignmentInterface
 from ....tools import get_module
+from ....tools.hdmf import SliceableDataChunkIterator
+from ....tools.metadata_cache import get_cached_metadata
 from ....utils import DeepDict, calculate_regular_series_rate
 
 
@@ -191,6 +193,7 @@ class FicTracDataInterface(BaseTemporalAlignmentInterface):
 
         self._timestamps = None
         self._starting_time = None
+        self._column_data = None
 
     def get_metadata(self) -> DeepDict:
         metadata = super().get_metadata()
@@ -217,9 +220,7 @@ class FicTracDataInterface(BaseTemporalAlignmentInterface):
         metadata: dict, optional
             metadata info for constructing the nwb file.
         """
-        import pandas as pd
-
-        fictrac_data_df = pd.read_csv(self.file_path, sep=",", header=None, names=self.columns_in_dat_file)
+        column_data = self._get_column_data()
 
         # Get the timestamps
         timestamps = self.get_timestamps()
@@ -248,8 +249,12 @@ class FicTracDataInterface(BaseTemporalAlignmentInterface):
             if self.configuration_metadata is not None:
                 spatial_series_kwargs["comments"] = comments
 
+            # The columns of each spatial series are adjacent in the .dat file, so this is a view of the parsed data
             column_in_dat_file = data_dict["column_in_dat_file"]
-            data = fictrac_data_df[column_in_dat_file].to_numpy()
+            first_column = self._column_names_to_read.index(column_in_dat_file[0])
+            data = SliceableDataChunkIterator(
+                data=column_data[:, first_column : first_column + len(column_in_dat_file)]
+            )
             if self.radius is not None:
                 spatial_series_kwargs["conversion"] = self.radius
                 units = "meters"
@@ -309,11 +314,21 @@ class FicTracDataInterface(BaseTemporalAlignmentInterface):
         https://github.com/rjdmoore/fictrac/issues/29
         """
 
-        import pandas as pd
+        def read_timestamps_column() -> np.ndarray:
+            # The timestamps are among the columns parsed for the spatial series, so they are not read again
+            if self._column_data is not None:
+                timestamps_name = self.columns_in_dat_file[self.timestamps_column]
+                return self._column_data[:, self._column_names_to_read.index(timestamps_name)].copy()
 
-        fictrac_data_df = pd.read_csv(self.file_path, sep=",", header=None, usecols=[self.timestamps_column])
+            return read_fictrac_columns(file_path=self.file_path, column_indices=[self.timestamps_column])[:, 0]
 
-        timestamps = fictrac_data_df[self.timestamps_column].values / 1000.0  # Transform to seconds
+        timestamps = get_cached_metadata(
+            name="FicTracTimestamps",
+            source_paths=[self.file_path],
+            compute=read_timestamps_column,
+            parameters=dict(timestamps_column=self.timestamps_column),
+        )
+        timestamps = timestamps / 1000.0  # Transform to seconds
 
         # Correct for the case when only the first timestamp was replaced by system time
         first_difference = timestamps[1] - timestamps[0]
@@ -330,6 +345,23 @@ class FicTracDataInterface(BaseTemporalAlignmentInterface):
 
         return timestamps
 
+    @property
+    def _column_names_to_read(self) -> list[str]:
+        """The columns of the spatial series and the timestamps, in the order of the .dat file."""
+        column_names = [self.columns_in_dat_file[self.timestamps_column]]
+        for data_dict in self.column_to_nwb_mapping.values():
+            column_names.extend(data_dict["column_in_dat_file"])
+
+        return sorted(set(column_names), key=self.columns_in_dat_file.index)
+
+    def _get_column_data(self) -> np.ndarray:
+        """Parse the columns to read from the .dat file once, and keep them for later calls."""
+        if self._column_data is None:
+            column_indices = [self.columns_in_dat_file.index(name) for name in self._column_names_to_read]
+            self._column_data = read_fictrac_columns(file_path=self.file_path, column_indices=column_indices)
+
+        return self._column_data
+
     def get_timestamps(self):
         timestamps = self._timestamps if self._timestamps is not None else self.get_original_timestamps()
         if self._starting_time is not None:
@@ -344,6 +376,53 @@ class FicTracDataInterface(BaseTemporalAlignmentInterface):
         self._starting_time = aligned_starting_time
 
 
+def read_fictrac_columns(file_path: FilePath, column_indices: list[int], chunk_size: int = 100_000) -> np.ndarray:
+    """
+    Read a subset of the columns of a FicTrac .dat file in a single pass.
+
+    The rows are parsed in chunks and only the requested columns are converted to numbers, which are written into a
+    single preallocated array. The memory used is then that of the returned array plus one chunk, instead of a
+    DataFrame of every column of the file.
+
+    Parameters
+    ----------
+    file_path : FilePath
+        Path to the FicTrac .dat file.
+    column_indices : list of int
+        The indices of the columns to read.
+    chunk_size : int, default: 100_000
+        The number of rows parsed at a time.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (number of frames, number of columns) with the columns in the order of `column_indices`.
+        The array is in Fortran order, so that each column is contiguous in memory.
+    """
+    import pandas as pd
+
+    # Count the line breaks to preallocate the array; blank lines are skipped when parsing, so this is an upper bound
+    number_of_lines = 0
+    last_byte = b""
+    with open(file_path, "rb") as file:
+        while block := file.read(2**24):
+            number_of_lines += block.count(b"\n")
+            last_byte = block[-1:]
+    if last_byte not in (b"", b"\n"):
+        number_of_lines += 1
+
+    data = np.empty(shape=(number_of_lines, len(column_indices)), dtype="float64", order="F")
+    number_of_rows = 0
+    with pd.read_csv(
+        file_path, sep=",", header=None, usecols=column_indices, dtype="float64", chunksize=chunk_size
+    ) as chunk_reader:
+        for chunk in chunk_reader:
+            data[number_of_rows : number_of_rows + len(chunk)] = chunk[column_indices].to_numpy()
+            number_of_rows += len(chunk)
+
+    return data[:number_of_rows]
+
+
 def extract_session_start_time(
     file_path: FilePath,
     configuration_file_path: FilePath | None = None,
@@ -77,9 +77,8 @@ class LightningPoseConverter(NWBConverter):
         return conversion_options_schema
 
     def get_metadata(self) -> DeepDict:
-        metadata = self.data_interface_objects["PoseEstimation"].get_metadata()
-        original_video_interface = self.data_interface_objects["OriginalVideo"]
-        original_videos_metadata = original_video_interface.get_metadata()
+        metadata = self._get_interface_metadata(interface_name="PoseEstimation")
+        original_videos_metadata = self._get_interface_metadata(interface_name="OriginalVideo")
         metadata = dict_deep_update(metadata, original_videos_metadata)
 
         original_videos_metadata["Behavior"]["Videos"][0].update(
@@ -88,8 +87,7 @@ class LightningPoseConverter(NWBConverter):
         )
 
         if "LabeledVideo" in self.data_interface_objects:
-            labeled_video_interface = self.data_interface_objects["LabeledVideo"]
-            labeled_videos_metadata = labeled_video_interface.get_metadata()
+            labeled_videos_metadata = self._get_interface_metadata(interface_name="LabeledVideo")
             labeled_videos_metadata["Behavior"]["Videos"][0].update(
                 name=self.labeled_video_name,
                 description="The video recorded by camera with the pose estimation labels.",
@@ -220,27 +218,29 @@ class LightningPoseConverter(NWBConverter):
             If True, only a subset of the data will be added for testing purposes, by default False.
 
         """
-        if metadata is None:
-            metadata = self.get_metadata()
+        with self._cache_interface_metadata():
+            if metadata is None:
+                metadata = self.get_metadata()
 
-        self.validate_metadata(metadata=metadata)
+            self.validate_metadata(metadata=metadata)
 
-        self.temporally_align_data_interfaces()
+            self.temporally_align_data_interfaces()
+            self._invalidate_interface_metadata_cache()
 
-        with make_or_load_nwbfile(
-            nwbfile_path=nwbfile_path,
-            nwbfile=nwbfile,
-            metadata=metadata,
-            overwrite=overwrite,
-            verbose=self.verbose,
-        ) as nwbfile_out:
-            self.add_to_nwbfile(
-                nwbfile=nwbfile_out,
+            with make_or_load_nwbfile(
+                nwbfile_path=nwbfile_path,
+                nwbfile=nwbfile,
                 metadata=metadata,
-                reference_frame=reference_frame,
-                confidence_definition=confidence_definition,
-                external_mode=external_mode,
-                starting_frames_original_videos=starting_frames_original_videos,
-                starting_frames_labeled_videos=starting_frames_labeled_videos,
-                stub_test=stub_test,
-            )
+                overwrite=overwrite,
+                verbose=self.verbose,
+            ) as nwbfile_out:
+                self.add_to_nwbfile(
+                    nwbfile=nwbfile_out,
+                    metadata=metadata,
+                    reference_frame=reference_frame,
+                    confidence_definition=confidence_definition,
+                    external_mode=external_mode,
+                    starting_frames_original_videos=starting_frames_original_videos,
+                    starting_frames_labeled_videos=starting_frames_labeled_videos,
+                    stub_test=stub_test,
+                )
@@ -6,6 +6,8 @@ from ....tools import get_package
 def extract_timestamps(video_file_path: FilePath) -> list:
     """Extract the timestamps using pyav
 
+    The presentation timestamps are read from the packets of the container, without decoding the frames.
+
     Parameters
     ----------
     video_file_path : FilePath
@@ -16,10 +18,12 @@ def extract_timestamps(video_file_path: FilePath) -> list:
     list
         The timestamps
     """
-    av = get_package(package_name="av")
+    from ..video.video_utils import _get_cached_video_timestamps
+
+    get_package(package_name="av")
 
-    with av.open(str(video_file_path)) as container:
-        stream = container.streams.video[0]
-        timestamps = [frame.time for frame in container.decode(stream)]
+    timestamps = _get_cached_video_timestamps(
+        file_path=video_file_path, display_progress=False, relative_to_stream_start=False
+    )
 
-    return timestamps
+    return timestamps.tolist()
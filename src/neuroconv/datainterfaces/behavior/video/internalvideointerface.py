@@ -210,6 +210,7 @@ class InternalVideoInterface(BaseDataInterface):
         parent_container: Literal["acquisition", "processing/behavior"] = "acquisition",
         module_description: str | None = None,
         always_write_timestamps: bool = False,
+        iterator_options: dict | None = None,
     ):
         """
         Convert the video data files to :py:class:`~pynwb.image.ImageSeries` and write them in the
@@ -266,6 +267,9 @@ class InternalVideoInterface(BaseDataInterface):
             By default (False), the function checks if timestamps are available, and if not, uses starting_time and rate.
             If set to True, timestamps will be written explicitly, regardless of whether they were set directly or need
             to be retrieved from the video file.
+        iterator_options : dict, optional
+            Options passed to the :py:class:`~neuroconv.datainterfaces.behavior.video.video_utils.VideoDataChunkIterator`
+            when buffer_data is True, such as ``number_of_jobs`` to decode the video in parallel worker processes.
         """
         if parent_container not in {"acquisition", "processing/behavior"}:
             raise ValueError(
@@ -306,6 +310,7 @@ class InternalVideoInterface(BaseDataInterface):
             data_iterator = VideoDataChunkIterator(
                 video_file=file_path,
                 stub_test=stub_test,
+                **(iterator_options or dict()),
             )
             image_series_kwargs.update(data=data_iterator)
 
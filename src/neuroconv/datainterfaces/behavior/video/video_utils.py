@@ -1,19 +1,44 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
 import numpy as np
+import psutil
 from pydantic import FilePath
 from tqdm import tqdm
 
 from neuroconv.tools.hdmf import GenericDataChunkIterator
+from neuroconv.tools.importing import is_package_installed
 from neuroconv.tools.iterative_write import (
     get_image_series_buffer_shape,
     get_image_series_chunk_shape,
 )
+from neuroconv.tools.metadata_cache import get_cached_metadata
 
 from ....tools import get_package
 
+# Packets are demuxed in decoding order; with B-frames, the presentation order only differs within a small window
+_MAXIMUM_FRAME_REORDERING_DEPTH = 16
+
+# Timestamps extracted during this session, keyed by the resolved file path, its modification time and size; only the
+# most recent extractions are kept, the metadata cache being the one that persists them
+_VIDEO_TIMESTAMPS_CACHE: dict[tuple, np.ndarray] = dict()
+_MAXIMUM_NUMBER_OF_CACHED_VIDEO_TIMESTAMPS = 32
+
+# Capture handles of the current worker process when decoding in parallel, keyed by file path, along with the index of
+# the frame each of them has last grabbed
+_DECODER_CAPTURES: dict[str, list] = dict()
 
-def get_video_timestamps(file_path: FilePath, max_frames: int | None = None, display_progress: bool = True) -> list:
+
+def get_video_timestamps(
+    file_path: FilePath, max_frames: int | None = None, display_progress: bool = True
+) -> np.ndarray:
     """Extract the timestamps of the video located in file_path
 
+    The presentation timestamps are read from the packets of the container without decoding the frames when PyAV is
+    installed; otherwise, OpenCV grabs each frame without converting it. The most recent results are kept for the
+    session and persisted in the metadata cache when it is enabled (see `neuroconv.tools.metadata_cache`).
+
     Parameters
     ----------
     file_path : Path or str
@@ -25,14 +50,253 @@ def get_video_timestamps(file_path: FilePath, max_frames: int | None = None, dis
 
     Returns
     -------
-    list
-        The timestamps of the video.
+    numpy.ndarray
+        The timestamps of the video, in seconds from the start of the video stream.
+    """
+    return _get_cached_video_timestamps(
+        file_path=file_path, max_frames=max_frames, display_progress=display_progress, relative_to_stream_start=True
+    )
+
+
+def _get_cached_video_timestamps(
+    file_path: FilePath,
+    max_frames: int | None = None,
+    display_progress: bool = True,
+    relative_to_stream_start: bool = True,
+) -> np.ndarray:
+    """
+    Shared backend for the extraction of video timestamps, picking the fastest available library.
+
+    Timestamps relative to the start of the stream are what OpenCV reports with `CAP_PROP_POS_MSEC`; absolute
+    timestamps are the presentation times of the frames as reported by PyAV, which they require.
+    """
+    file_path = Path(file_path).resolve()
+    file_stat = file_path.stat()
+    cache_key = (str(file_path), file_stat.st_mtime_ns, file_stat.st_size, max_frames, relative_to_stream_start)
+
+    if cache_key not in _VIDEO_TIMESTAMPS_CACHE:
+
+        def extract_timestamps() -> np.ndarray:
+            timestamps = None
+            if not relative_to_stream_start or is_package_installed(package_name="av"):
+                timestamps = _get_video_timestamps_from_packets(
+                    file_path=str(file_path),
+                    max_frames=max_frames,
+                    display_progress=display_progress,
+                    relative_to_stream_start=relative_to_stream_start,
+                )
+            if timestamps is None and not relative_to_stream_start:
+                # OpenCV only reports timestamps relative to the start of the stream, so PyAV decodes the frames
+                timestamps = _get_video_timestamps_from_decoded_frames(
+                    file_path=str(file_path), max_frames=max_frames, display_progress=display_progress
+                )
+            if timestamps is None:
+                timestamps = _get_video_timestamps_from_grabbed_frames(
+                    file_path=str(file_path), max_frames=max_frames, display_progress=display_progress
+                )
+            return timestamps
+
+        if len(_VIDEO_TIMESTAMPS_CACHE) >= _MAXIMUM_NUMBER_OF_CACHED_VIDEO_TIMESTAMPS:
+            oldest_cache_key = next(iter(_VIDEO_TIMESTAMPS_CACHE))
+            del _VIDEO_TIMESTAMPS_CACHE[oldest_cache_key]
+        _VIDEO_TIMESTAMPS_CACHE[cache_key] = get_cached_metadata(
+            name="VideoTimestamps",
+            source_paths=[file_path],
+            compute=extract_timestamps,
+            parameters=dict(max_frames=max_frames, relative_to_stream_start=relative_to_stream_start),
+        )
+
+    return _VIDEO_TIMESTAMPS_CACHE[cache_key].copy()
+
+
+def _get_video_timestamps_from_packets(
+    file_path: str,
+    max_frames: int | None = None,
+    display_progress: bool = True,
+    relative_to_stream_start: bool = True,
+) -> np.ndarray | None:
+    """
+    Read the presentation timestamps of the first video stream from the packets of the container, without decoding.
+
+    Returns None if any packet lacks a presentation timestamp, which only the decoder can infer.
+    """
+    av = get_package(package_name="av", installation_instructions="pip install av")
+
+    with av.open(file_path) as container:
+        stream = container.streams.video[0]
+        maximum_number_of_packets = None if max_frames is None else max_frames + _MAXIMUM_FRAME_REORDERING_DEPTH
+
+        presentation_timestamps = []
+        packets = container.demux(stream)
+        if display_progress:
+            packets = tqdm(packets, total=stream.frames or None, desc="retrieving timestamps")
+        for packet in packets:
+            if packet.size == 0:  # Empty packet used to flush the decoder at the end of the stream
+                continue
+            if packet.pts is None:
+                return None
+
+            presentation_timestamps.append(packet.pts)
+            if maximum_number_of_packets is not None and len(presentation_timestamps) >= maximum_number_of_packets:
+                break
+
+        presentation_timestamps = np.sort(np.asarray(presentation_timestamps, dtype="int64"))[:max_frames]
+        if relative_to_stream_start:
+            presentation_timestamps -= stream.start_time or 0
+
+        return presentation_timestamps * float(stream.time_base)
+
+
+def _get_video_timestamps_from_decoded_frames(
+    file_path: str, max_frames: int | None = None, display_progress: bool = True
+) -> np.ndarray:
+    """
+    Read the presentation timestamps of the first video stream by decoding its frames with PyAV.
+
+    Used when some packets lack a presentation timestamp, which the decoder then infers. The timestamps are in seconds
+    on the time base of the container, that is, not relative to the start of the stream.
+    """
+    av = get_package(package_name="av", installation_instructions="pip install av")
+
+    with av.open(file_path) as container:
+        stream = container.streams.video[0]
+
+        presentation_timestamps = []
+        frames = container.decode(stream)
+        if display_progress:
+            frames = tqdm(frames, total=max_frames or stream.frames or None, desc="retrieving timestamps")
+        for frame in frames:
+            if frame.pts is None:
+                message = (
+                    f"The presentation timestamp of frame {len(presentation_timestamps)} of the video '{file_path}' "
+                    "could not be determined, neither from the packets of the container nor by decoding the frames."
+                )
+                raise ValueError(message)
+
+            presentation_timestamps.append(frame.pts)
+            if max_frames is not None and len(presentation_timestamps) >= max_frames:
+                break
+
+        return np.asarray(presentation_timestamps, dtype="int64") * float(stream.time_base)
+
+
+def _get_video_timestamps_from_grabbed_frames(
+    file_path: str, max_frames: int | None = None, display_progress: bool = True
+) -> np.ndarray:
+    """Read the timestamps of a video with OpenCV, grabbing each frame without retrieving (converting) it."""
+    cv2 = get_package(package_name="cv2", installation_instructions="pip install opencv-python-headless")
+
+    video_capture = cv2.VideoCapture(file_path)
+    total_frames = int(video_capture.get(cv2.CAP_PROP_FRAME_COUNT))
+    frames_to_extract = min(total_frames, max_frames) if max_frames else total_frames
+
+    iterator = (
+        tqdm(range(frames_to_extract), desc="retrieving timestamps") if display_progress else range(frames_to_extract)
+    )
+    timestamps = []
+    for _ in iterator:
+        success = video_capture.grab()
+        if not success:
+            break
+        timestamps.append(video_capture.get(cv2.CAP_PROP_POS_MSEC))
+    video_capture.release()
+
+    return np.array(timestamps) / 1000
+
+
+def _get_video_keyframes(file_path: str) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+    Locate the keyframes of the first video stream from the packets of the container, without decoding the frames.
+
+    Returns the indices of the keyframes in presentation order along with their timestamps in seconds from the start
+    of the stream, or None if PyAV is not installed or if any packet lacks a presentation timestamp.
+    """
+    if not is_package_installed(package_name="av"):
+        return None
+    av = get_package(package_name="av", installation_instructions="pip install av")
+
+    with av.open(file_path) as container:
+        stream = container.streams.video[0]
+        presentation_timestamps = []
+        keyframe_presentation_timestamps = []
+        for packet in container.demux(stream):
+            if packet.size == 0:  # Empty packet used to flush the decoder at the end of the stream
+                continue
+            if packet.pts is None:
+                return None
+
+            presentation_timestamps.append(packet.pts)
+            if packet.is_keyframe:
+                keyframe_presentation_timestamps.append(packet.pts)
+
+        presentation_timestamps = np.sort(np.asarray(presentation_timestamps, dtype="int64"))
+        keyframe_presentation_timestamps = np.sort(np.asarray(keyframe_presentation_timestamps, dtype="int64"))
+        keyframe_indices = np.searchsorted(presentation_timestamps, keyframe_presentation_timestamps)
+        keyframe_timestamps = (keyframe_presentation_timestamps - (stream.start_time or 0)) * float(stream.time_base)
+
+        return keyframe_indices, keyframe_timestamps
+
+
+def _open_decoder_capture(file_path: str, keyframe_index: int = 0, keyframe_timestamp: float | None = None) -> list:
+    """
+    Open a capture positioned on a keyframe, returned along with the index of the frame it has grabbed (-1 if none).
+
+    Seeking to a keyframe does not decode any of the frames before it. The timestamp of the grabbed keyframe is checked
+    against the one read from the packets; if the seek landed elsewhere, the capture starts over from the first frame.
+    """
+    cv2 = get_package(package_name="cv2", installation_instructions="pip install opencv-python-headless")
+
+    video_capture = cv2.VideoCapture(file_path)
+    if keyframe_index > 0:
+        video_capture.set(cv2.CAP_PROP_POS_FRAMES, keyframe_index)
+        if video_capture.grab() and np.isclose(
+            video_capture.get(cv2.CAP_PROP_POS_MSEC) / 1000, keyframe_timestamp, rtol=0.0, atol=1e-3
+        ):
+            return [video_capture, keyframe_index]
+
+        video_capture.release()
+        video_capture = cv2.VideoCapture(file_path)
+
+    return [video_capture, -1]
+
+
+def _decode_video_frames(
+    file_path: str,
+    start_frame: int,
+    end_frame: int,
+    keyframe_index: int = 0,
+    keyframe_timestamp: float | None = None,
+) -> np.ndarray:
     """
+    Decode the frames [start_frame, end_frame) of a video in RGB colorspace, in a worker process.
+
+    Each worker keeps its capture handle open across calls, so that a contiguous range of frames is decoded from start
+    to end. The capture is opened on the keyframe at `keyframe_index`, which precedes `start_frame`, and the frames
+    in between are grabbed without being retrieved (converted); without a keyframe, it starts from the first frame.
+    """
+    if file_path not in _DECODER_CAPTURES or _DECODER_CAPTURES[file_path][1] >= start_frame:
+        if file_path in _DECODER_CAPTURES:
+            _DECODER_CAPTURES.pop(file_path)[0].release()
+        _DECODER_CAPTURES[file_path] = _open_decoder_capture(
+            file_path=file_path, keyframe_index=keyframe_index, keyframe_timestamp=keyframe_timestamp
+        )
+    video_capture, grabbed_frame = _DECODER_CAPTURES[file_path]
 
-    with VideoCaptureContext(str(file_path)) as video_context:
-        timestamps = video_context.get_video_timestamps(max_frames=max_frames, display_progress=display_progress)
+    frames = []
+    for frame_number in range(start_frame, end_frame):
+        success = True
+        while success and grabbed_frame < frame_number:
+            success = video_capture.grab()
+            grabbed_frame += 1
+        if success:
+            success, frame = video_capture.retrieve()
+        if not success:
+            _DECODER_CAPTURES.pop(file_path)[0].release()
+            raise ValueError(f"Could not read frame {frame_number} of the video '{file_path}'.")
+        frames.append(np.flip(frame, 2))  # np.flip to re-order color channels to RGB
+    _DECODER_CAPTURES[file_path][1] = grabbed_frame
 
-    return timestamps
+    return np.stack(frames)
 
 
 class VideoCaptureContext:
@@ -45,6 +309,7 @@ class VideoCaptureContext:
         self.file_path = file_path
         self._current_frame = 0
         self._frame_count = None
+        self._frame_properties = None
         self._video_open_msg = "The video file is not open!"
 
     def get_video_timestamps(self, max_frames: int | None = None, display_progress: bool = True):
@@ -62,27 +327,16 @@ class VideoCaptureContext:
         -------
         numpy.ndarray
             Array of timestamps in seconds, representing the time from the start
-            of the video for each frame. Timestamps are extracted from the video's
-            metadata using cv2.CAP_PROP_POS_MSEC and converted from milliseconds
-            to seconds.
+            of the video for each frame. Timestamps are the presentation timestamps
+            of the frames, read from the packets of the container without decoding
+            when PyAV is installed, or with cv2.CAP_PROP_POS_MSEC otherwise.
         """
-        cv2 = get_package(package_name="cv2", installation_instructions="pip install opencv-python-headless")
-
-        timestamps = []
         total_frames = self.get_video_frame_count()
         frames_to_extract = min(total_frames, max_frames) if max_frames else total_frames
 
-        iterator = (
-            tqdm(range(frames_to_extract), desc="retrieving timestamps")
-            if display_progress
-            else range(frames_to_extract)
+        return get_video_timestamps(
+            file_path=self.file_path, max_frames=frames_to_extract, display_progress=display_progress
         )
-        for _ in iterator:
-            success, _ = self.vc.read()
-            if not success:
-                break
-            timestamps.append(self.vc.get(cv2.CAP_PROP_POS_MSEC))
-        return np.array(timestamps) / 1000
 
     def get_video_fps(self) -> int:
         """
@@ -106,9 +360,30 @@ class VideoCaptureContext:
         Tuple
             The shape of the video frames (height, width, channels).
         """
-        frame = self.get_video_frame(0)
-        if frame is not None:
-            return frame.shape
+        frame_properties = self._get_frame_properties()
+        if frame_properties is not None:
+            return frame_properties[0]
+
+    def _get_frame_properties(self) -> tuple[tuple, np.dtype] | None:
+        """
+        Decode the first frame once to get both the shape and the dtype of the frames, caching them on disk.
+
+        Returns None if the first frame cannot be decoded.
+        """
+        if self._frame_properties is None:
+
+            def decode_frame_properties() -> dict | None:
+                frame = self.get_video_frame(0)
+                if frame is not None:
+                    return dict(shape=list(frame.shape), dtype=frame.dtype.str)
+
+            frame_properties = get_cached_metadata(
+                name="VideoFrameProperties", source_paths=[self.file_path], compute=decode_frame_properties
+            )
+            if frame_properties is not None:
+                self._frame_properties = (tuple(frame_properties["shape"]), np.dtype(frame_properties["dtype"]))
+
+        return self._frame_properties
 
     @property
     def frame_count(self):
@@ -207,9 +482,9 @@ class VideoCaptureContext:
         numpy.dtype
             The data type of the video frames.
         """
-        frame = self.get_video_frame(0)
-        if frame is not None:
-            return frame.dtype
+        frame_properties = self._get_frame_properties()
+        if frame_properties is not None:
+            return frame_properties[1]
 
     def release(self):
         self.vc.release()
@@ -260,7 +535,50 @@ class VideoDataChunkIterator(GenericDataChunkIterator):
         progress_bar_class: tqdm | None = None,
         progress_bar_options: dict | None = None,
         stub_test: bool = False,
+        prefetch_buffers: int = 0,
+        number_of_jobs: int = 1,
     ):
+        """
+        Iterate over the frames of a video in buffers, in RGB colorspace.
+
+        Parameters
+        ----------
+        video_file : FilePath
+            The path to the video file.
+        buffer_gb : float, optional
+            The upper bound on the size of each buffer in gigabytes; the default is 1.0.
+        buffer_shape : tuple, optional
+            Manual specification of the buffer shape, which takes precedence over buffer_gb.
+        chunk_mb : float, optional
+            The upper bound on the size of each chunk in megabytes; the default is 10.0.
+        chunk_shape : tuple, optional
+            Manual specification of the chunk shape, which takes precedence over chunk_mb.
+        display_progress : bool, default: False
+            Whether to display a progress bar over the buffers.
+        progress_bar_class : tqdm, optional
+            The progress bar class to use.
+        progress_bar_options : dict, optional
+            Options passed to the progress bar.
+        stub_test : bool, default: False
+            If True, only iterate over the first 10 frames.
+        prefetch_buffers : int, default: 0
+            The number of buffers to read ahead on a background thread.
+        number_of_jobs : int, default: 1
+            The number of worker processes decoding the video concurrently. The buffers are split into as many
+            contiguous ranges of frames, each decoded from start to end by a worker holding its own capture handle,
+            and the iterator alternates between the ranges; since every buffer carries its selection, the written
+            dataset is the same. When PyAV is installed, each worker starts decoding from the keyframe preceding its
+            range, located from the packets of the container; otherwise, it decodes from the first frame of the video,
+            skipping the frames before its range without converting them. At most `number_of_jobs + 1` buffers are
+            held in memory. Negative values are counted from the number of CPUs, so that -1 uses all of them. The
+            default of 1 decodes the frames sequentially with a single capture.
+        """
+        number_of_cpus = psutil.cpu_count()
+        self.number_of_jobs = number_of_jobs if number_of_jobs > 0 else number_of_cpus + 1 + number_of_jobs
+        assert self.number_of_jobs > 0, f"number_of_jobs ({number_of_jobs}) must select at least one CPU!"
+        self._decoder_executors = None
+        self._pending_buffers = dict()
+
         self.video_capture_ob = VideoCaptureContext(video_file)
         if stub_test:
             self.video_capture_ob.frame_count = 10
@@ -287,8 +605,19 @@ class VideoDataChunkIterator(GenericDataChunkIterator):
             display_progress=display_progress,
             progress_bar_class=progress_bar_class,
             progress_bar_options=progress_bar_options,
+            prefetch_buffers=prefetch_buffers,
         )
 
+        if self.number_of_jobs > 1:
+            buffer_start_frames = range(0, self._num_samples, self.buffer_shape[0])
+            self._worker_buffer_start_frames = [
+                worker_buffer_start_frames.tolist()
+                for worker_buffer_start_frames in np.array_split(buffer_start_frames, self.number_of_jobs)
+                if len(worker_buffer_start_frames) > 0
+            ]
+            self._worker_keyframes = self._get_worker_keyframes()
+            self.buffer_selection_generator = self._get_interleaved_buffer_selection_generator()
+
     def _get_default_chunk_shape(self, chunk_mb):
         """This is how the data is chunked for reading."""
 
@@ -324,12 +653,117 @@ class VideoDataChunkIterator(GenericDataChunkIterator):
         start_frame = selection[0].start
         end_frame = selection[0].stop
 
+        if self.number_of_jobs > 1:
+            return self._get_data_in_parallel(start_frame=start_frame, end_frame=end_frame)
+
         shape = (end_frame - start_frame, *self._maxshape[1:])
         frames = np.empty(shape=shape, dtype=self._dtype)
         for frame_number in range(end_frame - start_frame):
             frames[frame_number] = next(self.video_capture_ob)
         return frames
 
+    def _get_interleaved_buffer_selection_generator(self) -> Iterator[tuple[slice, ...]]:
+        """Alternate between the ranges of the workers, so that all of them decode their next buffer concurrently."""
+        frame_selection = tuple(slice(0, axis_length) for axis_length in self.maxshape[1:])
+        number_of_rounds = max(len(start_frames) for start_frames in self._worker_buffer_start_frames)
+        for round_index in range(number_of_rounds):
+            for worker_buffer_start_frames in self._worker_buffer_start_frames:
+                if round_index < len(worker_buffer_start_frames):
+                    start_frame = worker_buffer_start_frames[round_index]
+                    end_frame = min(start_frame + self.buffer_shape[0], self._num_samples)
+                    yield (slice(start_frame, end_frame), *frame_selection)
+
+    def _get_worker_keyframes(self) -> list[tuple[int, float | None]]:
+        """Find the last keyframe at or before the range of each worker, along with its timestamp."""
+        keyframes = _get_video_keyframes(file_path=str(self.video_capture_ob.file_path))
+        if keyframes is None:
+            return [(0, None)] * len(self._worker_buffer_start_frames)
+
+        keyframe_indices, keyframe_timestamps = keyframes
+        worker_keyframes = []
+        for worker_buffer_start_frames in self._worker_buffer_start_frames:
+            keyframe_position = int(np.searchsorted(keyframe_indices, worker_buffer_start_frames[0], side="right")) - 1
+            if keyframe_position < 0:
+                worker_keyframes.append((0, None))
+            else:
+                keyframe_index = int(keyframe_indices[keyframe_position])
+                worker_keyframes.append((keyframe_index, float(keyframe_timestamps[keyframe_position])))
+
+        return worker_keyframes
+
+    def _submit_buffer(self, worker_index: int, start_frame: int, end_frame: int) -> None:
+        """Queue the decoding of a buffer on a worker, in pieces of one chunk so that results are transferred in parts."""
+        file_path = str(self.video_capture_ob.file_path)
+        keyframe_index, keyframe_timestamp = self._worker_keyframes[worker_index]
+        self._pending_buffers[start_frame] = [
+            (
+                piece_start_frame,
+                self._decoder_executors[worker_index].submit(
+                    _decode_video_frames,
+                    file_path=file_path,
+                    start_frame=piece_start_frame,
+                    end_frame=min(piece_start_frame + self.chunk_shape[0], end_frame),
+                    keyframe_index=keyframe_index,
+                    keyframe_timestamp=keyframe_timestamp,
+                ),
+            )
+            for piece_start_frame in range(start_frame, end_frame, self.chunk_shape[0])
+        ]
+
+    def _get_data_in_parallel(self, start_frame: int, end_frame: int) -> np.ndarray:
+        # A single process per worker executes its tasks in order, so each capture reads its range from start to end
+        if self._decoder_executors is None:
+            self._decoder_executors = [
+                ProcessPoolExecutor(max_workers=1) for _ in range(len(self._worker_buffer_start_frames))
+            ]
+            for worker_index, worker_buffer_start_frames in enumerate(self._worker_buffer_start_frames):
+                first_start_frame = worker_buffer_start_frames[0]
+                first_end_frame = min(first_start_frame + self.buffer_shape[0], self._num_samples)
+                self._submit_buffer(worker_index=worker_index, start_frame=first_start_frame, end_frame=first_end_frame)
+
+        worker_first_frames = [
+            worker_buffer_start_frames[0] for worker_buffer_start_frames in self._worker_buffer_start_frames
+        ]
+        worker_index = int(np.searchsorted(worker_first_frames, start_frame, side="right")) - 1
+        if start_frame not in self._pending_buffers:
+            self._submit_buffer(worker_index=worker_index, start_frame=start_frame, end_frame=end_frame)
+
+        # Keep the worker busy with its next buffer while this one is collected
+        next_start_frame = start_frame + self.buffer_shape[0]
+        if next_start_frame in self._worker_buffer_start_frames[worker_index]:
+            if next_start_frame not in self._pending_buffers:
+                next_end_frame = min(next_start_frame + self.buffer_shape[0], self._num_samples)
+                self._submit_buffer(worker_index=worker_index, start_frame=next_start_frame, end_frame=next_end_frame)
+
+        frames = np.empty(shape=(end_frame - start_frame, *self._maxshape[1:]), dtype=self._dtype)
+        try:
+            for piece_start_frame, future in self._pending_buffers.pop(start_frame):
+                piece_frames = future.result()
+                offset = piece_start_frame - start_frame
+                frames[offset : offset + len(piece_frames)] = piece_frames
+        except Exception:
+            self._shutdown_decoder()
+            raise
+
+        if not self._pending_buffers:
+            self._shutdown_decoder()
+
+        return frames
+
+    def _shutdown_decoder(self) -> None:
+        """Release the worker processes used for parallel decoding."""
+        self._pending_buffers.clear()
+        if self._decoder_executors is not None:
+            for decoder_executor in self._decoder_executors:
+                decoder_executor.shutdown(wait=True, cancel_futures=True)
+            self._decoder_executors = None
+
+    def __del__(self):
+        # Attributes may be missing if initialization failed
+        for decoder_executor in getattr(self, "_decoder_executors", None) or []:
+            decoder_executor.shutdown(wait=False, cancel_futures=True)
+        super().__del__()
+
     def _get_dtype(self) -> np.dtype:
         return self._dtype
 
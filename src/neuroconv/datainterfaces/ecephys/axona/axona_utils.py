@@ -1,4 +1,5 @@
 import os
+import re
 from pathlib import Path
 
 import dateutil
@@ -55,7 +56,7 @@ def read_eeg_file_lfp_data(file_path: FilePath) -> np.memmap:
         filename=file_path,
         dtype=lfp_dtype,
         mode="r",
-        offset=len(get_header_bstring(file_path)),
+        offset=header_size,
         shape=(1, num_bytes),
     )
 
@@ -76,23 +77,99 @@ def get_all_file_paths(file_path: FilePath) -> list:
     Returns
     -------
     list
-        List of file paths for all .eeg or .egf files found in the same directory
-        as the input file path.
+        List of file names for all .eeg or .egf files found in the same directory
+        as the input file path, ordered by session and channel number (`.eeg`, `.eeg2`, ..., `.eeg16`).
     """
 
     suffix = Path(file_path).suffix[0:4]
     current_path = Path(file_path).parent
 
-    path_list = [cur_path.name for cur_path in current_path.rglob("*" + suffix + "*")]
+    # The first channel has no number in its suffix, the others are numbered from 2
+    channel_suffix_pattern = re.compile(re.escape(suffix) + r"(\d*)")
+    channel_numbers = dict()
+    for cur_path in current_path.iterdir():
+        suffix_match = channel_suffix_pattern.fullmatch(cur_path.suffix)
+        if suffix_match is not None and cur_path.is_file():
+            channel_numbers[cur_path.name] = int(suffix_match.group(1) or 1)
+
+    path_list = sorted(channel_numbers, key=lambda name: (Path(name).stem, channel_numbers[name]))
 
     return path_list
 
 
-def read_all_eeg_file_lfp_data(file_path: FilePath) -> np.ndarray:
+class AxonaLFPArray:
+    """
+    Lazy (channels x samples) view over the memory maps of the `.eeg` or `.egf` files of a session.
+
+    Each file holds a single channel, so the view selects the memory maps of the requested channels and only reads the
+    requested samples from them, instead of concatenating all of the files in memory. Selecting a single channel
+    returns a slice of its memory map without any copy.
+    """
+
+    def __init__(self, memmaps: list[np.memmap], transposed: bool = False):
+        """
+        Parameters
+        ----------
+        memmaps : list of np.memmap
+            The one-dimensional memory maps of the channels, all with the same number of samples and dtype.
+        transposed : bool, default: False
+            Whether the view is indexed as (samples x channels) instead of (channels x samples).
+        """
+        self.memmaps = memmaps
+        self.transposed = transposed
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.memmaps[0].dtype
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        shape = (len(self.memmaps), self.memmaps[0].shape[0])
+        return shape[::-1] if self.transposed else shape
+
+    @property
+    def ndim(self) -> int:
+        return 2
+
+    @property
+    def T(self) -> "AxonaLFPArray":
+        return AxonaLFPArray(memmaps=self.memmaps, transposed=not self.transposed)
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __getitem__(self, key) -> np.ndarray:
+        key = key if isinstance(key, tuple) else (key,)
+        if len(key) > 2:
+            raise IndexError(f"Too many indices for a two-dimensional array: {len(key)} were indexed.")
+        key = key + (slice(None),) * (2 - len(key))
+        channel_key, sample_key = key[::-1] if self.transposed else key
+
+        channel_indices = np.arange(len(self.memmaps))[channel_key]
+        if channel_indices.ndim == 0:
+            return self.memmaps[channel_indices][sample_key]
+
+        selected_data = [self.memmaps[channel_index][sample_key] for channel_index in channel_indices]
+        if len(selected_data) == 0:
+            selected_data = np.empty(shape=(0,) + self.memmaps[0][sample_key].shape, dtype=self.dtype)
+        else:
+            selected_data = np.stack(selected_data, axis=0)
+
+        return selected_data.T if self.transposed else selected_data
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        array = self[:, :]
+        return array if dtype is None else array.astype(dtype)
+
+
+def read_all_eeg_file_lfp_data(file_path: FilePath) -> AxonaLFPArray:
     """
     Read LFP data from all Axona `.eeg` or `.egf` files in file_path's directory.
-    E.g. if file_path='/my/directory/my_file.eeg', all .eeg channels will be conactenated
-    to a single np.array (chans x nobs). For .egf files substitute the file suffix.
+    E.g. if file_path='/my/directory/my_file.eeg', all .eeg channels will be combined
+    to a single (chans x nobs) array. For .egf files substitute the file suffix.
+
+    The data is not loaded into memory: the returned array is a lazy view over the memory maps of the files,
+    which only reads the selected channels and samples when indexed.
 
     Parameters
     ---------
@@ -101,7 +178,7 @@ def read_all_eeg_file_lfp_data(file_path: FilePath) -> np.ndarray:
 
     Returns
     -------
-    np.array (chans x obs)
+    AxonaLFPArray (chans x obs)
     """
 
     file_path_list = get_all_file_paths(file_path)
@@ -112,10 +189,13 @@ def read_all_eeg_file_lfp_data(file_path: FilePath) -> np.ndarray:
     for fname in file_path_list:
         sampling_rates.add(get_eeg_sampling_frequency(parent_path / fname))
 
-        eeg_memmaps.append(read_eeg_file_lfp_data(parent_path / fname))
+        eeg_memmaps.append(read_eeg_file_lfp_data(parent_path / fname)[0])
     assert len(sampling_rates) < 2, "File headers specify different sampling rates. Cannot combine EEG data."
+    assert (
+        len({eeg_memmap.shape for eeg_memmap in eeg_memmaps}) < 2
+    ), "Files have different numbers of samples. Cannot combine EEG data."
 
-    eeg_data = np.concatenate(eeg_memmaps, axis=0)
+    eeg_data = AxonaLFPArray(memmaps=eeg_memmaps)
 
     return eeg_data
 
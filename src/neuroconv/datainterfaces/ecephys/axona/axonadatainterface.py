@@ -1,5 +1,6 @@
 """Collection of Axona interfaces."""
 
+import numpy as np
 from pydantic import FilePath
 from pynwb import NWBFile
 
@@ -140,14 +141,17 @@ class AxonaUnitRecordingInterface(AxonaRecordingInterface):
 class AxonaLFPDataInterface(BaseLFPExtractorInterface):
     """
     Primary data interface class for converting Axona LFP data.
-    Note that this interface is not lazy and will load all data into memory.
+
+    Each `.eeg` or `.egf` file of the session is memory-mapped as a single channel, and the channels are combined
+    lazily, so that the LFP is written to NWB chunk by chunk instead of being loaded into memory.
     """
 
     display_name = "Axona LFP"
     associated_suffixes = (".bin", ".set")
     info = "Interface for Axona LFP data."
 
-    ExtractorName = "NumpyRecording"
+    ExtractorModuleName = "spikeinterface.core"
+    ExtractorName = "ChannelsAggregationRecording"
 
     @classmethod
     def get_source_schema(cls) -> dict:
@@ -159,20 +163,32 @@ class AxonaLFPDataInterface(BaseLFPExtractorInterface):
         )
 
     def _source_data_to_extractor_kwargs(self, source_data: dict) -> dict:
-
-        extractor_kwargs = source_data.copy()
-        extractor_kwargs.pop("file_path")
-        extractor_kwargs["traces_list"] = self.traces_list
-        extractor_kwargs["sampling_frequency"] = self.sampling_frequency
+        from spikeinterface.core import NumpyRecording
+
+        # One recording per channel, each wrapping a (samples x 1) view of the memory map of its file
+        recording_list = [
+            NumpyRecording(
+                traces_list=[self.lfp_data[channel_index][:, np.newaxis]],
+                sampling_frequency=self.sampling_frequency,
+            )
+            for channel_index in range(self.lfp_data.shape[0])
+        ]
+
+        extractor_kwargs = dict(
+            recording_list_or_dict=recording_list,
+            renamed_channel_ids=np.arange(self.lfp_data.shape[0]),
+        )
 
         return extractor_kwargs
 
     def __init__(self, file_path: FilePath):
-        data = read_all_eeg_file_lfp_data(file_path).T
-        self.traces_list = [data]
+        self.lfp_data = read_all_eeg_file_lfp_data(file_path)
         self.sampling_frequency = get_eeg_sampling_frequency(file_path)
         super().__init__(file_path=file_path)
 
+        # The aggregation assigns each channel to its own group, while the files do not specify any grouping
+        self.recording_extractor.delete_property("group")
+
         self.source_data = dict(file_path=file_path)
 
 
@@ -1,4 +1,5 @@
 import warnings
+from pathlib import Path
 from typing import Literal
 
 import numpy as np
@@ -7,6 +8,7 @@ from pynwb.device import Device
 from pynwb.ecephys import ElectricalSeries, ElectrodeGroup
 
 from ...baseextractorinterface import BaseExtractorInterface
+from ...tools.metadata_cache import get_cached_metadata
 from ...utils import (
     DeepDict,
     get_base_schema,
@@ -133,20 +135,35 @@ class BaseRecordingExtractorInterface(BaseExtractorInterface):
         timestamps: numpy.ndarray or list of numpy.ndarray
             The timestamps for the data stream; if the recording has multiple segments, then a list of timestamps is returned.
         """
-        new_recording = self.get_extractor()(
-            **{
-                keyword: value
-                for keyword, value in self.extractor_kwargs.items()
-                if keyword not in ["verbose", "es_key"]
-            }
+        extractor_kwargs = {
+            keyword: value for keyword, value in self.extractor_kwargs.items() if keyword not in ["verbose", "es_key"]
+        }
+
+        def read_original_timestamps() -> np.ndarray | list[np.ndarray]:
+            new_recording = self.get_extractor()(**extractor_kwargs)
+            if self._number_of_segments == 1:
+                return new_recording.get_times()
+            else:
+                return [
+                    new_recording.get_times(segment_index=segment_index)
+                    for segment_index in range(self._number_of_segments)
+                ]
+
+        # Re-initializing the IO can require parsing every file of the session; cache the result for these files
+        source_paths = [
+            Path(value)
+            for keyword, value in self.source_data.items()
+            if keyword.endswith("_path") and isinstance(value, (str, Path)) and Path(value).exists()
+        ]
+        if not source_paths:
+            return read_original_timestamps()
+
+        return get_cached_metadata(
+            name=f"{type(self).__name__}.OriginalTimestamps",
+            source_paths=source_paths,
+            compute=read_original_timestamps,
+            parameters=extractor_kwargs,
         )
-        if self._number_of_segments == 1:
-            return new_recording.get_times()
-        else:
-            return [
-                new_recording.get_times(segment_index=segment_index)
-                for segment_index in range(self._number_of_segments)
-            ]
 
     def get_timestamps(self) -> np.ndarray | list[np.ndarray]:
         """
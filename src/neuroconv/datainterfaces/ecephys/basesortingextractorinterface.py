@@ -309,6 +309,8 @@ class BaseSortingExtractorInterface(BaseExtractorInterface):
         units_name: str = "units",
         units_description: str = "Autogenerated by neuroconv.",
         unit_electrode_indices: list[list[int]] | None = None,
+        iterator_type: str | None = None,
+        iterator_opts: dict | None = None,
     ):
         """
         Primary function for converting the data in a SortingExtractor to NWB format.
@@ -336,6 +338,12 @@ class BaseSortingExtractorInterface(BaseExtractorInterface):
         unit_electrode_indices : list of lists of int, optional
             A list of lists of integers indicating the indices of the electrodes that each unit is associated with.
             The length of the list must match the number of units in the sorting extractor.
+        iterator_type : {"v2", None}, default: None
+            The type of DataChunkIterator to use for the spike times.
+            'v2' streams the spike times unit by unit when the file is written.
+            None: load the spike times of all units in memory.
+        iterator_opts : dict, optional
+            Dictionary of options for the iterator.
         """
         from ...tools.spikeinterface import add_sorting_to_nwbfile
 
@@ -374,4 +382,6 @@ class BaseSortingExtractorInterface(BaseExtractorInterface):
             units_name=units_name,
             units_description=units_description,
             unit_electrode_indices=unit_electrode_indices,
+            iterator_type=iterator_type,
+            iterator_opts=iterator_opts,
         )
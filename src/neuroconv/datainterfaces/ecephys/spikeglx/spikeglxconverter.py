@@ -13,6 +13,11 @@ class SpikeGLXConverterPipe(ConverterPipe):
     The simplest, easiest to use class for converting all SpikeGLX data in a folder.
 
     Primary conversion class for handling multiple SpikeGLX data streams.
+
+    The streams are independent datasets in the NWB file; when writing to HDF5, they can be read and compressed
+    concurrently by setting ``number_of_streams`` on the backend configuration, for example
+    ``backend_configuration = converter.get_default_backend_configuration(nwbfile=nwbfile, backend="hdf5")`` followed by
+    ``backend_configuration.number_of_streams = len(converter.data_interface_objects)``.
     """
 
     display_name = "SpikeGLX Converter"
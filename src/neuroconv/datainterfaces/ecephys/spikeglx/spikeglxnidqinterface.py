@@ -7,7 +7,7 @@ from pynwb import NWBFile
 
 from .spikeglx_utils import get_session_start_time
 from ....basedatainterface import BaseDataInterface
-from ....tools.signal_processing import get_rising_frames_from_ttl
+from ....tools.signal_processing import get_ttl_frames_from_recording
 from ....utils import (
     DeepDict,
     get_json_schema_from_method_signature,
@@ -288,12 +288,12 @@ class SpikeGLXNIDQInterface(BaseDataInterface):
         rising_times : numpy.ndarray
             The times of the rising TTL pulses.
         """
-        # TODO: consider RAM cost of these operations and implement safer buffering version
-        rising_frames = get_rising_frames_from_ttl(
-            trace=self.recording_extractor.get_traces(channel_ids=[channel_name])
+        # The channel is streamed in buffers, so neither its trace nor the timestamps are loaded entirely in memory
+        ttl_frames = get_ttl_frames_from_recording(
+            recording=self.recording_extractor, channel_ids=[channel_name], edges=("rising",)
         )
+        rising_frames = ttl_frames[channel_name]["rising"]
 
-        nidq_timestamps = self.recording_extractor.get_times()
-        rising_times = nidq_timestamps[rising_frames]
+        rising_times = self.recording_extractor.sample_index_to_time(rising_frames)
 
         return rising_times
@@ -144,6 +144,8 @@ class BaseSegmentationExtractorInterface(BaseExtractorInterface):
         mask_type: Literal["image", "pixel", "voxel"] = "image",
         plane_segmentation_name: str | None = None,
         iterator_options: dict | None = None,
+        image_mask_iterator_type: Literal["v2"] | None = None,
+        image_mask_iterator_options: dict | None = None,
     ):
         """
 
@@ -181,6 +183,13 @@ class BaseSegmentationExtractorInterface(BaseExtractorInterface):
             The name of the plane segmentation to be added.
         iterator_options : dict, optional
             The options to use when iterating over the image masks of the segmentation extractor.
+        image_mask_iterator_type : {"v2", None}, default: None
+            How the image masks are written when mask_type='image'.
+            'v2' writes them through an ImageMaskDataChunkIterator, which only holds the masks of a few ROIs in memory
+            at a time; None loads the image masks of all ROIs into memory.
+        image_mask_iterator_options : dict, optional
+            The options of the ImageMaskDataChunkIterator, such as `buffer_shape` and `chunk_shape` in the
+            (num_rois, width, height) shape of the image masks.
 
         Returns
         -------
@@ -206,4 +215,6 @@ class BaseSegmentationExtractorInterface(BaseExtractorInterface):
             mask_type=mask_type,
             plane_segmentation_name=plane_segmentation_name,
             iterator_options=iterator_options,
+            image_mask_iterator_type=image_mask_iterator_type,
+            image_mask_iterator_options=image_mask_iterator_options,
         )
@@ -149,21 +149,25 @@ class BrukerTiffMultiPlaneConverter(NWBConverter):
         stub_frames : int, optional
             The number of frames to include in the subset if `stub_test` is True, by default 100.
         """
-        if metadata is None:
-            metadata = self.get_metadata()
+        with self._cache_interface_metadata():
+            if metadata is None:
+                metadata = self.get_metadata()
 
-        self.validate_metadata(metadata=metadata)
+            self.validate_metadata(metadata=metadata)
 
-        self.temporally_align_data_interfaces()
+            self.temporally_align_data_interfaces()
+            self._invalidate_interface_metadata_cache()
 
-        with make_or_load_nwbfile(
-            nwbfile_path=nwbfile_path,
-            nwbfile=nwbfile,
-            metadata=metadata,
-            overwrite=overwrite,
-            verbose=self.verbose,
-        ) as nwbfile_out:
-            self.add_to_nwbfile(nwbfile=nwbfile_out, metadata=metadata, stub_test=stub_test, stub_frames=stub_frames)
+            with make_or_load_nwbfile(
+                nwbfile_path=nwbfile_path,
+                nwbfile=nwbfile,
+                metadata=metadata,
+                overwrite=overwrite,
+                verbose=self.verbose,
+            ) as nwbfile_out:
+                self.add_to_nwbfile(
+                    nwbfile=nwbfile_out, metadata=metadata, stub_test=stub_test, stub_frames=stub_frames
+                )
 
 
 class BrukerTiffSinglePlaneConverter(NWBConverter):
@@ -286,18 +290,22 @@ class BrukerTiffSinglePlaneConverter(NWBConverter):
         stub_frames : int, optional
             The number of frames to include in the subset if `stub_test` is True. By default 100.
         """
-        if metadata is None:
-            metadata = self.get_metadata()
+        with self._cache_interface_metadata():
+            if metadata is None:
+                metadata = self.get_metadata()
 
-        self.validate_metadata(metadata=metadata)
+            self.validate_metadata(metadata=metadata)
 
-        self.temporally_align_data_interfaces()
+            self.temporally_align_data_interfaces()
+            self._invalidate_interface_metadata_cache()
 
-        with make_or_load_nwbfile(
-            nwbfile_path=nwbfile_path,
-            nwbfile=nwbfile,
-            metadata=metadata,
-            overwrite=overwrite,
-            verbose=self.verbose,
-        ) as nwbfile_out:
-            self.add_to_nwbfile(nwbfile=nwbfile_out, metadata=metadata, stub_test=stub_test, stub_frames=stub_frames)
+            with make_or_load_nwbfile(
+                nwbfile_path=nwbfile_path,
+                nwbfile=nwbfile,
+                metadata=metadata,
+                overwrite=overwrite,
+                verbose=self.verbose,
+            ) as nwbfile_out:
+                self.add_to_nwbfile(
+                    nwbfile=nwbfile_out, metadata=metadata, stub_test=stub_test, stub_frames=stub_frames
+                )
@@ -181,6 +181,8 @@ class Suite2pSegmentationInterface(BaseSegmentationExtractorInterface):
         mask_type: str | None = "image",  # Literal["image", "pixel", "voxel"]
         plane_segmentation_name: str | None = None,
         iterator_options: dict | None = None,
+        image_mask_iterator_type: str | None = None,  # Literal["v2"]
+        image_mask_iterator_options: dict | None = None,
     ):
         """
         Add segmentation data to the specified NWBFile.
@@ -215,6 +217,13 @@ class Suite2pSegmentationInterface(BaseSegmentationExtractorInterface):
             The name of the plane segmentation object, by default None.
         iterator_options : dict, optional
             Additional options for iterating over the data, by default None.
+        image_mask_iterator_type : {"v2", None}, default: None
+            How the image masks are written when mask_type='image'.
+            'v2' writes them through an ImageMaskDataChunkIterator, which only holds the masks of a few ROIs in memory
+            at a time; None loads the image masks of all ROIs into memory.
+        image_mask_iterator_options : dict, optional
+            The options of the ImageMaskDataChunkIterator, such as `buffer_shape` and `chunk_shape` in the
+            (num_rois, width, height) shape of the image masks.
         """
         super().add_to_nwbfile(
             nwbfile=nwbfile,
@@ -226,4 +235,6 @@ class Suite2pSegmentationInterface(BaseSegmentationExtractorInterface):
             mask_type=mask_type,
             plane_segmentation_name=self.plane_segmentation_name,
             iterator_options=iterator_options,
+            image_mask_iterator_type=image_mask_iterator_type,
+            image_mask_iterator_options=image_mask_iterator_options,
         )
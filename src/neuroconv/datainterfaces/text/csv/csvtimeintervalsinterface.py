@@ -13,3 +13,8 @@ class CsvTimeIntervalsInterface(TimeIntervalsInterface):
 
     def _read_file(self, file_path: FilePath, **read_kwargs):
         return pd.read_csv(file_path, **read_kwargs)
+
+    def _read_file_in_chunks(self, file_path: FilePath, rows_per_chunk: int, **read_kwargs):
+        """Iterate over the file as consecutive dataframes of at most `rows_per_chunk` rows."""
+        with pd.read_csv(file_path, chunksize=rows_per_chunk, **read_kwargs) as reader:
+            yield from reader
@@ -1,12 +1,18 @@
 from abc import abstractmethod
 from pathlib import Path
+from typing import Iterator
 
 import numpy as np
+from hdmf.common import ElementIdentifiers, VectorData
 from pydantic import FilePath, validate_call
 from pynwb import NWBFile
+from pynwb.epoch import TimeIntervals
 
 from ...basedatainterface import BaseDataInterface
-from ...tools.text import convert_df_to_time_intervals
+from ...tools.text import (
+    TimeIntervalsColumnDataChunkIterator,
+    convert_df_to_time_intervals,
+)
 from ...utils.dict import DeepDict, load_dict_from_file
 
 
@@ -21,6 +27,7 @@ class TimeIntervalsInterface(BaseDataInterface):
         file_path: FilePath,
         read_kwargs: dict | None = None,
         verbose: bool = False,
+        rows_per_chunk: int | None = None,
     ):
         """
         Initialize the TimeIntervalsInterface.
@@ -32,14 +39,35 @@ class TimeIntervalsInterface(BaseDataInterface):
         read_kwargs : dict, optional
             Additional arguments for reading the file, by default None.
         verbose : bool, default: False
+        rows_per_chunk : int, optional
+            If specified, stream the file in chunks of this many rows instead of loading it as a dataframe.
+            The numeric columns are then written through data chunk iterators and the time alignment is applied to
+            each chunk as it is written, so the table never needs to fit in memory; columns of other types (such as
+            strings) are still loaded when writing. Only supported by interfaces that can read their file in chunks,
+            such as the CsvTimeIntervalsInterface.
         """
+        if rows_per_chunk is not None and not hasattr(self, "_read_file_in_chunks"):
+            message = f"{type(self).__name__} cannot read its file in chunks, so 'rows_per_chunk' must be None."
+            raise ValueError(message)
+        if rows_per_chunk is not None and rows_per_chunk < 1:
+            message = f"'rows_per_chunk' must be a positive integer, but received {rows_per_chunk}."
+            raise ValueError(message)
+
         read_kwargs = read_kwargs or dict()
         super().__init__(file_path=file_path)
         self.verbose = verbose
         self._read_kwargs = read_kwargs
-        self.dataframe = self._read_file(file_path, **read_kwargs)
+        self.rows_per_chunk = rows_per_chunk
         self.time_intervals = None
 
+        # Alignment operations of each timing column when streaming, applied in order to each chunk
+        self._timing_operations: dict[str, list[tuple]] = dict()
+        if rows_per_chunk is None:
+            self.dataframe = self._read_file(file_path, **read_kwargs)
+        else:
+            self.dataframe = None
+            self._number_of_rows, self._column_dtypes = self._scan_file_in_chunks()
+
     def get_metadata(self) -> DeepDict:
         metadata = super().get_metadata()
         metadata["TimeIntervals"] = dict(
@@ -85,6 +113,9 @@ class TimeIntervalsInterface(BaseDataInterface):
         if not column.endswith("_time"):
             raise ValueError("Timing columns on a TimeIntervals table need to end with '_time'!")
 
+        if self.dataframe is None:
+            return np.concatenate(list(self._read_column_chunks(column=column, aligned=False)))
+
         return self._read_file(**self.source_data, **self._read_kwargs)[column].values
 
     def get_timestamps(self, column: str) -> np.ndarray:
@@ -109,6 +140,9 @@ class TimeIntervalsInterface(BaseDataInterface):
         if not column.endswith("_time"):
             raise ValueError("Timing columns on a TimeIntervals table need to end with '_time'!")
 
+        if self.dataframe is None:
+            return np.concatenate(list(self._read_column_chunks(column=column)))
+
         return self.dataframe[column].values
 
     def set_aligned_starting_time(self, aligned_starting_time: float):
@@ -120,6 +154,12 @@ class TimeIntervalsInterface(BaseDataInterface):
         aligned_starting_time : float
             The aligned starting time to shift all timestamps by.
         """
+        if self.dataframe is None:
+            for column in self._column_dtypes:
+                if column.endswith("_time"):
+                    self._timing_operations.setdefault(column, []).append(("shift", aligned_starting_time))
+            return
+
         timing_columns = [column for column in self.dataframe.columns if column.endswith("_time")]
 
         for column in timing_columns:
@@ -148,16 +188,19 @@ class TimeIntervalsInterface(BaseDataInterface):
         if not column.endswith("_time"):
             raise ValueError("Timing columns on a TimeIntervals table need to end with '_time'!")
 
-        unaligned_timestamps = np.array(self.dataframe[column])
-        self.dataframe[column] = aligned_timestamps
+        if self.dataframe is None:
+            unaligned_timestamps = self.get_timestamps(column=column)
+            self._timing_operations[column] = [("replace", np.asarray(aligned_timestamps))]
+        else:
+            unaligned_timestamps = np.array(self.dataframe[column])
+            self.dataframe[column] = aligned_timestamps
 
         if not interpolate_other_columns:
             return
 
+        column_names = self._column_dtypes if self.dataframe is None else self.dataframe.columns
         other_timing_columns = [
-            other_column
-            for other_column in self.dataframe.columns
-            if other_column.endswith("_time") and other_column != column
+            other_column for other_column in column_names if other_column.endswith("_time") and other_column != column
         ]
         for other_timing_column in other_timing_columns:
             self.align_by_interpolation(
@@ -179,6 +222,13 @@ class TimeIntervalsInterface(BaseDataInterface):
         column : str
             The name of the column containing the timestamps to be aligned.
         """
+        if self.dataframe is None:
+            # The interpolation is applied to each chunk when it is read
+            self._timing_operations.setdefault(column, []).append(
+                ("interpolate", np.asarray(unaligned_timestamps), np.asarray(aligned_timestamps))
+            )
+            return
+
         current_timestamps = self.get_timestamps(column=column)
         assert (
             current_timestamps[1] >= unaligned_timestamps[0]
@@ -225,6 +275,16 @@ class TimeIntervalsInterface(BaseDataInterface):
 
         """
         metadata = metadata or self.get_metadata()
+        if self.dataframe is None:
+            self.time_intervals = self._get_time_intervals_from_chunks(
+                column_name_mapping=column_name_mapping,
+                column_descriptions=column_descriptions,
+                **metadata["TimeIntervals"][tag],
+            )
+            nwbfile.add_time_intervals(self.time_intervals)
+
+            return nwbfile
+
         self.time_intervals = convert_df_to_time_intervals(
             self.dataframe,
             column_name_mapping=column_name_mapping,
@@ -238,3 +298,120 @@ class TimeIntervalsInterface(BaseDataInterface):
     @abstractmethod
     def _read_file(self, file_path: FilePath, **read_kwargs):
         pass
+
+    def _scan_file_in_chunks(self) -> tuple[int, dict[str, np.dtype]]:
+        """Count the rows of the file and resolve the dtype of each column over all chunks."""
+        number_of_rows = 0
+        column_dtypes = dict()
+        for chunk in self._read_file_in_chunks(
+            file_path=self.source_data["file_path"], rows_per_chunk=self.rows_per_chunk, **self._read_kwargs
+        ):
+            number_of_rows += len(chunk)
+            for column, chunk_dtype in chunk.dtypes.items():
+                previous_dtype = column_dtypes.get(column, chunk_dtype)
+                is_numeric = all(isinstance(dtype, np.dtype) for dtype in (previous_dtype, chunk_dtype)) and all(
+                    dtype.kind in "biuf" for dtype in (previous_dtype, chunk_dtype)
+                )
+                column_dtypes[column] = np.result_type(previous_dtype, chunk_dtype) if is_numeric else np.dtype(object)
+
+        return number_of_rows, column_dtypes
+
+    def _apply_timing_operations(self, column: str, values: np.ndarray, start_row: int) -> np.ndarray:
+        for operation, *arguments in self._timing_operations.get(column, []):
+            if operation == "shift":
+                values = values + arguments[0]
+            elif operation == "replace":
+                values = arguments[0][start_row : start_row + len(values)]
+            elif operation == "interpolate":
+                unaligned_timestamps, aligned_timestamps = arguments
+                values = np.interp(
+                    x=values,
+                    xp=unaligned_timestamps,
+                    fp=aligned_timestamps,
+                    left=2 * aligned_timestamps[0] - aligned_timestamps[1],
+                    right=2 * aligned_timestamps[-1] - aligned_timestamps[-2],
+                )
+
+        return values
+
+    def _read_column_chunks(self, column: str, aligned: bool = True) -> Iterator[np.ndarray]:
+        """Iterate over the values of a column chunk by chunk, applying its time alignment if `aligned` is True."""
+        read_kwargs = dict(self._read_kwargs, usecols=[column])
+        start_row = 0
+        for chunk in self._read_file_in_chunks(
+            file_path=self.source_data["file_path"], rows_per_chunk=self.rows_per_chunk, **read_kwargs
+        ):
+            values = chunk[column].to_numpy()
+            if aligned:
+                values = self._apply_timing_operations(column=column, values=values, start_row=start_row)
+            start_row += len(values)
+            yield values
+
+    def _read_following_start_time_chunks(self, start_time_column: str) -> Iterator[np.ndarray]:
+        """Iterate over the start time of the following row, padded with NaN, as the default stop time."""
+        for chunk_index, values in enumerate(self._read_column_chunks(column=start_time_column)):
+            yield values[1:] if chunk_index == 0 else values
+        yield np.array([np.nan])
+
+    def _get_time_intervals_from_chunks(
+        self,
+        table_name: str = "trials",
+        table_description: str = "experimental trials",
+        column_name_mapping: dict[str, str] = None,
+        column_descriptions: dict[str, str] = None,
+    ) -> TimeIntervals:
+        """Build the TimeIntervals from the file read in chunks, mirroring `convert_df_to_time_intervals`."""
+        column_name_mapping = column_name_mapping or dict()
+        column_names = {column: column_name_mapping.get(column, column) for column in self._column_dtypes}
+        source_columns = {name: column for column, name in column_names.items()}
+
+        if "start_time" not in source_columns:
+            raise ValueError(
+                f"df must contain a column named 'start_time'. Existing columns: {list(column_names.values())}"
+            )
+
+        column_descriptions = dict(
+            dict(start_time="Start time of epoch, in seconds.", stop_time="Stop time of epoch, in seconds."),
+            **(column_descriptions or dict()),
+        )
+
+        def create_iterator(read_column_chunks, dtype) -> TimeIntervalsColumnDataChunkIterator:
+            return TimeIntervalsColumnDataChunkIterator(
+                read_column_chunks=read_column_chunks,
+                number_of_rows=self._number_of_rows,
+                dtype=dtype,
+                buffer_shape=(min(self.rows_per_chunk, self._number_of_rows),),
+            )
+
+        column_data = dict()
+        for column, name in column_names.items():
+            dtype = self._column_dtypes[column]
+            if dtype.kind in "biuf" and self._number_of_rows > 0:
+                column_data[name] = create_iterator(lambda column=column: self._read_column_chunks(column), dtype)
+            else:
+                column_chunks = list(self._read_column_chunks(column=column))
+                column_data[name] = np.concatenate(column_chunks).tolist() if column_chunks else []
+        if "stop_time" not in column_data:
+            start_time_column = source_columns["start_time"]
+            if self._number_of_rows > 0:
+                column_data["stop_time"] = create_iterator(
+                    lambda: self._read_following_start_time_chunks(start_time_column=start_time_column),
+                    np.dtype("float64"),
+                )
+            else:
+                column_data["stop_time"] = []
+
+        ordered_names = ["start_time", "stop_time"] + [
+            name for name in column_data if name not in ("start_time", "stop_time")
+        ]
+        columns = [
+            VectorData(name=name, description=column_descriptions.get(name, name), data=column_data[name])
+            for name in ordered_names
+        ]
+
+        return TimeIntervals(
+            name=table_name,
+            description=table_description,
+            columns=columns,
+            id=ElementIdentifiers(name="id", data=np.arange(self._number_of_rows)),
+        )
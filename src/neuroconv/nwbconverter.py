@@ -3,10 +3,12 @@
 import inspect
 import json
 from collections import Counter
+from contextlib import contextmanager
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal, Type
 
-from jsonschema import validate
 from pydantic import FilePath, validate_call
 from pynwb import NWBFile
 
@@ -34,9 +36,16 @@ from .utils.json_schema import (
     _NWBConversionOptionsEncoder,
     _NWBMetaDataEncoder,
     _NWBSourceDataEncoder,
+    _validate_against_schema,
 )
 
 
+@lru_cache(maxsize=None)
+def _accepts_verbose(interface_class: Type[BaseDataInterface]) -> bool:
+    """Whether the constructor of an interface class has a 'verbose' argument, inspected once per class."""
+    return "verbose" in inspect.signature(interface_class.__init__).parameters
+
+
 class NWBConverter:
     """Primary class for all NWB conversion classes."""
 
@@ -80,7 +89,7 @@ class NWBConverter:
         encoded_source_data = encoder.encode(source_data)
         decoded_source_data = json.loads(encoded_source_data)
 
-        validate(instance=decoded_source_data, schema=self.get_source_schema())
+        _validate_against_schema(instance=decoded_source_data, schema=self.get_source_schema())
         if verbose:
             print("Source data is valid!")
 
@@ -112,7 +121,7 @@ class NWBConverter:
             interface_kwargs = source_data[interface_name]
 
             # Pass the verbose argument if the interface's constructor supports it.
-            if "verbose" in inspect.signature(interface_class.__init__).parameters:
+            if _accepts_verbose(interface_class=interface_class):
                 interface_kwargs["verbose"] = verbose
 
             interface_instance = interface_class(**interface_kwargs)
@@ -146,11 +155,48 @@ class NWBConverter:
             The metadata dictionary containing auto-filled metadata from all interfaces.
         """
         metadata = get_default_nwbfile_metadata()
-        for interface in self.data_interface_objects.values():
-            interface_metadata = interface.get_metadata()
+        for interface_name in self.data_interface_objects:
+            interface_metadata = self._get_interface_metadata(interface_name=interface_name)
             metadata = dict_deep_update(metadata, interface_metadata)
         return metadata
 
+    def _get_interface_metadata(self, interface_name: str) -> DeepDict:
+        """
+        Get the metadata of a data interface, parsing its source files only once while the metadata cache is active.
+
+        A copy of the cached metadata is returned so that the callers can modify it freely.
+        """
+        interface = self.data_interface_objects[interface_name]
+        metadata_cache = getattr(self, "_interface_metadata_cache", None)
+        if metadata_cache is None:
+            return interface.get_metadata()
+
+        if interface_name not in metadata_cache:
+            metadata_cache[interface_name] = interface.get_metadata()
+
+        return deepcopy(metadata_cache[interface_name])
+
+    @contextmanager
+    def _cache_interface_metadata(self):
+        """
+        Memoize the metadata of each data interface for the duration of the context.
+
+        `run_conversion` requests the metadata several times, e.g. to fill the defaults of the metadata schema when
+        validating; within this context each interface parses its headers only once. The cache is cleared when the
+        interfaces are mutated, such as by the temporal alignment, and discarded when the context exits.
+        """
+        self._interface_metadata_cache = dict()
+        try:
+            yield
+        finally:
+            self._interface_metadata_cache = None
+
+    def _invalidate_interface_metadata_cache(self) -> None:
+        """Clear the memoized metadata of the data interfaces after they have been mutated."""
+        metadata_cache = getattr(self, "_interface_metadata_cache", None)
+        if metadata_cache is not None:
+            metadata_cache.clear()
+
     def validate_metadata(self, metadata: dict[str, dict], append_mode: bool = False):
         """Validate metadata against Converter metadata_schema."""
         encoder = _NWBMetaDataEncoder()
@@ -165,7 +211,7 @@ class NWBConverter:
             nwbfile_schema = metadata_schema["properties"]["NWBFile"]
             nwbfile_schema.pop("required", None)
 
-        validate(instance=decoded_metadata, schema=metadata_schema)
+        _validate_against_schema(instance=decoded_metadata, schema=metadata_schema)
         if self.verbose:
             print("Metadata is valid!")
 
@@ -201,7 +247,7 @@ class NWBConverter:
         encoded_conversion_options = _NWBConversionOptionsEncoder().encode(conversion_options)
         decoded_conversion_options = json.loads(encoded_conversion_options)
 
-        validate(instance=decoded_conversion_options, schema=self.get_conversion_options_schema())
+        _validate_against_schema(instance=decoded_conversion_options, schema=self.get_conversion_options_schema())
         if self.verbose:
             print("conversion_options is valid!")
 
@@ -310,44 +356,48 @@ class NWBConverter:
                 "Either set overwrite=True to replace the existing file, or remove the nwbfile parameter to append to the existing file on disk."
             )
 
-        if metadata is None:
-            metadata = self.get_metadata()
-
-        self.validate_metadata(metadata=metadata, append_mode=append_on_disk_nwbfile)
-        self.validate_conversion_options(conversion_options=conversion_options)
-        self.temporally_align_data_interfaces(metadata=metadata, conversion_options=conversion_options)
-
-        if not append_on_disk_nwbfile:
-
-            if appending_to_in_memory_nwbfile:
-                self.add_to_nwbfile(nwbfile=nwbfile, metadata=metadata, conversion_options=conversion_options)
-            else:
-                nwbfile = self.create_nwbfile(metadata=metadata, conversion_options=conversion_options)
-
-            configure_and_write_nwbfile(
-                nwbfile=nwbfile,
-                nwbfile_path=nwbfile_path,
-                backend=backend,
-                backend_configuration=backend_configuration,
-            )
-
-        else:  # We are only using the context in append mode, see issue #1143
-
-            backend = _resolve_backend(backend, backend_configuration)
-            with make_or_load_nwbfile(
-                nwbfile_path=nwbfile_path,
-                nwbfile=nwbfile,
-                metadata=metadata,
-                overwrite=overwrite,
-                backend=backend,
-                verbose=getattr(self, "verbose", False),
-            ) as nwbfile_out:
-                self.add_to_nwbfile(nwbfile=nwbfile_out, metadata=metadata, conversion_options=conversion_options)
-
-                if backend_configuration is None:
-                    backend_configuration = self.get_default_backend_configuration(nwbfile=nwbfile_out, backend=backend)
-
-                configure_backend(nwbfile=nwbfile_out, backend_configuration=backend_configuration)
+        with self._cache_interface_metadata():
+            if metadata is None:
+                metadata = self.get_metadata()
+
+            self.validate_metadata(metadata=metadata, append_mode=append_on_disk_nwbfile)
+            self.validate_conversion_options(conversion_options=conversion_options)
+            self.temporally_align_data_interfaces(metadata=metadata, conversion_options=conversion_options)
+            self._invalidate_interface_metadata_cache()
+
+            if not append_on_disk_nwbfile:
+
+                if appending_to_in_memory_nwbfile:
+                    self.add_to_nwbfile(nwbfile=nwbfile, metadata=metadata, conversion_options=conversion_options)
+                else:
+                    nwbfile = self.create_nwbfile(metadata=metadata, conversion_options=conversion_options)
+
+                configure_and_write_nwbfile(
+                    nwbfile=nwbfile,
+                    nwbfile_path=nwbfile_path,
+                    backend=backend,
+                    backend_configuration=backend_configuration,
+                )
+
+            else:  # We are only using the context in append mode, see issue #1143
+
+                backend = _resolve_backend(backend, backend_configuration)
+                with make_or_load_nwbfile(
+                    nwbfile_path=nwbfile_path,
+                    nwbfile=nwbfile,
+                    metadata=metadata,
+                    overwrite=overwrite,
+                    backend=backend,
+                    verbose=getattr(self, "verbose", False),
+                ) as nwbfile_out:
+                    self.add_to_nwbfile(nwbfile=nwbfile_out, metadata=metadata, conversion_options=conversion_options)
+
+                    if backend_configuration is None:
+                        backend_configuration = self.get_default_backend_configuration(
+                            nwbfile=nwbfile_out, backend=backend
+                        )
+
+                    configure_backend(nwbfile=nwbfile_out, backend_configuration=backend_configuration)
 
     def temporally_align_data_interfaces(self, metadata: dict | None = None, conversion_options: dict | None = None):
         """Override this method to implement custom alignment."""
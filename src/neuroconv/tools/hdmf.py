@@ -1,20 +1,51 @@
 """Collection of modifications of HDMF functions that are to be tested/used on this repo until propagation upstream."""
 
 import math
+import queue
+import threading
 import warnings
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
 
+import h5py
 import numpy as np
+from hdmf import Container, Data
+from hdmf.backends.hdf5.h5_utils import HDF5IODataChunkIteratorQueue
+from hdmf.build import TypeMap
 from hdmf.build.builders import (
     BaseBuilder,
     LinkBuilder,
 )
+from hdmf.data_utils import AbstractDataChunkIterator, DataChunk
 from hdmf.data_utils import GenericDataChunkIterator as HDMFGenericDataChunkIterator
+from hdmf.spec import GroupSpec
 from hdmf.utils import get_data_shape
 
 
 class GenericDataChunkIterator(HDMFGenericDataChunkIterator):  # noqa: D101
 
-    def __init__(self, **kwargs):
+    def __init__(self, prefetch_buffers: int = 0, **kwargs):
+        """
+        Break a dataset into buffers containing multiple chunks to be written into an HDF5 or Zarr dataset.
+
+        Parameters
+        ----------
+        prefetch_buffers : int, default: 0
+            The number of buffers to read ahead on a background thread while the current buffer is being written.
+            At most `prefetch_buffers + 1` buffers are held in memory at any time, so the memory ceiling is
+            `(prefetch_buffers + 1) * buffer_gb`.
+            Buffers are still read one at a time and in order, so `_get_data` never runs concurrently with itself.
+            The default of 0 disables prefetching and reads each buffer synchronously.
+        **kwargs
+            Passed to `hdmf.data_utils.GenericDataChunkIterator`.
+        """
+        assert prefetch_buffers >= 0, f"prefetch_buffers ({prefetch_buffers}) must be non-negative!"
+        self.prefetch_buffers = prefetch_buffers
+        self._prefetch_executor = None
+        self._prefetch_queue = deque()
+
         super().__init__(**kwargs)
 
         # Add the size in bytes of chunk and buffer for easy access
@@ -22,6 +53,54 @@ class GenericDataChunkIterator(HDMFGenericDataChunkIterator):  # noqa: D101
         self._chunk_size_mb = math.prod(self.chunk_shape) * self._get_dtype().itemsize / 1e6
         self._buffer_size_gb = math.prod(self.buffer_shape) * self._get_dtype().itemsize / 1e9
 
+    def __next__(self) -> DataChunk:
+        if self.prefetch_buffers == 0:
+            return super().__next__()
+
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="neuroconv_prefetch")
+
+        # Keep the current buffer plus `prefetch_buffers` upcoming ones in flight; the single worker thread
+        # preserves the sequential read order that stateful sources (such as video captures) rely on
+        while len(self._prefetch_queue) <= self.prefetch_buffers:
+            buffer_selection = next(self.buffer_selection_generator, None)
+            if buffer_selection is None:
+                break
+            future = self._prefetch_executor.submit(self._get_data, selection=buffer_selection)
+            self._prefetch_queue.append((buffer_selection, future))
+
+        if not self._prefetch_queue:
+            self._shutdown_prefetch()
+
+            # Allow text to be written to new lines after completion
+            if self.display_progress:
+                self.progress_bar.write("\n")
+            raise StopIteration
+
+        buffer_selection, future = self._prefetch_queue.popleft()
+        try:
+            data = future.result()
+        except Exception:
+            self._shutdown_prefetch()
+            raise
+
+        if self.display_progress:
+            self.progress_bar.update(n=1)
+
+        return DataChunk(data=data, selection=buffer_selection)
+
+    def _shutdown_prefetch(self) -> None:
+        """Cancel any pending reads and release the background thread used for prefetching."""
+        self._prefetch_queue.clear()
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=True, cancel_futures=True)
+            self._prefetch_executor = None
+
+    def __del__(self):
+        # Attributes may be missing if initialization failed
+        if getattr(self, "_prefetch_executor", None) is not None:
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+
     def _get_default_buffer_shape(self, buffer_gb: float = 1.0) -> tuple[int]:
         return self.estimate_default_buffer_shape(
             buffer_gb=buffer_gb, chunk_shape=self.chunk_shape, maxshape=self.maxshape, dtype=self.dtype
@@ -167,6 +246,311 @@ class SliceableDataChunkIterator(GenericDataChunkIterator):
         return self.data[selection]
 
 
+class ParallelHDF5IODataChunkIteratorQueue(HDF5IODataChunkIteratorQueue):
+    """
+    Queue used by HDF5IO to exhaust DataChunkIterators, compressing the chunks of each buffer on a pool of threads.
+
+    The compressed chunks are then written from the main thread with direct chunk writes, which bypass the HDF5 filter
+    pipeline. Only the gzip and shuffle filters can be applied this way; datasets using any other filter, as well as
+    buffers that are not aligned to the chunk grid of the dataset, are written through the standard (serial) path.
+
+    With several streams, the queued DataChunkIterators (such as the ElectricalSeries of different probes) are also
+    read and compressed concurrently, each on its own thread, while every write to the file stays on the main thread.
+    """
+
+    def __init__(self, number_of_jobs: int, number_of_streams: int = 1):
+        """
+        Parameters
+        ----------
+        number_of_jobs : int
+            The number of threads used to compress the chunks of each buffer.
+        number_of_streams : int, default: 1
+            The number of DataChunkIterators read and compressed concurrently.
+        """
+        assert number_of_jobs > 0, f"number_of_jobs ({number_of_jobs}) must be greater than zero!"
+        assert number_of_streams > 0, f"number_of_streams ({number_of_streams}) must be greater than zero!"
+        self.number_of_jobs = number_of_jobs
+        self.number_of_streams = number_of_streams
+        super().__init__()
+
+    def exhaust_queue(self):
+        """Read and write from any queued DataChunkIterators in a round-robin fashion."""
+        with ThreadPoolExecutor(max_workers=self.number_of_jobs, thread_name_prefix="neuroconv_compress") as executor:
+            if self.number_of_streams > 1 and len(self) > 1:
+                self._exhaust_streams_concurrently(executor=executor)
+
+            while len(self) > 0:
+                dset, data = self.popleft()
+                if self._write_compressed_chunks(dset=dset, data=data, executor=executor):
+                    self.append(dataset=dset, data=data)
+
+    @classmethod
+    def _write_compressed_chunks(
+        cls, dset: h5py.Dataset, data: AbstractDataChunkIterator, executor: ThreadPoolExecutor
+    ) -> bool:
+        """
+        Read a buffer from the given DataChunkIterator, compress its chunks in parallel, and write them to the Dataset.
+
+        Returns
+        -------
+        bool
+            True if a buffer was written, False if the iterator was exhausted.
+        """
+        filter_options = _get_direct_chunk_write_filter_options(dset=dset)
+        if filter_options is None:
+            return cls._write_chunk(dset, data)
+
+        try:
+            chunk_i = next(data)
+        except StopIteration:
+            return False
+
+        dset.id.extend(chunk_i.get_min_bounds())
+
+        buffer = np.asarray(chunk_i.data, dtype=dset.dtype)
+        selection = chunk_i.selection
+        if not _is_chunk_aligned(
+            chunk_shape=dset.chunks, dataset_shape=dset.shape, selection=selection, buffer_shape=buffer.shape
+        ):
+            dset[selection] = buffer
+            return True
+
+        compressed_chunks = _compress_buffer_chunks(
+            buffer=buffer,
+            selection=selection,
+            chunk_shape=dset.chunks,
+            fill_value=dset.fillvalue,
+            executor=executor,
+            **filter_options,
+        )
+        for chunk_offset, compressed_chunk in compressed_chunks:
+            dset.id.write_direct_chunk(chunk_offset, compressed_chunk)
+
+        return True
+
+    def _exhaust_streams_concurrently(self, executor: ThreadPoolExecutor) -> None:
+        """
+        Drain every queued DataChunkIterator, reading and compressing up to `number_of_streams` of them at once.
+
+        The stream threads only read buffers and compress chunks; they hand the results to the main thread through a
+        bounded queue, so at most two buffers per stream are held in memory and all HDF5 calls stay serialized.
+        """
+        # Snapshot everything the stream threads need from the datasets before they start
+        streams = deque()
+        while len(self) > 0:
+            dset, data = self.popleft()
+            dataset_information = dict(
+                filter_options=_get_direct_chunk_write_filter_options(dset=dset),
+                chunk_shape=dset.chunks,
+                dataset_shape=dset.shape,
+                dtype=dset.dtype,
+                fill_value=dset.fillvalue,
+            )
+            streams.append((dset, data, dataset_information))
+
+        number_of_stream_threads = min(self.number_of_streams, len(streams))
+        results = queue.Queue(maxsize=number_of_stream_threads)
+        streams_lock = threading.Lock()
+        stop_event = threading.Event()
+
+        def put_result(result: tuple) -> bool:
+            while not stop_event.is_set():
+                try:
+                    results.put(result, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def read_streams() -> None:
+            try:
+                while not stop_event.is_set():
+                    with streams_lock:
+                        if not streams:
+                            break
+                        dset, data, dataset_information = streams.popleft()
+
+                    for chunk_i in data:
+                        result = _read_and_compress_buffer(
+                            dset=dset, chunk_i=chunk_i, executor=executor, **dataset_information
+                        )
+                        if not put_result(result):
+                            return
+            except BaseException as exception:
+                put_result(("error", exception))
+            finally:
+                put_result(("done",))
+
+        stream_threads = [
+            threading.Thread(target=read_streams, name=f"neuroconv_stream_{thread_index}", daemon=True)
+            for thread_index in range(number_of_stream_threads)
+        ]
+        for stream_thread in stream_threads:
+            stream_thread.start()
+
+        try:
+            number_of_finished_threads = 0
+            while number_of_finished_threads < number_of_stream_threads:
+                result = results.get()
+                if result[0] == "done":
+                    number_of_finished_threads += 1
+                elif result[0] == "error":
+                    raise result[1]
+                elif result[0] == "direct":
+                    _, dset, min_bounds, compressed_chunks = result
+                    dset.id.extend(min_bounds)
+                    for chunk_offset, compressed_chunk in compressed_chunks:
+                        dset.id.write_direct_chunk(chunk_offset, compressed_chunk)
+                else:
+                    _, dset, min_bounds, selection, buffer = result
+                    dset.id.extend(min_bounds)
+                    dset[selection] = buffer
+        finally:
+            stop_event.set()
+            for stream_thread in stream_threads:
+                stream_thread.join()
+
+
+def _read_and_compress_buffer(
+    dset: h5py.Dataset,
+    chunk_i: DataChunk,
+    executor: ThreadPoolExecutor,
+    filter_options: dict | None,
+    chunk_shape: tuple[int, ...] | None,
+    dataset_shape: tuple[int, ...],
+    dtype: np.dtype,
+    fill_value,
+) -> tuple:
+    """Prepare the write of a buffer outside of the main thread, compressing its chunks if they can be written directly."""
+    min_bounds = chunk_i.get_min_bounds()
+    selection = chunk_i.selection
+    if filter_options is None:
+        buffer = np.asarray(chunk_i.data, dtype=dtype) if dtype.kind in "biuf" else chunk_i.data
+        return ("write", dset, min_bounds, selection, buffer)
+
+    buffer = np.asarray(chunk_i.data, dtype=dtype)
+    # The main thread extends the dataset to the minimum bounds of the buffer before writing it
+    extended_shape = tuple(max(axis_length, bound) for axis_length, bound in zip(dataset_shape, min_bounds))
+    if not _is_chunk_aligned(
+        chunk_shape=chunk_shape, dataset_shape=extended_shape, selection=selection, buffer_shape=buffer.shape
+    ):
+        return ("write", dset, min_bounds, selection, buffer)
+
+    compressed_chunks = _compress_buffer_chunks(
+        buffer=buffer,
+        selection=selection,
+        chunk_shape=chunk_shape,
+        fill_value=fill_value,
+        executor=executor,
+        **filter_options,
+    )
+    return ("direct", dset, min_bounds, compressed_chunks)
+
+
+def _compress_buffer_chunks(
+    buffer: np.ndarray,
+    selection: tuple[slice, ...],
+    chunk_shape: tuple[int, ...],
+    fill_value,
+    executor: ThreadPoolExecutor,
+    shuffle: bool,
+    compression_level: int | None,
+) -> list[tuple[tuple[int, ...], bytes]]:
+    """Compress the chunks covered by a chunk-aligned buffer on the executor, returning them with their offsets."""
+    chunk_offsets = list(
+        product(
+            *[
+                range(axis_slice.start, axis_slice.stop, axis_chunk)
+                for axis_slice, axis_chunk in zip(selection, chunk_shape)
+            ]
+        )
+    )
+
+    def compress_chunk(chunk_offset: tuple[int, ...]) -> bytes:
+        buffer_slice = tuple(
+            slice(offset - axis_slice.start, min(offset + axis_chunk, axis_slice.stop) - axis_slice.start)
+            for offset, axis_slice, axis_chunk in zip(chunk_offset, selection, chunk_shape)
+        )
+        chunk = buffer[buffer_slice]
+
+        # Chunks on the edge of the dataset are always stored at their full shape
+        if chunk.shape != chunk_shape:
+            padded_chunk = np.full(shape=chunk_shape, fill_value=fill_value, dtype=buffer.dtype)
+            padded_chunk[tuple(slice(0, axis_length) for axis_length in chunk.shape)] = chunk
+            chunk = padded_chunk
+
+        return _compress_chunk(chunk=chunk, shuffle=shuffle, compression_level=compression_level)
+
+    return list(zip(chunk_offsets, executor.map(compress_chunk, chunk_offsets)))
+
+
+def _get_direct_chunk_write_filter_options(dset: h5py.Dataset) -> dict | None:
+    """
+    Determine how to reproduce the filter pipeline of a dataset when writing chunks directly.
+
+    Returns None if the pipeline contains anything other than an optional shuffle followed by an optional gzip.
+    """
+    if dset.chunks is None or dset.dtype.kind not in "biuf":
+        return None
+
+    shuffle = False
+    compression_level = None
+    dataset_creation_property_list = dset.id.get_create_plist()
+    for filter_index in range(dataset_creation_property_list.get_nfilters()):
+        filter_code, _, filter_values, _ = dataset_creation_property_list.get_filter(filter_index)
+        if filter_code == h5py.h5z.FILTER_SHUFFLE and compression_level is None:
+            shuffle = True
+        elif filter_code == h5py.h5z.FILTER_DEFLATE:
+            compression_level = filter_values[0]
+        else:
+            return None
+
+    return dict(shuffle=shuffle, compression_level=compression_level)
+
+
+def _is_chunk_aligned(
+    chunk_shape: tuple[int, ...], dataset_shape: tuple[int, ...], selection: tuple, buffer_shape: tuple[int, ...]
+) -> bool:
+    """Check that a buffer selection spans whole chunks of the dataset, except at its trailing edges."""
+    number_of_dimensions = len(dataset_shape)
+    if (
+        not isinstance(selection, tuple)
+        or len(selection) != number_of_dimensions
+        or len(buffer_shape) != number_of_dimensions
+    ):
+        return False
+
+    for axis_slice, axis_chunk, axis_length, axis_buffer_length in zip(
+        selection, chunk_shape, dataset_shape, buffer_shape
+    ):
+        if not isinstance(axis_slice, slice) or axis_slice.step not in (None, 1):
+            return False
+        if axis_slice.start is None or axis_slice.stop is None:
+            return False
+        if axis_slice.stop - axis_slice.start != axis_buffer_length:
+            return False
+        if axis_slice.start % axis_chunk != 0:
+            return False
+        if axis_slice.stop % axis_chunk != 0 and axis_slice.stop != axis_length:
+            return False
+
+    return True
+
+
+def _compress_chunk(chunk: np.ndarray, shuffle: bool, compression_level: int | None) -> bytes:
+    """Apply the HDF5 shuffle and deflate filters to a single chunk."""
+    chunk = np.ascontiguousarray(chunk)
+    if shuffle:
+        chunk_bytes = chunk.view(np.uint8).reshape(-1, chunk.dtype.itemsize).T.tobytes()
+    else:
+        chunk_bytes = chunk.tobytes()
+
+    if compression_level is not None:
+        chunk_bytes = zlib.compress(chunk_bytes, compression_level)
+
+    return chunk_bytes
+
+
 def get_full_data_shape(
     dataset: GenericDataChunkIterator | np.ndarray | list,
     location_in_file: str,
@@ -215,6 +599,47 @@ def has_compound_dtype(builder: BaseBuilder, location_in_file: str) -> bool:
     return isinstance(dataset_builder.dtype, list)
 
 
+def has_compound_dtype_in_spec(neurodata_object: Container, dataset_name: str, type_map: TypeMap) -> bool:
+    """
+    Determine from the specification alone if a dataset of a neurodata object has a compound dtype.
+
+    This resolves the same dtype that the builder would be given, without building the NWBFile.
+
+    Parameters
+    ----------
+    neurodata_object : hdmf.Container
+        The neurodata object containing the field that will become a dataset when written to disk.
+    dataset_name : str
+        The name of the field that will become a dataset when written to disk, e.g. 'data' or 'timestamps'.
+    type_map : hdmf.build.TypeMap
+        The type map holding the specification of the neurodata types, e.g. from `pynwb.get_type_map()`.
+
+    Returns
+    -------
+    bool
+        Whether the dataset has a compound dtype.
+
+    Notes
+    -----
+    When the neurodata object is itself a dataset, such as a column of a DynamicTable, the dtype of its own neurodata
+    type can be refined by the specification of its parent (e.g., the 'pixel_mask' of a PlaneSegmentation).
+    """
+    if isinstance(neurodata_object, Data):
+        dataset_spec = type_map.get_map(neurodata_object).spec
+        parent = neurodata_object.parent
+        if isinstance(parent, Container):
+            parent_spec = type_map.get_map(parent).spec
+            refining_spec = (
+                parent_spec.get_dataset(neurodata_object.name) if isinstance(parent_spec, GroupSpec) else None
+            )
+            if refining_spec is not None and refining_spec.dtype is not None:
+                dataset_spec = refining_spec
+    else:
+        dataset_spec = type_map.get_map(neurodata_object).spec.get_dataset(dataset_name)
+
+    return dataset_spec is not None and isinstance(dataset_spec.dtype, list)
+
+
 def get_dataset_builder(builder: BaseBuilder, location_in_file: str) -> BaseBuilder:
     """Find the appropriate sub-builder for the dataset at the given location in the file.
 
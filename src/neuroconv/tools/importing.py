@@ -1,6 +1,7 @@
 """Tool functions related to imports."""
 
 import sys
+from copy import deepcopy
 from importlib import import_module
 from importlib.metadata import version as importlib_version
 from importlib.util import find_spec
@@ -139,12 +140,27 @@ def get_format_summaries() -> dict[str, dict[str, str | tuple[str, ...] | None]]
     """
     Simple helper function for compiling high level summaries of all format interfaces and converters.
 
+    The summaries are read from a static manifest, so that no interface or converter (nor their dependencies) has to be
+    imported.
+
     Returns
     -------
     dict
         A dictionary mapping interface/converter names to their summary information.
         Each summary contains display_name, keywords, associated_suffixes, and info.
     """
+    from ._format_summaries import FORMAT_SUMMARIES
+
+    return deepcopy(FORMAT_SUMMARIES)
+
+
+def _compile_format_summaries() -> dict[str, dict[str, str | tuple[str, ...] | None]]:
+    """
+    Compile the summaries of all format interfaces and converters by importing each of them.
+
+    This is the source of the static manifest used by `get_format_summaries`; the manifest in
+    `neuroconv/tools/_format_summaries.py` must be regenerated from it when adding an interface or changing its summary.
+    """
     # Local scope import to avoid circularity
     from ..converters import converter_list
     from ..datainterfaces import interface_list
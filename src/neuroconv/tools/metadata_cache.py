@@ -0,0 +1,219 @@
+"""
+Persistent on-disk cache of metadata derived from data files, such as timestamps, frame counts and shapes.
+
+Entries are content-addressed: the key hashes the name of the derived quantity, the parameters used to derive it and the
+resolved path, size and modification time of every source file (recursively for folders), so that any change to the
+data invalidates the entry. The cache lives in a user cache directory and the least recently used entries are evicted
+once it grows beyond its maximum size.
+
+The cache is opt-in: it is enabled by setting the environment variable `NEUROCONV_ENABLE_METADATA_CACHE=1`, and can be
+relocated with `NEUROCONV_METADATA_CACHE_DIRECTORY`. Since entries are only invalidated by changes to the data and to the
+version of NeuroConv, the cache should not be enabled while developing an editable installation of the package.
+
+Entries are stored as NumPy archives loaded without pickling, which only hold numpy arrays, lists of numpy arrays or
+JSON, so that reading an entry never executes code. Anyone who can write to the cache directory can still change the
+values it returns, so the cache directory must be private to the user running the conversions.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import warnings
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+from pydantic import DirectoryPath, FilePath
+
+DEFAULT_MAXIMUM_CACHE_SIZE_MB = 512.0
+
+
+def is_metadata_cache_enabled() -> bool:
+    """Whether the metadata cache is enabled, which is only the case if `NEUROCONV_ENABLE_METADATA_CACHE` is set."""
+    return os.environ.get("NEUROCONV_ENABLE_METADATA_CACHE", "0").lower() not in ("", "0", "false", "no")
+
+
+def get_metadata_cache_directory() -> Path:
+    """
+    Get the directory of the metadata cache.
+
+    Defaults to `neuroconv/metadata` in the user cache directory (`$XDG_CACHE_HOME`, or `~/.cache`), and can be
+    overridden with the environment variable `NEUROCONV_METADATA_CACHE_DIRECTORY`.
+    """
+    if "NEUROCONV_METADATA_CACHE_DIRECTORY" in os.environ:
+        return Path(os.environ["NEUROCONV_METADATA_CACHE_DIRECTORY"])
+
+    user_cache_directory = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return user_cache_directory / "neuroconv" / "metadata"
+
+
+def clear_metadata_cache() -> None:
+    """Remove every entry of the metadata cache."""
+    cache_directory = get_metadata_cache_directory()
+    if not cache_directory.is_dir():
+        return
+
+    for entry_path in cache_directory.glob("*.npz"):
+        entry_path.unlink(missing_ok=True)
+
+
+def _get_file_signatures(path: Path) -> list[tuple[str, int, int]]:
+    path = Path(path).resolve()
+    if path.is_dir():
+        file_paths = sorted(file_path for file_path in path.rglob("*") if file_path.is_file())
+    else:
+        file_paths = [path]
+
+    signatures = []
+    for file_path in file_paths:
+        file_stat = file_path.stat()
+        signatures.append((str(file_path), file_stat.st_size, file_stat.st_mtime_ns))
+
+    return signatures
+
+
+def get_metadata_cache_key(name: str, source_paths: list[FilePath | DirectoryPath], parameters: dict | None) -> str:
+    """
+    Compute the content-addressed key of a derived quantity.
+
+    Parameters
+    ----------
+    name : str
+        The name of the derived quantity, e.g. 'VideoTimestamps'.
+    source_paths : list of FilePath or DirectoryPath
+        The files or folders the quantity is derived from.
+    parameters : dict, optional
+        The parameters used to derive the quantity. Values that are not JSON serializable are represented as strings.
+
+    Returns
+    -------
+    str
+        The hexadecimal SHA-256 digest identifying the entry.
+    """
+    from importlib.metadata import version
+
+    signatures = [_get_file_signatures(path=source_path) for source_path in source_paths]
+    key_content = dict(
+        name=name,
+        neuroconv_version=version("neuroconv"),
+        signatures=signatures,
+        parameters=parameters or dict(),
+    )
+    serialized_key_content = json.dumps(key_content, sort_keys=True, default=str)
+
+    return hashlib.sha256(serialized_key_content.encode()).hexdigest()
+
+
+def _evict_least_recently_used_entries(cache_directory: Path, maximum_cache_size_mb: float) -> None:
+    entries = []
+    for entry_path in cache_directory.glob("*.npz"):
+        try:
+            entry_stat = entry_path.stat()
+        except FileNotFoundError:  # Removed concurrently by another process
+            continue
+        entries.append((entry_stat.st_mtime_ns, entry_stat.st_size, entry_path))
+
+    maximum_cache_size = maximum_cache_size_mb * 1e6
+    cache_size = sum(entry_size for _, entry_size, _ in entries)
+    for _, entry_size, entry_path in sorted(entries):
+        if cache_size <= maximum_cache_size:
+            break
+        entry_path.unlink(missing_ok=True)
+        cache_size -= entry_size
+
+
+def _encode_entry(value: Any) -> dict[str, np.ndarray]:
+    """Encode a cached value as the arrays of a NumPy archive; raises a TypeError if it cannot be stored as data."""
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        return dict(kind=np.array("array"), array_0=value)
+
+    if (
+        isinstance(value, list)
+        and len(value) > 0
+        and all(isinstance(array, np.ndarray) and array.dtype != object for array in value)
+    ):
+        return dict(kind=np.array("array_list"), **{f"array_{index}": array for index, array in enumerate(value)})
+
+    return dict(kind=np.array("json"), json=np.array(json.dumps(value)))
+
+
+def _decode_entry(entry_path: Path) -> Any:
+    """Decode a cached value from a NumPy archive, refusing to unpickle any of its arrays."""
+    with np.load(entry_path, allow_pickle=False) as entry:
+        kind = str(entry["kind"])
+        if kind == "array":
+            return entry["array_0"]
+        if kind == "array_list":
+            return [entry[f"array_{index}"] for index in range(len(entry.files) - 1)]
+        if kind == "json":
+            return json.loads(str(entry["json"]))
+
+    raise ValueError(f"Unknown kind '{kind}' of the metadata cache entry '{entry_path}'.")
+
+
+def get_cached_metadata(
+    name: str,
+    source_paths: list[FilePath | DirectoryPath],
+    compute: Callable[[], Any],
+    parameters: dict | None = None,
+    maximum_cache_size_mb: float = DEFAULT_MAXIMUM_CACHE_SIZE_MB,
+) -> Any:
+    """
+    Return a quantity derived from data files, computing it only if it is not in the metadata cache.
+
+    Parameters
+    ----------
+    name : str
+        The name of the derived quantity, e.g. 'VideoTimestamps'.
+    source_paths : list of FilePath or DirectoryPath
+        The files or folders the quantity is derived from.
+    compute : callable
+        Function without arguments computing the quantity. Only results that are numpy arrays, non-empty lists of numpy
+        arrays or JSON serializable are cached; tuples are read back as lists.
+    parameters : dict, optional
+        The parameters used to derive the quantity, which are part of the key of the entry.
+    maximum_cache_size_mb : float, default: 512.0
+        Least recently used entries are evicted when the cache grows beyond this size.
+
+    Returns
+    -------
+    Any
+        The derived quantity.
+    """
+    if not is_metadata_cache_enabled():
+        return compute()
+
+    try:
+        cache_key = get_metadata_cache_key(name=name, source_paths=source_paths, parameters=parameters)
+    except OSError:  # The source files cannot be inspected (e.g. remote or missing); do not cache
+        return compute()
+
+    cache_directory = get_metadata_cache_directory()
+    entry_path = cache_directory / f"{cache_key}.npz"
+    if entry_path.is_file():
+        try:
+            value = _decode_entry(entry_path=entry_path)
+            os.utime(entry_path)  # Mark the entry as recently used
+            return value
+        except Exception:  # Corrupted, not plain data, or removed concurrently; recompute the entry
+            entry_path.unlink(missing_ok=True)
+
+    value = compute()
+
+    try:
+        entry = _encode_entry(value=value)
+    except TypeError:  # Not plain data; do not cache
+        return value
+
+    try:
+        cache_directory.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so that concurrent conversions never read a partially written entry
+        with tempfile.NamedTemporaryFile(mode="wb", dir=cache_directory, suffix=".tmp", delete=False) as file:
+            np.savez(file, **entry)
+        os.replace(file.name, entry_path)
+        _evict_least_recently_used_entries(cache_directory=cache_directory, maximum_cache_size_mb=maximum_cache_size_mb)
+    except OSError as exception:
+        warnings.warn(f"Could not write to the metadata cache at '{cache_directory}': {exception}")
+
+    return value
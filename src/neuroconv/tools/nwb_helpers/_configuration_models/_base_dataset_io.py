@@ -9,10 +9,12 @@ import numcodecs
 import numpy as np
 import zarr
 from hdmf import Container
+from hdmf.build import TypeMap
 from hdmf.build.builders import (
     BaseBuilder,
 )
 from hdmf.data_utils import GenericDataChunkIterator as HDMFGenericDataChunkIterator
+from hdmf.utils import get_data_shape
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -26,7 +28,7 @@ from pynwb.ecephys import ElectricalSeries
 from pynwb.image import ImageSeries
 from typing_extensions import Self
 
-from neuroconv.tools.hdmf import get_full_data_shape
+from neuroconv.tools.hdmf import get_full_data_shape, has_compound_dtype_in_spec
 from neuroconv.tools.iterative_write import get_electrical_series_chunk_shape
 from neuroconv.utils.str_utils import human_readable_size
 
@@ -262,6 +264,7 @@ class DatasetIOConfiguration(BaseModel, ABC):
         neurodata_object: Container,
         dataset_name: Literal["data", "timestamps"],
         builder: BaseBuilder | None = None,
+        type_map: TypeMap | None = None,
     ) -> Self:
         """
         Construct an instance of a DatasetIOConfiguration for a dataset in a neurodata object in an NWBFile.
@@ -275,12 +278,23 @@ class DatasetIOConfiguration(BaseModel, ABC):
             Some neurodata objects can have multiple such fields, such as `pynwb.TimeSeries` which can have both `data`
             and `timestamps`, each of which can be configured separately.
         builder : hdmf.build.builders.BaseBuilder, optional
-            The builder object that would be used to construct the NWBFile object. If None, the dataset is assumed to
-            NOT have a compound dtype.
+            The builder object that would be used to construct the NWBFile object.
+            If neither the builder nor the type map are given, the dataset is assumed to NOT have a compound dtype.
+        type_map : hdmf.build.TypeMap, optional
+            The type map used to resolve a compound dtype from the specification of the neurodata object.
+            This is much cheaper than building the NWBFile and is only used if the builder is not given.
         """
         location_in_file = _find_location_in_memory_nwbfile(neurodata_object=neurodata_object, field_name=dataset_name)
         candidate_dataset = getattr(neurodata_object, dataset_name)
-        full_shape = get_full_data_shape(dataset=candidate_dataset, location_in_file=location_in_file, builder=builder)
+        if builder is None and type_map is not None:
+            is_compound = has_compound_dtype_in_spec(
+                neurodata_object=neurodata_object, dataset_name=dataset_name, type_map=type_map
+            )
+            full_shape = (len(candidate_dataset),) if is_compound else get_data_shape(data=candidate_dataset)
+        else:
+            full_shape = get_full_data_shape(
+                dataset=candidate_dataset, location_in_file=location_in_file, builder=builder
+            )
         dtype = _infer_dtype(dataset=candidate_dataset)
 
         if isinstance(candidate_dataset, HDMFGenericDataChunkIterator):
@@ -2,6 +2,7 @@
 
 from typing import ClassVar, Literal, Type
 
+import psutil
 from pydantic import Field
 from pynwb import H5DataIO
 
@@ -22,3 +23,24 @@ class HDF5BackendConfiguration(BackendConfiguration):
             "information for writing the datasets to disk using the HDF5 backend."
         )
     )
+    number_of_jobs: int = Field(
+        description=(
+            "Number of threads to use for compressing the chunks of each buffer during write. "
+            "When different from 1, the chunks of iteratively written datasets are compressed in parallel and written "
+            "directly to the file; only datasets using gzip compression (or no compression) benefit from this. "
+            "Negative values, starting from -1, will use all the available CPUs (including logical), "
+            "-2 is all except one, etc. The default of 1 compresses and writes each chunk serially."
+        ),
+        ge=-psutil.cpu_count(),
+        le=psutil.cpu_count(),
+        default=1,
+    )
+    number_of_streams: int = Field(
+        description=(
+            "Number of iteratively written datasets, such as the ElectricalSeries of the different probes of a "
+            "SpikeGLX session, that are read and compressed concurrently during write, each on its own thread. "
+            "Writes to the file remain serialized. The default of 1 writes the datasets one buffer at a time in turn."
+        ),
+        ge=1,
+        default=1,
+    )
@@ -6,10 +6,11 @@ import h5py
 import numpy as np
 import zarr
 from hdmf import Container
-from hdmf.data_utils import DataIO
+from hdmf.data_utils import AbstractDataChunkIterator, DataIO
+from hdmf.query import ReferenceResolver
 from hdmf.utils import get_data_shape
 from hdmf_zarr import NWBZarrIO
-from pynwb import NWBHDF5IO, NWBFile, get_manager
+from pynwb import NWBHDF5IO, NWBFile, get_type_map
 from pynwb.base import DynamicTable, TimeSeriesReferenceVectorData
 from pynwb.file import NWBContainer
 
@@ -49,6 +50,27 @@ def _is_dataset_written_to_file(
     )
 
 
+def _is_link_valued_column(candidate_dataset) -> bool:
+    """
+    Determine if the values of a DynamicTable column are links to other containers, such as the 'group' of electrodes.
+
+    The classification relies on the type and dtype of the column data so that element data is never read from disk.
+    The values of in-memory lists and object arrays are assumed to be homogeneous, so only the first one is inspected.
+    """
+    if isinstance(candidate_dataset, ReferenceResolver):  # References read from an existing file
+        return True
+    if isinstance(candidate_dataset, (AbstractDataChunkIterator, zarr.Array)):
+        return False
+    if isinstance(candidate_dataset, h5py.Dataset):
+        return h5py.check_dtype(ref=candidate_dataset.dtype) is not None
+    if isinstance(candidate_dataset, np.ndarray):
+        if candidate_dataset.dtype != np.dtype("object") or candidate_dataset.size == 0:
+            return False
+        return isinstance(candidate_dataset.flat[0], Container)
+
+    return len(candidate_dataset) > 0 and isinstance(candidate_dataset[0], Container)
+
+
 def get_default_dataset_io_configurations(
     nwbfile: NWBFile,
     backend: None | Literal["hdf5", "zarr"] = None,  # None for auto-detect from append mode, otherwise required
@@ -102,8 +124,8 @@ def get_default_dataset_io_configurations(
         )
 
     known_dataset_fields = ("data", "timestamps")
-    manager = get_manager()
-    builder = manager.build(nwbfile)
+    # Compound dtypes are resolved from the specification rather than by building the entire NWBFile
+    type_map = get_type_map()
     for neurodata_object in nwbfile.objects.values():
         if isinstance(neurodata_object, DynamicTable):
             dynamic_table = neurodata_object  # For readability
@@ -121,7 +143,7 @@ def get_default_dataset_io_configurations(
                     continue  # Skip
 
                 # Skip over columns whose values are links, such as the 'group' of an ElectrodesTable
-                if any(isinstance(value, Container) for value in candidate_dataset):
+                if _is_link_valued_column(candidate_dataset=candidate_dataset):
                     continue  # Skip
 
                 # Skip when columns whose values are a reference type
@@ -136,7 +158,7 @@ def get_default_dataset_io_configurations(
                     continue
 
                 dataset_io_configuration = DatasetIOConfigurationClass.from_neurodata_object(
-                    neurodata_object=column, dataset_name=dataset_name, builder=builder
+                    neurodata_object=column, dataset_name=dataset_name, type_map=type_map
                 )
 
                 yield dataset_io_configuration
@@ -170,7 +192,7 @@ def get_default_dataset_io_configurations(
                     continue
 
                 dataset_io_configuration = DatasetIOConfigurationClass.from_neurodata_object(
-                    neurodata_object=neurodata_object, dataset_name=known_dataset_field, builder=builder
+                    neurodata_object=neurodata_object, dataset_name=known_dataset_field, type_map=type_map
                 )
 
                 yield dataset_io_configuration
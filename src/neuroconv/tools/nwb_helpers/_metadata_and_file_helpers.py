@@ -9,12 +9,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import Literal
 
+import psutil
 from hdmf_zarr import NWBZarrIO
 from pydantic import FilePath
 from pynwb import NWBHDF5IO, NWBFile
 from pynwb.file import Subject
 
 from . import BackendConfiguration, configure_backend, get_default_backend_configuration
+from ..hdmf import ParallelHDF5IODataChunkIteratorQueue
 from ...utils.dict import DeepDict, load_dict_from_file
 from ...utils.json_schema import validate_metadata
 
@@ -391,6 +393,9 @@ def configure_and_write_nwbfile(
     backend_configuration: BackendConfiguration, optional
         Specifies the backend type and the chunking and compression parameters of each dataset. If no
         ``backend_configuration`` is specified, the default configuration for the specified ``backend`` is used.
+        For the HDF5 backend, ``backend_configuration.number_of_jobs`` controls how many threads compress the chunks
+        of iteratively written datasets, and ``backend_configuration.number_of_streams`` how many of these datasets
+        are read and compressed concurrently.
 
     """
 
@@ -421,4 +426,27 @@ def configure_and_write_nwbfile(
     IO = BACKEND_NWB_IO[backend_configuration.backend]
 
     with IO(nwbfile_path, mode="w") as io:
-        io.write(nwbfile)
+        is_parallel_hdf5_write = backend_configuration.backend == "hdf5" and (
+            backend_configuration.number_of_jobs != 1 or backend_configuration.number_of_streams != 1
+        )
+        if is_parallel_hdf5_write and not hasattr(io, "_HDF5IO__dci_queue"):
+            warnings.warn(
+                "This version of HDMF does not expose the queue through which HDF5IO writes DataChunkIterators, so "
+                "'number_of_jobs' and 'number_of_streams' of the backend configuration are ignored and the datasets "
+                "are written serially.",
+                stacklevel=2,
+            )
+            is_parallel_hdf5_write = False
+        if is_parallel_hdf5_write:
+            number_of_jobs = backend_configuration.number_of_jobs
+            number_of_threads = number_of_jobs if number_of_jobs > 0 else psutil.cpu_count() + 1 + number_of_jobs
+
+            # HDF5IO exhausts DataChunkIterators through a private queue; swap in one that compresses in parallel
+            io._HDF5IO__dci_queue = ParallelHDF5IODataChunkIteratorQueue(
+                number_of_jobs=max(number_of_threads, 1),
+                number_of_streams=backend_configuration.number_of_streams,
+            )
+
+        # By default, HDF5IO exhausts each DataChunkIterator as soon as its dataset is created; deferring this to the
+        # end of the write queues all of them at once, so that the streams can be read and compressed concurrently
+        io.write(nwbfile, exhaust_dci=not is_parallel_hdf5_write)
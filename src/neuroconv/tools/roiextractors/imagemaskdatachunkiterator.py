@@ -0,0 +1,152 @@
+"""Iterator over the image masks of a SegmentationExtractor that materializes only a few ROIs at a time."""
+
+import numpy as np
+from roiextractors import SegmentationExtractor
+from tqdm import tqdm
+
+from neuroconv.tools.hdmf import GenericDataChunkIterator
+from neuroconv.tools.iterative_write import (
+    get_image_series_buffer_shape,
+    get_image_series_chunk_shape,
+)
+
+
+class ImageMaskDataChunkIterator(GenericDataChunkIterator):
+    """
+    DataChunkIterator over the image masks of the ROIs (or background components) of a SegmentationExtractor.
+
+    The masks are returned in the NWB convention (num_rois x image_width x image_height). Each buffer is built from the
+    pixel masks of a subset of the ROIs, so that the iterator only holds the dense masks of these ROIs at a time and
+    otherwise scales with the number of pixels of the ROIs. Extractors that store dense image masks themselves still
+    hold all of them in memory.
+    """
+
+    def __init__(
+        self,
+        segmentation_extractor: SegmentationExtractor,
+        roi_ids: list | None = None,
+        background: bool = False,
+        buffer_gb: float | None = None,
+        buffer_shape: tuple | None = None,
+        chunk_mb: float | None = None,
+        chunk_shape: tuple | None = None,
+        display_progress: bool = False,
+        progress_bar_class: tqdm | None = None,
+        progress_bar_options: dict | None = None,
+    ):
+        """
+        Initialize an Iterable object which returns DataChunks with data and their selections on each iteration.
+
+        Parameters
+        ----------
+        segmentation_extractor : SegmentationExtractor
+            The SegmentationExtractor object which handles the data access.
+        roi_ids : list, optional
+            The ids of the ROIs (or of the background components if `background` is True) whose masks are iterated over.
+            The default is all of them.
+        background : bool, default: False
+            Whether to iterate over the masks of the background components instead of those of the ROIs.
+        buffer_gb : float, optional
+            The upper bound on size in gigabytes (GB) of each selection from the iteration.
+            The buffer_shape will be set implicitly by this argument.
+            Cannot be set if `buffer_shape` is also specified.
+            The default is 1GB.
+        buffer_shape : tuple, optional
+            Manual specification of buffer shape to return on each iteration.
+            Must be a multiple of chunk_shape along each axis.
+            Cannot be set if `buffer_gb` is also specified.
+            The default is None.
+        chunk_mb : float, optional
+            The upper bound on size in megabytes (MB) of the internal chunk for the HDF5 dataset.
+            The chunk_shape will be set implicitly by this argument.
+            Cannot be set if `chunk_shape` is also specified.
+            The default is 10MB, as recommended by the HDF5 group.
+        chunk_shape : tuple, optional
+            Manual specification of the internal chunk shape for the HDF5 dataset.
+            Cannot be set if `chunk_mb` is also specified.
+            The default is None.
+        display_progress : bool, default=False
+            Display a progress bar with iteration rate and estimated completion time.
+        progress_bar_class : dict, optional
+            The progress bar class to use.
+            Defaults to tqdm.tqdm if the TQDM package is installed.
+        progress_bar_options : dict, optional
+            Dictionary of keyword arguments to be passed directly to tqdm.
+            See https://github.com/tqdm/tqdm#parameters for options.
+        """
+        self.segmentation_extractor = segmentation_extractor
+        self.background = background
+        if roi_ids is None:
+            roi_ids = (
+                segmentation_extractor.get_background_ids() if background else segmentation_extractor.get_roi_ids()
+            )
+        self.roi_ids = list(roi_ids)
+
+        # The image mask of the first ROI determines the shape and dtype of all masks
+        if background:
+            first_image_mask = segmentation_extractor.get_background_image_masks(background_ids=self.roi_ids[:1])
+        else:
+            first_image_mask = segmentation_extractor.get_roi_image_masks(roi_ids=self.roi_ids[:1])
+        self._sample_shape = first_image_mask.T.shape[1:]
+        self._dtype = first_image_mask.dtype
+
+        assert not (buffer_gb and buffer_shape), "Only one of 'buffer_gb' or 'buffer_shape' can be specified!"
+        assert not (chunk_mb and chunk_shape), "Only one of 'chunk_mb' or 'chunk_shape' can be specified!"
+
+        if chunk_mb and buffer_gb:
+            assert chunk_mb * 1e6 <= buffer_gb * 1e9, "chunk_mb must be less than or equal to buffer_gb!"
+
+        if chunk_mb is None and chunk_shape is None:
+            chunk_mb = 10.0
+
+        if chunk_shape is None:
+            chunk_shape = get_image_series_chunk_shape(
+                num_samples=len(self.roi_ids), sample_shape=self._sample_shape, dtype=self._dtype, chunk_mb=chunk_mb
+            )
+
+        if buffer_gb is None and buffer_shape is None:
+            buffer_gb = 1.0
+
+        if buffer_shape is None:
+            buffer_shape = get_image_series_buffer_shape(
+                chunk_shape=chunk_shape,
+                sample_shape=self._sample_shape,
+                series_shape=self._get_maxshape(),
+                dtype=self._dtype,
+                buffer_gb=buffer_gb,
+            )
+
+        super().__init__(
+            buffer_shape=buffer_shape,
+            chunk_shape=chunk_shape,
+            display_progress=display_progress,
+            progress_bar_class=progress_bar_class,
+            progress_bar_options=progress_bar_options,
+        )
+
+    def _get_image_masks(self, roi_ids: list) -> np.ndarray:
+        """Build the image masks of the given ROIs in the NWB convention from the weights of their pixel masks."""
+        if self.background:
+            pixel_masks = self.segmentation_extractor.get_background_pixel_masks(background_ids=roi_ids)
+        else:
+            pixel_masks = self.segmentation_extractor.get_roi_pixel_masks(roi_ids=roi_ids)
+
+        image_masks = np.zeros(shape=(len(roi_ids), *self._sample_shape), dtype=self._dtype)
+        for roi_index, pixel_mask in enumerate(pixel_masks):
+            # The columns of the pixel masks are the row (height) and column (width) of each pixel, and its weight
+            rows = pixel_mask[:, 0].astype("int64")
+            columns = pixel_mask[:, 1].astype("int64")
+            image_masks[roi_index, columns, rows] = pixel_mask[:, 2]
+
+        return image_masks
+
+    def _get_dtype(self) -> np.dtype:
+        return self._dtype
+
+    def _get_maxshape(self) -> tuple:
+        return (len(self.roi_ids),) + tuple(self._sample_shape)
+
+    def _get_data(self, selection: tuple[slice]) -> np.ndarray:
+        image_masks = self._get_image_masks(roi_ids=self.roi_ids[selection[0]])
+
+        return image_masks[(slice(None),) + selection[1:]]
@@ -24,6 +24,7 @@ class ImagingExtractorDataChunkIterator(GenericDataChunkIterator):
         display_progress: bool = False,
         progress_bar_class: tqdm | None = None,
         progress_bar_options: dict | None = None,
+        prefetch_buffers: int = 0,
     ):
         """
         Initialize an Iterable object which returns DataChunks with data and their selections on each iteration.
@@ -60,8 +61,14 @@ class ImagingExtractorDataChunkIterator(GenericDataChunkIterator):
         progress_bar_options : dict, optional
             Dictionary of keyword arguments to be passed directly to tqdm.
             See https://github.com/tqdm/tqdm#parameters for options.
+        prefetch_buffers : int, default: 0
+            The number of buffers to read ahead on a background thread while the current buffer is being written.
+            At most `prefetch_buffers + 1` buffers are held in memory at once.
+            The default of 0 disables prefetching.
         """
         self.imaging_extractor = imaging_extractor
+        # The most recently read temporal block, as (start_sample, end_sample, frames)
+        self._cached_temporal_block = None
 
         assert not (buffer_gb and buffer_shape), "Only one of 'buffer_gb' or 'buffer_shape' can be specified!"
         assert not (chunk_mb and chunk_shape), "Only one of 'chunk_mb' or 'chunk_shape' can be specified!"
@@ -87,6 +94,7 @@ class ImagingExtractorDataChunkIterator(GenericDataChunkIterator):
             display_progress=display_progress,
             progress_bar_class=progress_bar_class,
             progress_bar_options=progress_bar_options,
+            prefetch_buffers=prefetch_buffers,
         )
 
     def _get_sample_shape(self) -> tuple:
@@ -151,12 +159,29 @@ class ImagingExtractorDataChunkIterator(GenericDataChunkIterator):
         max_shape = (num_frames,) + sample_shape
         return max_shape
 
+    def _get_temporal_block(self, start_sample: int, end_sample: int) -> np.ndarray:
+        """
+        Read the full frames of a temporal block, reusing the most recently read block if it is the same.
+
+        The buffers are iterated with time as the outermost axis, so when the buffer shape does not span the full
+        frame all the spatial tiles of a temporal block are requested in a row and are served from a single read.
+        """
+        if self._cached_temporal_block is not None and self._cached_temporal_block[:2] == (start_sample, end_sample):
+            return self._cached_temporal_block[2]
+
+        data = self.imaging_extractor.get_series(start_sample=start_sample, end_sample=end_sample)
+
+        buffer_spans_full_frame = tuple(self.buffer_shape[1:]) == tuple(self.maxshape[1:])
+        if not buffer_spans_full_frame:
+            self._cached_temporal_block = (start_sample, end_sample, data)
+
+        return data
+
     def _get_data(self, selection: tuple[slice]) -> np.ndarray:
-        data = self.imaging_extractor.get_series(
-            start_sample=selection[0].start,
-            end_sample=selection[0].stop,
-        )
+        data = self._get_temporal_block(start_sample=selection[0].start, end_sample=selection[0].stop)
         tranpose_axes = (0, 2, 1) if len(data.shape) == 3 else (0, 2, 1, 3)
         sliced_selection = (slice(0, self.buffer_shape[0]),) + selection[1:]
 
+        # Both the transposition and the spatial selection are views of the frames; the strided data is written
+        # directly by the backend without an intermediate contiguous copy
         return data.transpose(tranpose_axes)[sliced_selection]
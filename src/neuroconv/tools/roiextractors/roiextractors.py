@@ -6,8 +6,7 @@ from typing import Literal
 
 import numpy as np
 import psutil
-
-# from hdmf.common import VectorData
+from hdmf.common import VectorData, VectorIndex
 from hdmf.data_utils import DataChunkIterator
 from pydantic import FilePath
 from pynwb import NWBFile
@@ -31,6 +30,7 @@ from roiextractors import (
     SegmentationExtractor,
 )
 
+from .imagemaskdatachunkiterator import ImageMaskDataChunkIterator
 from .imagingextractordatachunkiterator import ImagingExtractorDataChunkIterator
 from ..hdmf import SliceableDataChunkIterator
 from ..nwb_helpers import get_default_nwbfile_metadata, get_module, make_or_load_nwbfile
@@ -742,6 +742,8 @@ def add_plane_segmentation_to_nwbfile(
     include_roi_acceptance: bool = True,
     mask_type: Literal["image", "pixel", "voxel"] = "image",
     iterator_options: dict | None = None,
+    image_mask_iterator_type: Literal["v2"] | None = None,
+    image_mask_iterator_options: dict | None = None,
 ) -> NWBFile:
     """
     Adds the plane segmentation specified by the metadata to the image segmentation.
@@ -779,6 +781,14 @@ def add_plane_segmentation_to_nwbfile(
         Specify your choice between these two as mask_type='image', 'pixel', 'voxel'.
     iterator_options : dict, optional
         The options to use when iterating over the image masks of the segmentation extractor.
+    image_mask_iterator_type : {"v2", None}, default: None
+        How the image masks are written when mask_type='image'.
+        'v2' writes them through an ImageMaskDataChunkIterator, which only holds the masks of a few ROIs in memory at a
+        time and is configured by `image_mask_iterator_options`.
+        None loads the image masks of all ROIs into memory.
+    image_mask_iterator_options : dict, optional
+        The options of the ImageMaskDataChunkIterator, such as `buffer_shape` and `chunk_shape` in the
+        (num_rois, width, height) shape of the image masks.
 
     Returns
     -------
@@ -796,7 +806,12 @@ def add_plane_segmentation_to_nwbfile(
     else:
         is_id_accepted, is_id_rejected = None, None
     if mask_type == "image":
-        image_or_pixel_masks = segmentation_extractor.get_roi_image_masks()
+        image_or_pixel_masks = _get_image_masks(
+            segmentation_extractor=segmentation_extractor,
+            background=False,
+            image_mask_iterator_type=image_mask_iterator_type,
+            image_mask_iterator_options=image_mask_iterator_options,
+        )
     elif mask_type == "pixel" or mask_type == "voxel":
         image_or_pixel_masks = segmentation_extractor.get_roi_pixel_masks()
     else:
@@ -827,6 +842,91 @@ def add_plane_segmentation_to_nwbfile(
     return nwbfile
 
 
+def _get_image_masks(
+    segmentation_extractor: SegmentationExtractor,
+    background: bool,
+    image_mask_iterator_type: Literal["v2"] | None = None,
+    image_mask_iterator_options: dict | None = None,
+) -> np.ndarray | ImageMaskDataChunkIterator:
+    """
+    Private auxiliary method to get the image masks of the ROIs or background components of a SegmentationExtractor.
+
+    Parameters
+    ----------
+    segmentation_extractor : SegmentationExtractor
+        The segmentation extractor to get the image masks from.
+    background : bool
+        Whether to get the masks of the background components instead of those of the ROIs.
+    image_mask_iterator_type : {"v2", None}, default: None
+        'v2' wraps the masks in an ImageMaskDataChunkIterator in the NWB convention (num_rois x width x height).
+        None returns all masks in memory in the roiextractors convention (height x width x num_rois).
+    image_mask_iterator_options : dict, optional
+        The options of the ImageMaskDataChunkIterator.
+
+    Returns
+    -------
+    numpy.ndarray or ImageMaskDataChunkIterator
+        The image masks.
+    """
+    assert image_mask_iterator_type in ["v2", None], "'image_mask_iterator_type' must be either 'v2' or None."
+    image_mask_iterator_options = image_mask_iterator_options or dict()
+
+    ids = segmentation_extractor.get_background_ids() if background else segmentation_extractor.get_roi_ids()
+    if image_mask_iterator_type is None or len(ids) == 0:
+        if background:
+            return segmentation_extractor.get_background_image_masks()
+        return segmentation_extractor.get_roi_image_masks()
+
+    return ImageMaskDataChunkIterator(
+        segmentation_extractor=segmentation_extractor,
+        roi_ids=ids,
+        background=background,
+        **image_mask_iterator_options,
+    )
+
+
+def _get_pixel_mask_columns(
+    pixel_masks: list[np.ndarray], mask_type: Literal["pixel", "voxel"]
+) -> tuple[VectorData, VectorIndex]:
+    """
+    Build the ragged pixel (or voxel) mask column of a PlaneSegmentation and its index from the masks of each ROI.
+
+    The masks of all ROIs are concatenated into a single structured array with the compound dtype of the NWB
+    specification, and the index holds the cumulative number of pixels per ROI.
+
+    Parameters
+    ----------
+    pixel_masks : list of numpy.ndarray
+        The mask of each ROI, of shape (number_of_pixels, 3) with columns x, y and weight for pixel masks, or of shape
+        (number_of_voxels, 4) with columns x, y, z and weight for voxel masks.
+    mask_type : {'pixel', 'voxel'}
+        The type of the masks.
+
+    Returns
+    -------
+    tuple of VectorData and VectorIndex
+        The mask column and its index.
+    """
+    coordinate_names = ["x", "y"] if mask_type == "pixel" else ["x", "y", "z"]
+    mask_dtype = np.dtype([(name, "uint32") for name in coordinate_names] + [("weight", "float32")])
+
+    stacked_pixel_masks = np.concatenate(pixel_masks, axis=0)
+    mask_data = np.empty(shape=stacked_pixel_masks.shape[0], dtype=mask_dtype)
+    for field_index, field_name in enumerate(mask_dtype.names):
+        mask_data[field_name] = stacked_pixel_masks[:, field_index]
+
+    mask_column = VectorData(
+        name=f"{mask_type}_mask", description=f"{mask_type.capitalize()} masks for each ROI", data=mask_data
+    )
+    mask_index = VectorIndex(
+        name=f"{mask_type}_mask_index",
+        data=np.cumsum([len(pixel_mask) for pixel_mask in pixel_masks]),
+        target=mask_column,
+    )
+
+    return mask_column, mask_index
+
+
 def _add_plane_segmentation(
     background_or_roi_ids: list[int | str],
     image_or_pixel_masks: np.ndarray,
@@ -886,21 +986,20 @@ def _add_plane_segmentation(
     imaging_plane = nwbfile.imaging_planes[imaging_plane_name]
     plane_segmentation_kwargs = deepcopy(plane_segmentation_metadata)
     plane_segmentation_kwargs.update(imaging_plane=imaging_plane)
-    plane_segmentation = PlaneSegmentation(**plane_segmentation_kwargs)
 
+    # The columns are built in bulk from the arrays rather than through one `add_roi` call per ROI
     roi_names = [str(roi_id) for roi_id in background_or_roi_ids]
-    roi_indices = [background_or_roi_ids.index(roi_id) for roi_id in background_or_roi_ids]
-    plane_segmentation.add_column(
-        name="roi_name",
-        description="The unique identifier for each ROI.",
-    )
+    columns = [VectorData(name="roi_name", description="The unique identifier for each ROI.", data=roi_names)]
 
     if mask_type == "image":
-
-        image_mask_array = image_or_pixel_masks.T
-        for roi_index, roi_name in zip(roi_indices, roi_names):
-            image_mask = image_mask_array[roi_index]
-            plane_segmentation.add_roi(**{"id": roi_index, "roi_name": roi_name, "image_mask": image_mask})
+        # The image mask column is only created when there are ROIs, as when it was created by the first `add_roi`
+        if len(background_or_roi_ids) > 0:
+            # Stacked as num_rois x image_width x image_height; the iterator already follows this convention
+            if isinstance(image_or_pixel_masks, ImageMaskDataChunkIterator):
+                image_mask_data = image_or_pixel_masks
+            else:
+                image_mask_data = image_or_pixel_masks.T
+            columns.append(VectorData(name="image_mask", description="Image masks for each ROI", data=image_mask_data))
 
     else:  # mask_type is "pixel" or "voxel"
         pixel_masks = image_or_pixel_masks
@@ -923,12 +1022,11 @@ def _add_plane_segmentation(
             )
             mask_type = "pixel"
 
-        mask_type_kwarg = f"{mask_type}_mask"
+        columns.extend(_get_pixel_mask_columns(pixel_masks=pixel_masks, mask_type=mask_type))
 
-        for roi_index, roi_name in zip(roi_indices, roi_names):
-            pixel_mask = pixel_masks[roi_index]
-            pixel_mask_to_write = [tuple(x) for x in pixel_mask]
-            plane_segmentation.add_roi(**{"id": roi_index, "roi_name": roi_name, mask_type_kwarg: pixel_mask_to_write})
+    plane_segmentation = PlaneSegmentation(
+        **plane_segmentation_kwargs, id=list(range(len(background_or_roi_ids))), columns=columns
+    )
 
     if include_roi_centroids:
         # ROIExtractors uses height x width x (depth), but NWB uses width x height x depth
@@ -961,6 +1059,8 @@ def add_background_plane_segmentation_to_nwbfile(
     background_plane_segmentation_name: str | None = None,
     mask_type: Literal["image", "pixel", "voxel"] = "image",
     iterator_options: dict | None = None,
+    image_mask_iterator_type: Literal["v2"] | None = None,
+    image_mask_iterator_options: dict | None = None,
 ) -> NWBFile:
     """
     Add background plane segmentation data from a SegmentationExtractor object to an NWBFile.
@@ -979,6 +1079,14 @@ def add_background_plane_segmentation_to_nwbfile(
         Type of mask to use for segmentation; options are "image", "pixel", or "voxel", by default "image".
     iterator_options : dict, optional
         Options for iterating over the segmentation data, by default None.
+    image_mask_iterator_type : {"v2", None}, default: None
+        How the image masks are written when mask_type='image'.
+        'v2' writes them through an ImageMaskDataChunkIterator, which only holds the masks of a few background
+        components in memory at a time; None loads all of them into memory.
+    image_mask_iterator_options : dict, optional
+        The options of the ImageMaskDataChunkIterator, such as `buffer_shape` and `chunk_shape` in the
+        (num_background_components, width, height) shape of the image masks.
+
     Returns
     -------
     NWBFile
@@ -988,7 +1096,12 @@ def add_background_plane_segmentation_to_nwbfile(
     default_plane_segmentation_index = 1
     background_ids = segmentation_extractor.get_background_ids()
     if mask_type == "image":
-        image_or_pixel_masks = segmentation_extractor.get_background_image_masks()
+        image_or_pixel_masks = _get_image_masks(
+            segmentation_extractor=segmentation_extractor,
+            background=True,
+            image_mask_iterator_type=image_mask_iterator_type,
+            image_mask_iterator_options=image_mask_iterator_options,
+        )
     elif mask_type == "pixel" or mask_type == "voxel":
         image_or_pixel_masks = segmentation_extractor.get_background_pixel_masks()
     else:
@@ -1383,6 +1496,8 @@ def add_segmentation_to_nwbfile(
     include_roi_acceptance: bool = True,
     mask_type: Literal["image", "pixel", "voxel"] = "image",
     iterator_options: dict | None = None,
+    image_mask_iterator_type: Literal["v2"] | None = None,
+    image_mask_iterator_options: dict | None = None,
 ) -> NWBFile:
     """
     Add segmentation data from a SegmentationExtractor object to an NWBFile.
@@ -1409,7 +1524,13 @@ def add_segmentation_to_nwbfile(
         Type of mask to use for segmentation; can be either "image" or "pixel", by default "image".
     iterator_options : dict, optional
         Options for iterating over the data, by default None.
-
+    image_mask_iterator_type : {"v2", None}, default: None
+        How the image masks are written when mask_type='image'.
+        'v2' writes them through an ImageMaskDataChunkIterator, which only holds the masks of a few ROIs in memory at a
+        time; None loads the image masks of all ROIs into memory.
+    image_mask_iterator_options : dict, optional
+        The options of the ImageMaskDataChunkIterator, such as `buffer_shape` and `chunk_shape` in the
+        (num_rois, width, height) shape of the image masks. `iterator_options` only apply to the fluorescence traces.
 
     Returns
     -------
@@ -1430,6 +1551,8 @@ def add_segmentation_to_nwbfile(
         include_roi_acceptance=include_roi_acceptance,
         mask_type=mask_type,
         iterator_options=iterator_options,
+        image_mask_iterator_type=image_mask_iterator_type,
+        image_mask_iterator_options=image_mask_iterator_options,
     )
     if include_background_segmentation:
         add_background_plane_segmentation_to_nwbfile(
@@ -1439,6 +1562,8 @@ def add_segmentation_to_nwbfile(
             background_plane_segmentation_name=background_plane_segmentation_name,
             mask_type=mask_type,
             iterator_options=iterator_options,
+            image_mask_iterator_type=image_mask_iterator_type,
+            image_mask_iterator_options=image_mask_iterator_options,
         )
 
     # Add fluorescence traces:
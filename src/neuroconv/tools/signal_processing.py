@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal
+
 import numpy as np
 
 
@@ -59,3 +62,128 @@ def get_falling_frames_from_ttl(trace: np.ndarray, threshold: float | None = Non
     falling_frames = np.where(diff < 0)[0] + 1
 
     return falling_frames
+
+
+def _get_ttl_signs(traces: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """Return the state of each sample relative to the threshold of its channel, as -1 (off), 0 or 1 (on)."""
+    return np.sign(traces - thresholds).astype("int8")
+
+
+def _get_edge_frames_in_buffer(
+    signs: np.ndarray, previous_sign: int | None, buffer_start_frame: int, edges: tuple[str, ...]
+) -> dict[str, np.ndarray]:
+    """Detect the edges within a buffer of one channel, including the one straddling the previous buffer."""
+    if previous_sign is None:
+        diff = np.diff(signs)
+        first_frame = buffer_start_frame + 1
+    else:
+        diff = np.diff(signs, prepend=previous_sign)
+        first_frame = buffer_start_frame
+
+    edge_frames = dict()
+    if "rising" in edges:
+        edge_frames["rising"] = np.where(diff > 0)[0] + first_frame
+    if "falling" in edges:
+        edge_frames["falling"] = np.where(diff < 0)[0] + first_frame
+
+    return edge_frames
+
+
+def get_ttl_frames_from_recording(
+    recording,
+    channel_ids: list[str | int],
+    threshold: float | None = None,
+    edges: tuple[Literal["rising", "falling"], ...] = ("rising", "falling"),
+    segment_index: int = 0,
+    frames_per_buffer: int = 10_000_000,
+    number_of_jobs: int = 1,
+) -> dict[str | int, dict[str, np.ndarray]]:
+    """
+    Return the frame indices of the edges of TTL pulses on several channels of a recording, reading it in buffers.
+
+    The edges are the same as those of `get_rising_frames_from_ttl` and `get_falling_frames_from_ttl` applied to the
+    whole trace of each channel, but only one buffer of frames is held in memory at a time, so multi-day recordings
+    can be processed. All channels are read together in a single pass over the recording, or two passes if the
+    threshold has to be computed.
+
+    Parameters
+    ----------
+    recording : spikeinterface.BaseRecording
+        The recording containing the TTL signals, such as the NIDQ stream of a SpikeGLX session.
+    channel_ids : list of str or int
+        The channels carrying TTL signals.
+    threshold : float, optional
+        The threshold used to distinguish on/off states in the traces.
+        The mean of the trace of each channel is used by default, which requires an additional pass.
+    edges : tuple of {"rising", "falling"}, default: ("rising", "falling")
+        The edges to detect.
+    segment_index : int, default: 0
+        The segment of the recording to process.
+    frames_per_buffer : int, default: 10,000,000
+        The number of frames read at a time.
+    number_of_jobs : int, default: 1
+        The number of threads detecting the edges of the channels of each buffer concurrently.
+
+    Returns
+    -------
+    dict
+        For each channel id, a dictionary with the frame indices of the requested edges under the keys "rising" and
+        "falling".
+    """
+    invalid_edges = set(edges) - {"rising", "falling"}
+    if invalid_edges:
+        message = f"The edges must be 'rising' or 'falling', but received {sorted(invalid_edges)}."
+        raise ValueError(message)
+
+    number_of_frames = recording.get_num_samples(segment_index=segment_index)
+    buffer_bounds = [
+        (start_frame, min(start_frame + frames_per_buffer, number_of_frames))
+        for start_frame in range(0, number_of_frames, frames_per_buffer)
+    ]
+
+    def read_buffer(start_frame: int, end_frame: int) -> np.ndarray:
+        return recording.get_traces(
+            segment_index=segment_index, start_frame=start_frame, end_frame=end_frame, channel_ids=channel_ids
+        )
+
+    if threshold is None:
+        channel_sums = np.zeros(shape=len(channel_ids), dtype="float64")
+        for start_frame, end_frame in buffer_bounds:
+            channel_sums += np.sum(read_buffer(start_frame=start_frame, end_frame=end_frame), axis=0, dtype="float64")
+        thresholds = channel_sums / number_of_frames
+    else:
+        thresholds = np.full(shape=len(channel_ids), fill_value=threshold, dtype="float64")
+
+    edge_frames = {channel_id: {edge: [] for edge in edges} for channel_id in channel_ids}
+    previous_signs = [None] * len(channel_ids)
+
+    def process_channel(channel_index: int, traces: np.ndarray, buffer_start_frame: int) -> None:
+        signs = _get_ttl_signs(traces=traces[:, channel_index], thresholds=thresholds[channel_index])
+        buffer_edge_frames = _get_edge_frames_in_buffer(
+            signs=signs,
+            previous_sign=previous_signs[channel_index],
+            buffer_start_frame=buffer_start_frame,
+            edges=edges,
+        )
+        previous_signs[channel_index] = int(signs[-1])
+        for edge, frames in buffer_edge_frames.items():
+            edge_frames[channel_ids[channel_index]][edge].append(frames)
+
+    with ThreadPoolExecutor(max_workers=number_of_jobs, thread_name_prefix="neuroconv_ttl") as executor:
+        for start_frame, end_frame in buffer_bounds:
+            traces = read_buffer(start_frame=start_frame, end_frame=end_frame)
+            # Each channel is handled by a single task per buffer, so the buffers of a channel stay in order
+            futures = [
+                executor.submit(process_channel, channel_index, traces, start_frame)
+                for channel_index in range(len(channel_ids))
+            ]
+            for future in futures:
+                future.result()
+
+    return {
+        channel_id: {
+            edge: np.concatenate(frames) if frames else np.empty(shape=0, dtype="int64")
+            for edge, frames in channel_edge_frames.items()
+        }
+        for channel_id, channel_edge_frames in edge_frames.items()
+    }
@@ -2,11 +2,12 @@ import uuid
 import warnings
 from collections import defaultdict
 from copy import deepcopy
-from typing import Any, Literal
+from typing import Any, Callable, Literal
 
 import numpy as np
 import psutil
 import pynwb
+from hdmf.common import DynamicTable, DynamicTableRegion, VectorData, VectorIndex
 from hdmf.data_utils import AbstractDataChunkIterator
 from pydantic import FilePath
 from spikeinterface import BaseRecording, BaseSorting, SortingAnalyzer
@@ -15,6 +16,9 @@ from spikeinterface.core.segmentutils import AppendSegmentRecording
 from .spikeinterfacerecordingdatachunkiterator import (
     SpikeInterfaceRecordingDataChunkIterator,
 )
+from .spikeinterfacesortingdatachunkiterator import (
+    SpikeInterfaceSortingSpikeTimesDataChunkIterator,
+)
 from ..nwb_helpers import get_module, make_or_load_nwbfile
 from ...utils import (
     DeepDict,
@@ -122,6 +126,8 @@ def add_sorting_to_nwbfile(
     waveform_sds: np.ndarray | None = None,
     unit_electrode_indices: list[list[int]] | None = None,
     null_values_for_properties: dict | None = None,
+    iterator_type: str | None = None,
+    iterator_opts: dict | None = None,
 ):
     """Add sorting data (units and their properties) to an NWBFile.
 
@@ -160,6 +166,15 @@ def add_sorting_to_nwbfile(
     null_values_for_properties : dict of str to Any
         A dictionary mapping properties to their respective default values. If a property is not found in this
         dictionary, a sensible default value based on the type of `sample_data` will be used.
+    iterator_type : {"v2", None}, default: None
+        The type of DataChunkIterator to use for the spike times.
+        'v2' streams the spike times unit by unit with the SpikeInterfaceSortingSpikeTimesDataChunkIterator when the
+        file is written, which is only supported when writing a new Units table.
+        None: load the spike times of all units in memory.
+    iterator_opts : dict, optional
+        Dictionary of options for the iterator.
+        See https://hdmf.readthedocs.io/en/stable/hdmf.data_utils.html#hdmf.data_utils.GenericDataChunkIterator
+        for the full list of options.
     """
 
     assert write_as in [
@@ -181,6 +196,8 @@ def add_sorting_to_nwbfile(
         waveform_sds=waveform_sds,
         unit_electrode_indices=unit_electrode_indices,
         null_values_for_properties=null_values_for_properties,
+        iterator_type=iterator_type,
+        iterator_opts=iterator_opts,
     )
 
 
@@ -669,7 +686,12 @@ def _get_electrode_table_indices_for_recording(recording: BaseRecording, nwbfile
     group_names = _get_group_name(recording=recording)
     channel_global_ids = [f"{ch_name}_{gr_name}" for ch_name, gr_name in zip(channel_names, group_names)]
     table_global_ids = _get_electrodes_table_global_ids(nwbfile=nwbfile)
-    electrode_table_indices = [table_global_ids.index(ch_id) for ch_id in channel_global_ids]
+
+    # Map each global id to its first position in the table, as `list.index` would
+    global_id_to_table_index = dict()
+    for table_index, global_id in enumerate(table_global_ids):
+        global_id_to_table_index.setdefault(global_id, table_index)
+    electrode_table_indices = [global_id_to_table_index[ch_id] for ch_id in channel_global_ids]
 
     return electrode_table_indices
 
@@ -731,6 +753,79 @@ def _get_null_value_for_property(property: str, sample_data: Any, null_values_fo
     return default_value
 
 
+def _is_in_memory_column(column: VectorData) -> bool:
+    """Whether a column (and its target, for ragged columns) is a plain VectorData backed by an in-memory list or array."""
+    if isinstance(column, VectorIndex):
+        return isinstance(column.data, (list, np.ndarray)) and _is_in_memory_column(column.target)
+
+    return type(column) in (VectorData, DynamicTableRegion) and isinstance(column.data, (list, np.ndarray))
+
+
+def _extend_dynamic_table(table: DynamicTable, column_values: dict[str, list], add_row: Callable) -> None:
+    """
+    Append several rows to a DynamicTable with one `extend` per column instead of one `add_row` per row.
+
+    `DynamicTable.add_row` checks the uniqueness of the id against the full id column and inspects every column for
+    each new row, which makes building a table row by row quadratic in the number of rows. When the table and all
+    its columns hold in-memory lists or arrays (the usual case while a file is being built) the rows are instead
+    appended column-wise. Otherwise (e.g. when appending to a table read from disk) this falls back to calling `add_row`
+    for each row.
+
+    Parameters
+    ----------
+    table : DynamicTable
+        The table to extend. It must already contain all the columns in `column_values`.
+    column_values : dict of str to list
+        Maps each column name of the table to the values of the new rows. All lists must have the same length.
+    add_row : callable
+        The function used to add a single row in the fallback path, e.g. `nwbfile.add_electrode`. It is called with
+        the values of one row as keyword arguments and `enforce_unique_id=True`.
+    """
+    number_of_rows = len(next(iter(column_values.values()), []))
+    if number_of_rows == 0:
+        return
+
+    columns = {name: table[name] for name in table.colnames}
+    can_extend_in_memory = (
+        set(column_values) == set(columns)
+        and isinstance(table.id.data, list)
+        and all(_is_in_memory_column(column) for column in columns.values())
+    )
+    if not can_extend_in_memory:
+        for row_index in range(number_of_rows):
+            row_kwargs = {name: values[row_index] for name, values in column_values.items()}
+            add_row(**row_kwargs, enforce_unique_id=True)
+        return
+
+    # Same default ids as `add_row`, i.e. the row position in the table
+    table_size = len(table.id)
+    new_ids = range(table_size, table_size + number_of_rows)
+    colliding_ids = set(table.id.data).intersection(new_ids)
+    if colliding_ids:
+        raise ValueError(f"id {min(colliding_ids)} already in the table")
+    table.id.extend(list(new_ids))
+
+    for name, column in columns.items():
+        values = column_values[name]
+        if isinstance(column, VectorIndex):
+            # Ragged values are concatenated at once, e.g. the spike times of all the units
+            ends = len(column.target.data) + np.cumsum([len(value) for value in values])
+            new_values = [np.asarray(value) for value in values if len(value) > 0]
+            if new_values and isinstance(column.target.data, list):
+                # The target is kept as a list so that rows can still be added with `add_row` afterwards; extending it
+                # with the array, as `add_row` does, keeps the numpy dtype of the values
+                column.target.extend(np.concatenate(new_values))
+            elif new_values:
+                column.target.transform(lambda data: np.concatenate([data, *new_values]))
+            # Unsigned integers with the smallest sufficient precision, as `VectorIndex` stores them
+            column.transform(lambda data: np.append(data, ends).astype(np.min_scalar_type(ends[-1])))
+        elif isinstance(column.data, np.ndarray):
+            # `Data.extend` stacks arrays vertically, concatenate along the rows as `Data.append` would
+            column.transform(lambda data: np.concatenate([data, np.asarray(values)]))
+        else:
+            column.extend(values)
+
+
 def add_electrodes_to_nwbfile(
     recording: BaseRecording,
     nwbfile: pynwb.NWBFile,
@@ -882,7 +977,7 @@ def add_electrodes_to_nwbfile(
     properties_requiring_null_values = electrode_table_previous_properties.difference(properties_to_add)
     nul_values_for_rows = dict()
     for property in properties_requiring_null_values:
-        sample_data = nwbfile.electrodes[property][:][0]
+        sample_data = nwbfile.electrodes[property][0]
         null_value = _get_null_value_for_property(
             property=property,
             sample_data=sample_data,
@@ -891,17 +986,30 @@ def add_electrodes_to_nwbfile(
         nul_values_for_rows[property] = null_value
 
     # We only add new electrodes to the table
-    existing_global_ids = _get_electrodes_table_global_ids(nwbfile=nwbfile)
+    existing_global_ids = set(_get_electrodes_table_global_ids(nwbfile=nwbfile))
     channel_global_ids = [f"{ch_name}_{gr_name}" for ch_name, gr_name in zip(channel_names, group_names)]
     channel_indices_to_add = [index for index, key in enumerate(channel_global_ids) if key not in existing_global_ids]
 
     properties_with_data = properties_to_add_by_rows.intersection(data_to_add)
-    for channel_index in channel_indices_to_add:
-        electrode_kwargs = nul_values_for_rows
-        data_dict = {property: data_to_add[property]["data"][channel_index] for property in properties_with_data}
-        electrode_kwargs.update(**data_dict)
+    if channel_indices_to_add:
+        # The first electrode goes through `add_electrode` which creates the table and its optional columns
+        first_channel_index, *remaining_channel_indices = channel_indices_to_add
+        electrode_kwargs = dict(nul_values_for_rows)
+        electrode_kwargs.update(
+            {property: data_to_add[property]["data"][first_channel_index] for property in properties_with_data}
+        )
         nwbfile.add_electrode(**electrode_kwargs, enforce_unique_id=True)
 
+        # The remaining electrodes are appended column-wise
+        column_values = {
+            property: [null_value] * len(remaining_channel_indices)
+            for property, null_value in nul_values_for_rows.items()
+        }
+        for property in properties_with_data:
+            data = data_to_add[property]["data"]
+            column_values[property] = [data[channel_index] for channel_index in remaining_channel_indices]
+        _extend_dynamic_table(table=nwbfile.electrodes, column_values=column_values, add_row=nwbfile.add_electrode)
+
     # The channel_name column as we use channel_name, group_name as a unique identifier
     # We fill previously inexistent values with the electrode table ids
     electrode_table_size = len(nwbfile.electrodes.id[:])
@@ -918,9 +1026,10 @@ def add_electrodes_to_nwbfile(
         cols_args["data"] = extended_data
         nwbfile.add_electrode_column("channel_name", **cols_args)
 
-    all_indices = np.arange(electrode_table_size)
     indices_for_new_data = _get_electrode_table_indices_for_recording(recording=recording, nwbfile=nwbfile)
-    indices_for_null_values = [index for index in all_indices if index not in indices_for_new_data]
+    is_null_value = np.ones(electrode_table_size, dtype=bool)
+    is_null_value[indices_for_new_data] = False
+    indices_for_null_values = np.flatnonzero(is_null_value)
     extending_column = len(indices_for_null_values) > 0
 
     # Add properties as columns
@@ -951,7 +1060,6 @@ def add_electrodes_to_nwbfile(
             dtype = np.ndarray
             extended_data = np.empty(shape=electrode_table_size, dtype=dtype)
             for index, value in enumerate(data):
-                index_in_extended_data = indices_for_new_data[index]
                 index_in_extended_data = indices_for_new_data[index]
                 extended_data[index_in_extended_data] = value.tolist()
 
@@ -1471,6 +1579,105 @@ def add_units_table_to_nwbfile(
     )
 
 
+def _get_spike_times_per_unit(sorting: BaseSorting) -> list[np.ndarray]:
+    """
+    Get the spike times of every unit of a sorting, concatenated across segments.
+
+    The spike times of all units are computed at once from the spike vector of the sorting instead of requesting the
+    spike train of each unit and segment separately. Without a registered recording, this requires the start time of
+    each segment, which is not exposed publicly; if it cannot be found, the spike train of each unit and segment is
+    requested instead.
+
+    Parameters
+    ----------
+    sorting : spikeinterface.BaseSorting
+        The sorting from which to extract the spike times.
+
+    Returns
+    -------
+    list of np.ndarray
+        The spike times of each unit, in the order of `sorting.unit_ids`.
+    """
+    num_segments = sorting.get_num_segments()
+    sorting_segments = getattr(sorting, "_sorting_segments", None)
+    has_segment_start_times = sorting_segments is not None and all(
+        hasattr(sorting_segment, "_t_start") for sorting_segment in sorting_segments
+    )
+    if not sorting.has_recording() and not has_segment_start_times:
+        return [
+            np.concatenate(
+                [
+                    sorting.get_unit_spike_train(unit_id=unit_id, segment_index=segment_index, return_times=True)
+                    for segment_index in range(num_segments)
+                ]
+            )
+            for unit_id in sorting.unit_ids
+        ]
+
+    spike_times_per_segment = []
+    unit_indices_per_segment = []
+    for segment_index, spike_vector in enumerate(sorting.to_spike_vector(concatenated=False)):
+        sample_indices = spike_vector["sample_index"]
+        if sorting.has_recording():
+            segment_spike_times = sorting.get_times(segment_index=segment_index)[sample_indices]
+        else:
+            t_start = sorting_segments[segment_index]._t_start
+            t_start = t_start if t_start is not None else 0
+            segment_spike_times = t_start + sample_indices / sorting.get_sampling_frequency()
+        spike_times_per_segment.append(segment_spike_times)
+        unit_indices_per_segment.append(spike_vector["unit_index"])
+
+    spike_times = np.concatenate(spike_times_per_segment)
+    unit_indices = np.concatenate(unit_indices_per_segment)
+
+    # A stable sort keeps the spikes of each unit ordered by segment and then by time
+    order = np.argsort(unit_indices, kind="stable")
+    spike_counts = np.bincount(unit_indices, minlength=sorting.get_num_units())
+    spike_times_per_unit = np.split(spike_times[order], np.cumsum(spike_counts)[:-1])
+
+    return spike_times_per_unit
+
+
+def _add_spike_times_iterator_to_units_table(
+    units_table: pynwb.misc.Units,
+    sorting: BaseSorting,
+    unit_ids: list[str | int],
+    iterator_opts: dict | None = None,
+) -> None:
+    """
+    Add the `spike_times` column to a Units table with its values streamed from the sorting when the file is written.
+
+    Parameters
+    ----------
+    units_table : pynwb.misc.Units
+        The Units table, without a `spike_times` column. If the table has no rows yet, one row is added per unit.
+    sorting : spikeinterface.BaseSorting
+        The SortingExtractor object containing unit data.
+    unit_ids : list of int or str
+        The units of the rows of the table, in order.
+    iterator_opts : dict, optional
+        Dictionary of options for the SpikeInterfaceSortingSpikeTimesDataChunkIterator.
+    """
+    iterator_opts = dict() if iterator_opts is None else iterator_opts
+
+    if len(units_table) == 0:
+        units_table.id.extend(list(range(len(unit_ids))))
+
+    spike_times_iterator = SpikeInterfaceSortingSpikeTimesDataChunkIterator(
+        sorting=sorting, unit_ids=unit_ids, **iterator_opts
+    )
+    unit_ends = spike_times_iterator.unit_ends
+
+    # The column is added with empty rows, then its data is replaced by the iterator and the offsets of each unit
+    description = {column["name"]: column["description"] for column in units_table.__columns__}["spike_times"]
+    units_table.add_column("spike_times", description=description, data=[[] for _ in unit_ids], index=True)
+    if spike_times_iterator.maxshape[0] > 0:
+        units_table["spike_times"].target.transform(lambda data: spike_times_iterator)
+    units_table["spike_times"].transform(
+        lambda data: unit_ends.astype(np.min_scalar_type(unit_ends[-1] if len(unit_ends) > 0 else 0))
+    )
+
+
 def _add_units_table_to_nwbfile(
     sorting: BaseSorting,
     nwbfile: pynwb.NWBFile,
@@ -1484,6 +1691,8 @@ def _add_units_table_to_nwbfile(
     waveform_sds: np.ndarray | None = None,
     unit_electrode_indices: list[list[int]] | None = None,
     null_values_for_properties: dict | None = None,
+    iterator_type: str | None = None,
+    iterator_opts: dict | None = None,
 ):
     """
     Add sorting data to a NWBFile object as a Units table.
@@ -1522,9 +1731,23 @@ def _add_units_table_to_nwbfile(
     unit_electrode_indices : list of lists of int, optional
         A list of lists of integers indicating the indices of the electrodes that each unit is associated with.
         The length of the list must match the number of units in the sorting extractor.
+    iterator_type : {"v2", None}, default: None
+        The type of DataChunkIterator to use for the spike times.
+        'v2' streams the spike times unit by unit with the SpikeInterfaceSortingSpikeTimesDataChunkIterator when the
+        file is written, which is only supported when writing a new Units table.
+        None: load the spike times of all units in memory.
+    iterator_opts : dict, optional
+        Dictionary of options for the iterator.
+        See https://hdmf.readthedocs.io/en/stable/hdmf.data_utils.html#hdmf.data_utils.GenericDataChunkIterator
+        for the full list of options.
     """
     unit_table_description = unit_table_description or "Autogenerated by neuroconv."
 
+    supported_iterator_types = ["v2", None]
+    if iterator_type not in supported_iterator_types:
+        message = f"iterator_type {iterator_type} should be either 'v2' or None"
+        raise ValueError(message)
+
     assert isinstance(
         nwbfile, pynwb.NWBFile
     ), f"'nwbfile' should be of type pynwb.NWBFile but is of type {type(nwbfile)}"
@@ -1559,6 +1782,13 @@ def _add_units_table_to_nwbfile(
             nwbfile.units = pynwb.misc.Units(name="units", description=unit_table_description)
         units_table = nwbfile.units
 
+    if iterator_type is not None and len(units_table) > 0:
+        message = (
+            f"Writing the spike times with an iterator (iterator_type='{iterator_type}') is only supported for a new "
+            f"Units table, but the table '{units_table.name}' already contains {len(units_table)} units."
+        )
+        raise ValueError(message)
+
     default_descriptions = dict(
         isi_violation="Quality metric that measures the ISI violation ratio as a proxy for the purity of the unit.",
         firing_rate="Number of spikes per unit of time.",
@@ -1628,13 +1858,11 @@ def _add_units_table_to_nwbfile(
         )
         null_values_for_row[property] = null_value
 
-    # Special case
-    null_values_for_row["id"] = None
-
     # Add data by rows excluding the rows with previously added unit names
-    unit_names_used_previously = []
+    previous_unit_names = []
     if "unit_name" in units_table_previous_properties:
-        unit_names_used_previously = units_table["unit_name"].data
+        previous_unit_names = np.asarray(units_table["unit_name"][:])
+    unit_names_used_previously = set(previous_unit_names)
     has_electrodes_column = "electrodes" in units_table.colnames
 
     properties_with_data = {property for property in properties_to_add_by_rows if "data" in data_to_add[property]}
@@ -1648,31 +1876,54 @@ def _add_units_table_to_nwbfile(
                 rows_to_add.append(index)
             else:
                 unit_name = unit_name_array[index]
-                previous_electrodes = units_table[np.where(units_table["unit_name"][:] == unit_name)[0]].electrodes
+                previous_electrodes = units_table[np.where(previous_unit_names == unit_name)[0]].electrodes
                 if list(previous_electrodes.values[0]) != list(unit_electrode_indices[index]):
                     rows_to_add.append(index)
 
-    for row in rows_to_add:
-        unit_kwargs = null_values_for_row
+    if rows_to_add:
+        # The values of the new rows are assembled column by column
+        column_values = dict()
+        if iterator_type is None:
+            spike_times_per_unit = _get_spike_times_per_unit(sorting=sorting)
+            column_values["spike_times"] = [spike_times_per_unit[row] for row in rows_to_add]
+        for property, null_value in null_values_for_row.items():
+            column_values[property] = [null_value] * len(rows_to_add)
         for property in properties_with_data:
-            unit_kwargs[property] = data_to_add[property]["data"][row]
-        spike_times = []
-
-        # Extract and concatenate the spike times from multiple segments
-        for segment_index in range(sorting.get_num_segments()):
-            segment_spike_times = sorting.get_unit_spike_train(
-                unit_id=unit_ids[row], segment_index=segment_index, return_times=True
-            )
-            spike_times.append(segment_spike_times)
-        spike_times = np.concatenate(spike_times)
+            data = data_to_add[property]["data"]
+            column_values[property] = [data[row] for row in rows_to_add]
         if waveform_means is not None:
-            unit_kwargs["waveform_mean"] = waveform_means[row]
+            column_values["waveform_mean"] = [waveform_means[row] for row in rows_to_add]
             if waveform_sds is not None:
-                unit_kwargs["waveform_sd"] = waveform_sds[row]
+                column_values["waveform_sd"] = [waveform_sds[row] for row in rows_to_add]
         if unit_electrode_indices is not None:
-            unit_kwargs["electrodes"] = unit_electrode_indices[row]
-
-        units_table.add_unit(spike_times=spike_times, **unit_kwargs, enforce_unique_id=True)
+            column_values["electrodes"] = [unit_electrode_indices[row] for row in rows_to_add]
+
+        # As in `add_unit`, arguments set to None are not written
+        column_values = {
+            property: values for property, values in column_values.items() if any(value is not None for value in values)
+        }
+
+        if len(units_table) == 0:
+            # Create the columns of a new table empty so that all the rows are added in one go below
+            for column in units_table.__columns__:
+                if column["name"] in column_values and column["name"] not in units_table.colnames:
+                    table = nwbfile.electrodes if column.get("table", False) else False
+                    units_table.add_column(
+                        column["name"],
+                        description=column["description"],
+                        data=[],
+                        index=column.get("index", False),
+                        table=table,
+                    )
+        _extend_dynamic_table(table=units_table, column_values=column_values, add_row=units_table.add_unit)
+
+        if iterator_type is not None:
+            _add_spike_times_iterator_to_units_table(
+                units_table=units_table,
+                sorting=sorting,
+                unit_ids=[unit_ids[row] for row in rows_to_add],
+                iterator_opts=iterator_opts,
+            )
 
     # Add unit_name as a column and fill previously existing rows with unit_name equal to str(ids)
     unit_table_size = len(units_table.id[:])
@@ -1688,14 +1939,15 @@ def _add_units_table_to_nwbfile(
         cols_args["data"] = extended_data
         units_table.add_column("unit_name", **cols_args)
 
-    # Build  a channel name to electrode table index map
-    table_df = units_table.to_dataframe().reset_index()
-    unit_name_to_electrode_index = {
-        unit_name: table_df.query(f"unit_name=='{unit_name}'").index[0] for unit_name in unit_name_array
-    }
+    # Build a unit name to units table index map, using the first row with each unit name
+    unit_name_to_table_index = dict()
+    for table_index, unit_name in enumerate(units_table["unit_name"][:]):
+        unit_name_to_table_index.setdefault(unit_name, table_index)
 
-    indices_for_new_data = [unit_name_to_electrode_index[unit_name] for unit_name in unit_name_array]
-    indices_for_null_values = table_df.index.difference(indices_for_new_data).values
+    indices_for_new_data = [unit_name_to_table_index[unit_name] for unit_name in unit_name_array]
+    is_null_value = np.ones(unit_table_size, dtype=bool)
+    is_null_value[indices_for_new_data] = False
+    indices_for_null_values = np.flatnonzero(is_null_value)
     extending_column = len(indices_for_null_values) > 0
 
     # Add properties as columns
@@ -1755,6 +2007,8 @@ def write_sorting_to_nwbfile(
     waveform_means: np.ndarray | None = None,
     waveform_sds: np.ndarray | None = None,
     unit_electrode_indices=None,
+    iterator_type: str | None = None,
+    iterator_opts: dict | None = None,
 ):
     """
     Primary method for writing a SortingExtractor object to an NWBFile.
@@ -1803,6 +2057,15 @@ def write_sorting_to_nwbfile(
         Waveform standard deviation for each unit. Shape: (num_units, num_samples, num_channels).
     unit_electrode_indices : list of lists of int, optional
         For each unit, a list of electrode indices corresponding to waveform data.
+    iterator_type : {"v2", None}, default: None
+        The type of DataChunkIterator to use for the spike times.
+        'v2' streams the spike times unit by unit with the SpikeInterfaceSortingSpikeTimesDataChunkIterator when the
+        file is written, which is only supported when writing a new Units table.
+        None: load the spike times of all units in memory.
+    iterator_opts : dict, optional
+        Dictionary of options for the iterator.
+        See https://hdmf.readthedocs.io/en/stable/hdmf.data_utils.html#hdmf.data_utils.GenericDataChunkIterator
+        for the full list of options.
     """
 
     with make_or_load_nwbfile(
@@ -1820,6 +2083,8 @@ def write_sorting_to_nwbfile(
             waveform_means=waveform_means,
             waveform_sds=waveform_sds,
             unit_electrode_indices=unit_electrode_indices,
+            iterator_type=iterator_type,
+            iterator_opts=iterator_opts,
         )
 
 
@@ -22,6 +22,7 @@ class SpikeInterfaceRecordingDataChunkIterator(GenericDataChunkIterator):
         display_progress: bool = False,
         progress_bar_class: tqdm | None = None,
         progress_bar_options: dict | None = None,
+        prefetch_buffers: int = 0,
     ):
         """
         Initialize an Iterable object which returns DataChunks with data and their selections on each iteration.
@@ -64,6 +65,10 @@ class SpikeInterfaceRecordingDataChunkIterator(GenericDataChunkIterator):
         progress_bar_options : dict, optional
             Dictionary of keyword arguments to be passed directly to tqdm.
             See https://github.com/tqdm/tqdm#parameters for options.
+        prefetch_buffers : int, default: 0
+            The number of buffers to read ahead on a background thread while the current buffer is being written.
+            At most `prefetch_buffers + 1` buffers are held in memory at once.
+            The default of 0 disables prefetching.
         """
         self.recording = recording
         self.segment_index = segment_index
@@ -77,6 +82,7 @@ class SpikeInterfaceRecordingDataChunkIterator(GenericDataChunkIterator):
             display_progress=display_progress,
             progress_bar_class=progress_bar_class,
             progress_bar_options=progress_bar_options,
+            prefetch_buffers=prefetch_buffers,
         )
 
     def _get_default_chunk_shape(self, chunk_mb: float = 10.0) -> tuple[int, int]:
@@ -0,0 +1,149 @@
+from typing import Iterable
+
+import numpy as np
+from spikeinterface import BaseSorting
+from tqdm import tqdm
+
+from neuroconv.tools.hdmf import GenericDataChunkIterator
+
+
+class SpikeInterfaceSortingSpikeTimesDataChunkIterator(GenericDataChunkIterator):
+    """
+    DataChunkIterator over the spike times of a SortingExtractor, flattened as in the `spike_times` column of a Units table.
+
+    The spike times of each unit are concatenated across segments and the units follow each other in the order of
+    `unit_ids`. The spike times are only computed for the units overlapping the current buffer.
+    """
+
+    def __init__(
+        self,
+        sorting: BaseSorting,
+        unit_ids: list[str | int] | None = None,
+        buffer_gb: float | None = None,
+        buffer_shape: tuple | None = None,
+        chunk_mb: float | None = None,
+        chunk_shape: tuple | None = None,
+        display_progress: bool = False,
+        progress_bar_class: tqdm | None = None,
+        progress_bar_options: dict | None = None,
+        prefetch_buffers: int = 0,
+    ):
+        """
+        Initialize an Iterable object which returns DataChunks with data and their selections on each iteration.
+
+        Parameters
+        ----------
+        sorting : spikeinterface.BaseSorting
+            The SortingExtractor object which handles the data access.
+        unit_ids : list of int or str, optional
+            The units to iterate over, in the order of the rows of the Units table.
+            Defaults to all the units of the sorting.
+        buffer_gb : float, optional
+            The upper bound on size in gigabytes (GB) of each selection from the iteration.
+            The buffer_shape will be set implicitly by this argument.
+            Cannot be set if `buffer_shape` is also specified.
+            The default is 1GB.
+        buffer_shape : tuple, optional
+            Manual specification of buffer shape to return on each iteration.
+            Must be a multiple of chunk_shape along each axis.
+            Cannot be set if `buffer_gb` is also specified.
+            The default is None.
+        chunk_mb : float, optional
+            The upper bound on size in megabytes (MB) of the internal chunk for the HDF5 dataset.
+            The chunk_shape will be set implicitly by this argument.
+            Cannot be set if `chunk_shape` is also specified.
+            The default is 10MB, as recommended by the HDF5 group.
+            For more details, search the hdf5 documentation for "Improving IO Performance Compressed Datasets".
+        chunk_shape : tuple, optional
+            Manual specification of the internal chunk shape for the HDF5 dataset.
+            Cannot be set if `chunk_mb` is also specified.
+            The default is None.
+        display_progress : bool, optional
+            Display a progress bar with iteration rate and estimated completion time.
+        progress_bar_class : dict, optional
+            The progress bar class to use.
+            Defaults to tqdm.tqdm if the TQDM package is installed.
+        progress_bar_options : dict, optional
+            Dictionary of keyword arguments to be passed directly to tqdm.
+            See https://github.com/tqdm/tqdm#parameters for options.
+        prefetch_buffers : int, default: 0
+            The number of buffers to read ahead on a background thread while the current buffer is being written.
+            At most `prefetch_buffers + 1` buffers are held in memory at once.
+            The default of 0 disables prefetching.
+        """
+        self.sorting = sorting
+        self.unit_ids = list(sorting.get_unit_ids() if unit_ids is None else unit_ids)
+
+        spike_counts = self._count_spikes_per_unit()
+        self.unit_ends = np.cumsum(spike_counts, dtype="int64")
+        self._cached_unit_index = None
+        self._cached_spike_times = None
+        super().__init__(
+            buffer_gb=buffer_gb,
+            buffer_shape=buffer_shape,
+            chunk_mb=chunk_mb,
+            chunk_shape=chunk_shape,
+            display_progress=display_progress,
+            progress_bar_class=progress_bar_class,
+            progress_bar_options=progress_bar_options,
+            prefetch_buffers=prefetch_buffers,
+        )
+
+    def _count_spikes_per_unit(self) -> list[int]:
+        """
+        Count the spikes of each unit without keeping their spike trains in memory.
+
+        The counts are taken from the spike vector only if the sorting already holds it; otherwise the spike trains
+        are read one at a time without being cached in the sorting, unlike `BaseSorting.count_num_spikes_per_unit`.
+        """
+        if self.sorting._cached_spike_vector is not None:
+            spike_vector = self.sorting.to_spike_vector()
+            counts = np.bincount(spike_vector["unit_index"], minlength=self.sorting.get_num_units())
+            unit_id_to_index = {unit_id: unit_index for unit_index, unit_id in enumerate(self.sorting.get_unit_ids())}
+            return [int(counts[unit_id_to_index[unit_id]]) for unit_id in self.unit_ids]
+
+        return [
+            sum(
+                self.sorting.get_unit_spike_train(unit_id=unit_id, segment_index=segment_index, use_cache=False).size
+                for segment_index in range(self.sorting.get_num_segments())
+            )
+            for unit_id in self.unit_ids
+        ]
+
+    def _get_unit_spike_times(self, unit_index: int) -> np.ndarray:
+        if unit_index != self._cached_unit_index:
+            unit_id = self.unit_ids[unit_index]
+            # Not cached in the sorting, so that only the spike train of the current unit is held in memory
+            self._cached_spike_times = np.concatenate(
+                [
+                    self.sorting.get_unit_spike_train(
+                        unit_id=unit_id, segment_index=segment_index, return_times=True, use_cache=False
+                    )
+                    for segment_index in range(self.sorting.get_num_segments())
+                ]
+            )
+            self._cached_unit_index = unit_index
+
+        return self._cached_spike_times
+
+    def _get_data(self, selection: tuple[slice]) -> Iterable:
+        start, stop = selection[0].start, selection[0].stop
+
+        data = []
+        unit_index = int(np.searchsorted(self.unit_ends, start, side="right"))
+        while unit_index < len(self.unit_ids) and start < stop:
+            unit_start = self.unit_ends[unit_index - 1] if unit_index > 0 else 0
+            unit_end = self.unit_ends[unit_index]
+            if unit_end > unit_start:
+                spike_times = self._get_unit_spike_times(unit_index=unit_index)
+                data.append(spike_times[start - unit_start : min(stop, unit_end) - unit_start])
+            start = unit_end
+            unit_index += 1
+
+        return np.concatenate(data) if data else np.empty(shape=0, dtype=self._get_dtype())
+
+    def _get_dtype(self) -> np.dtype:
+        return np.dtype("float64")
+
+    def _get_maxshape(self) -> tuple[int]:
+        return (int(self.unit_ends[-1]) if len(self.unit_ends) > 0 else 0,)
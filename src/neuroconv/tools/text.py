@@ -1,7 +1,12 @@
+from typing import Callable, Iterator
+
 import numpy as np
 import pandas as pd
+from hdmf.common import VectorIndex
 from pynwb.epoch import TimeIntervals
 
+from .hdmf import GenericDataChunkIterator
+
 
 def convert_df_to_time_intervals(
     df: pd.DataFrame,
@@ -53,7 +58,116 @@ def convert_df_to_time_intervals(
     for col in df:
         if col not in ("start_time", "stop_time"):
             time_intervals.add_column(col, column_descriptions.get(col, col))
-    for i, row in df.iterrows():
-        time_intervals.add_row(row.to_dict())
+
+    # Fill the table column by column instead of row by row. The values are converted exactly as `df.iterrows()` and
+    # `row.to_dict()` would: the rows share the common dtype of all columns and their items are boxed to Python objects
+    values = df.to_numpy()
+    for column_index, column_name in enumerate(df.columns):
+        column_values = list(pd.Series(values[:, column_index], copy=False).to_dict().values())
+        column = time_intervals[column_name]
+        if isinstance(column, VectorIndex):
+            element_counts = [len(cell) for cell in column_values]
+            column.target.extend([element for cell in column_values for element in cell])
+            column.extend((len(column.target) - sum(element_counts) + np.cumsum(element_counts)).tolist())
+        else:
+            column.extend(column_values)
+    time_intervals.id.extend(list(range(len(df))))
 
     return time_intervals
+
+
+class TimeIntervalsColumnDataChunkIterator(GenericDataChunkIterator):
+    """
+    DataChunkIterator over one column of a tabular file that is read sequentially in chunks of rows.
+
+    Only the rows of the current buffer are held in memory. The buffers are expected in order, as they are requested
+    when writing; any other selection restarts the reading from the beginning of the file.
+    """
+
+    def __init__(
+        self,
+        read_column_chunks: Callable[[], Iterator[np.ndarray]],
+        number_of_rows: int,
+        dtype: np.dtype,
+        buffer_shape: tuple | None = None,
+        chunk_shape: tuple | None = None,
+        display_progress: bool = False,
+        progress_bar_class=None,
+        progress_bar_options: dict | None = None,
+    ):
+        """
+        Initialize an Iterable object which returns DataChunks with data and their selections on each iteration.
+
+        Parameters
+        ----------
+        read_column_chunks : callable
+            Function without arguments returning a new iterator over the values of the column, as consecutive
+            one-dimensional arrays.
+        number_of_rows : int
+            The total number of rows of the column.
+        dtype : numpy.dtype
+            The dtype of the written column; each buffer is cast to it.
+        buffer_shape : tuple, optional
+            The number of rows read for each buffer. The default is 100,000 rows.
+        chunk_shape : tuple, optional
+            Manual specification of the internal chunk shape for the HDF5 dataset. Defaults to the buffer shape.
+        display_progress : bool, optional
+            Display a progress bar with iteration rate and estimated completion time.
+        progress_bar_class : dict, optional
+            The progress bar class to use.
+        progress_bar_options : dict, optional
+            Dictionary of keyword arguments to be passed directly to tqdm.
+        """
+        self._read_column_chunks = read_column_chunks
+        self._number_of_rows = number_of_rows
+        self._dtype = np.dtype(dtype)
+
+        self._column_chunks = None
+        self._pending_values = np.empty(shape=0, dtype=self._dtype)
+        self._position = 0
+
+        buffer_shape = buffer_shape or (min(100_000, number_of_rows),)
+        super().__init__(
+            buffer_shape=buffer_shape,
+            chunk_shape=chunk_shape or buffer_shape,
+            display_progress=display_progress,
+            progress_bar_class=progress_bar_class,
+            progress_bar_options=progress_bar_options,
+        )
+
+    def _read_next_rows(self, number_of_rows: int) -> np.ndarray:
+        chunks = [self._pending_values]
+        number_of_read_rows = len(self._pending_values)
+        while number_of_read_rows < number_of_rows:
+            chunk = next(self._column_chunks, None)
+            if chunk is None:
+                break
+            chunks.append(np.asarray(chunk))
+            number_of_read_rows += len(chunk)
+
+        values = np.concatenate(chunks) if len(chunks) > 1 else chunks[0]
+        self._pending_values = values[number_of_rows:]
+        self._position += min(number_of_rows, len(values))
+
+        return values[:number_of_rows]
+
+    def _get_data(self, selection: tuple[slice]) -> np.ndarray:
+        start_row = selection[0].start or 0
+        stop_row = self._number_of_rows if selection[0].stop is None else selection[0].stop
+
+        if self._column_chunks is None or start_row < self._position:
+            self._column_chunks = self._read_column_chunks()
+            self._pending_values = np.empty(shape=0, dtype=self._dtype)
+            self._position = 0
+        if start_row > self._position:
+            self._read_next_rows(number_of_rows=start_row - self._position)
+
+        values = self._read_next_rows(number_of_rows=stop_row - start_row)
+
+        return values.astype(self._dtype, copy=False)
+
+    def _get_dtype(self) -> np.dtype:
+        return self._dtype
+
+    def _get_maxshape(self) -> tuple[int]:
+        return (self._number_of_rows,)
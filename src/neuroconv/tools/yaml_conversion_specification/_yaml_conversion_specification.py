@@ -1,9 +1,13 @@
 import json
 import os
+import textwrap
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from importlib import import_module
 from pathlib import Path
 
 import click
+import psutil
 from jsonschema import validate
 from pydantic import DirectoryPath, FilePath
 from referencing import Registry, Resource
@@ -27,11 +31,21 @@ from ...utils import dict_deep_update, load_dict_from_file
     type=click.Path(writable=True),
 )
 @click.option("--overwrite", help="Overwrite an existing NWBFile at the location.", is_flag=True)
+@click.option(
+    "--number-of-jobs",
+    default=None,
+    help=(
+        "Number of sessions to convert in parallel. Negative values count back from the number of available CPUs. "
+        "Overrides the 'number_of_jobs' field of the specification file."
+    ),
+    type=int,
+)
 def run_conversion_from_yaml_cli(
     specification_file_path: str,
     data_folder_path: str | None = None,
     output_folder_path: str | None = None,
     overwrite: bool = False,
+    number_of_jobs: int | None = None,
 ):
     """
     Run the tool function 'run_conversion_from_yaml' via the command line.
@@ -44,6 +58,7 @@ def run_conversion_from_yaml_cli(
         data_folder_path=data_folder_path,
         output_folder_path=output_folder_path,
         overwrite=overwrite,
+        number_of_jobs=number_of_jobs,
     )
 
 
@@ -52,6 +67,7 @@ def run_conversion_from_yaml(
     data_folder_path: DirectoryPath | None = None,
     output_folder_path: DirectoryPath | None = None,
     overwrite: bool = False,
+    number_of_jobs: int | None = None,
 ) -> None:
     """
     Run conversion to NWB given a yaml specification file.
@@ -69,6 +85,12 @@ def run_conversion_from_yaml(
     overwrite : bool, default: False
         If True, replaces any existing NWBFile at the nwbfile_path location, if save_to_file is True.
         If False, appends the existing NWBFile at the nwbfile_path location, if save_to_file is True.
+    number_of_jobs : int, optional
+        Number of sessions to convert in parallel, each in its own process.
+        Negative values count back from the number of available CPUs; for example, `-1` uses all of them.
+        The default is the 'number_of_jobs' field of the specification file, or 1 (serial conversion) if not set.
+        A failing session does not interrupt the others; once all sessions have been attempted, a summary of the
+        failures is raised as a RuntimeError and the DANDI organization and upload steps are skipped.
     """
     from dandi.organize import create_unique_filenames_from_metadata
     from dandi.pynwb_utils import _get_pynwb_metadata
@@ -113,19 +135,11 @@ def run_conversion_from_yaml(
     global_metadata = specification.get("metadata", dict())
     global_conversion_options = specification.get("conversion_options", dict())
     data_interfaces_spec = specification.get("data_interfaces")
-    data_interfaces_module = import_module(name=".datainterfaces", package="neuroconv")
-    data_interface_classes = {key: getattr(data_interfaces_module, name) for key, name in data_interfaces_spec.items()}
 
-    CustomNWBConverter = type(
-        "CustomNWBConverter", (NWBConverter,), dict(data_interface_classes=data_interface_classes)
-    )
-
-    file_counter = 0
+    session_jobs = list()
     for experiment in specification["experiments"].values():
         experiment_metadata = experiment.get("metadata", dict())
         for session in experiment["sessions"]:
-            file_counter += 1
-
             source_data = session["source_data"]
             for interface_name, interface_source_data in session["source_data"].items():
                 for key, value in interface_source_data.items():
@@ -134,12 +148,6 @@ def run_conversion_from_yaml(
                     elif key in ("file_path", "folder_path"):
                         source_data[interface_name].update({key: str(Path(data_folder_path) / value)})
 
-            converter = CustomNWBConverter(source_data=source_data)
-
-            metadata = converter.get_metadata()
-            for metadata_source in [global_metadata, experiment_metadata, session.get("metadata", dict())]:
-                metadata = dict_deep_update(metadata, metadata_source)
-
             session_id = session.get("metadata", dict()).get("NWBFile", dict()).get("session_id", None)
             if upload_to_dandiset and session_id is None:
                 message = (
@@ -150,18 +158,48 @@ def run_conversion_from_yaml(
                 )
                 raise ValueError(message)
 
-            session_conversion_options = session.get("conversion_options", dict())
-            conversion_options = dict()
-            for key in converter.data_interface_objects:
-                conversion_options[key] = dict(session_conversion_options.get(key, dict()), **global_conversion_options)
-
-            nwbfile_name = session.get("nwbfile_name", f"temp_nwbfile_name_{file_counter}").strip(".nwb")
-            converter.run_conversion(
+            nwbfile_name = session.get("nwbfile_name", f"temp_nwbfile_name_{len(session_jobs) + 1}").strip(".nwb")
+            session_job = dict(
+                data_interfaces_spec=data_interfaces_spec,
+                source_data=source_data,
+                metadata_sources=[global_metadata, experiment_metadata, session.get("metadata", dict())],
+                session_conversion_options=session.get("conversion_options", dict()),
+                global_conversion_options=global_conversion_options,
                 nwbfile_path=output_folder_path / f"{nwbfile_name}.nwb",
-                metadata=metadata,
                 overwrite=overwrite,
-                conversion_options=conversion_options,
             )
+            session_jobs.append(session_job)
+
+    number_of_jobs = number_of_jobs if number_of_jobs is not None else specification.get("number_of_jobs", 1)
+    max_workers = number_of_jobs if number_of_jobs > 0 else psutil.cpu_count() + 1 + number_of_jobs
+    max_workers = min(max(max_workers, 1), len(session_jobs))
+    failed_sessions = dict()
+    if max_workers <= 1:
+        for session_job in session_jobs:
+            error_message = _run_isolated_session_conversion(**session_job)
+            if error_message is not None:
+                failed_sessions[session_job["nwbfile_path"]] = error_message
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            future_to_nwbfile_path = {
+                executor.submit(_run_isolated_session_conversion, **session_job): session_job["nwbfile_path"]
+                for session_job in session_jobs
+            }
+            for future in as_completed(future_to_nwbfile_path):
+                error_message = future.result()
+                if error_message is not None:
+                    failed_sessions[future_to_nwbfile_path[future]] = error_message
+
+    if failed_sessions:
+        failure_summary = "\n".join(
+            f"  {nwbfile_path.name}:\n{textwrap.indent(error_message, prefix='    ')}"
+            for nwbfile_path, error_message in failed_sessions.items()
+        )
+        message = (
+            f"{len(failed_sessions)} of {len(session_jobs)} sessions failed to convert; "
+            f"the DANDI organization and upload steps were skipped.\n{failure_summary}"
+        )
+        raise RuntimeError(message)
 
     if upload_to_dandiset:
         dandiset_id = specification["upload_to_dandiset"]
@@ -198,3 +236,57 @@ def run_conversion_from_yaml(
 
             # Rename file on system
             nwbfile_path_to_set.rename(str(output_folder_path / dandi_filename))
+
+
+def _run_session_conversion(
+    data_interfaces_spec: dict[str, str],
+    source_data: dict,
+    metadata_sources: list[dict],
+    session_conversion_options: dict,
+    global_conversion_options: dict,
+    nwbfile_path: Path,
+    overwrite: bool,
+) -> None:
+    """
+    Private helper for converting a single session of a YAML specification.
+
+    Only takes picklable arguments so that it can be dispatched to a worker process.
+    """
+    data_interfaces_module = import_module(name=".datainterfaces", package="neuroconv")
+    data_interface_classes = {key: getattr(data_interfaces_module, name) for key, name in data_interfaces_spec.items()}
+
+    CustomNWBConverter = type(
+        "CustomNWBConverter", (NWBConverter,), dict(data_interface_classes=data_interface_classes)
+    )
+    converter = CustomNWBConverter(source_data=source_data)
+
+    metadata = converter.get_metadata()
+    for metadata_source in metadata_sources:
+        metadata = dict_deep_update(metadata, metadata_source)
+
+    conversion_options = dict()
+    for key in converter.data_interface_objects:
+        conversion_options[key] = dict(session_conversion_options.get(key, dict()), **global_conversion_options)
+
+    converter.run_conversion(
+        nwbfile_path=nwbfile_path,
+        metadata=metadata,
+        overwrite=overwrite,
+        conversion_options=conversion_options,
+    )
+
+
+def _run_isolated_session_conversion(**session_job) -> str | None:
+    """
+    Private helper for converting a single session without propagating its exceptions.
+
+    Not every exception can be pickled back from a worker process (pydantic validation errors, for example), and a
+    failure to do so would break the entire pool; the error is instead returned as its formatted traceback.
+    """
+    try:
+        _run_session_conversion(**session_job)
+    except Exception as exception:
+        error_lines = traceback.format_exception(type(exception), exception, exception.__traceback__)
+        return "".join(error_lines).strip()
+
+    return None
@@ -136,7 +136,7 @@ def dict_deep_update(
     remove_repeats: bool
         for updating list in d[key] with list in u[key]: if true then remove repeats: list(set(ls))
     copy: bool
-        whether to deepcopy the input dict d
+        whether to deepcopy the input dict d. If False, d and its nested dictionaries and lists are updated in place.
     compare_key: str
         the key that is used to compare dicts (and perform update op) and update d[key] when it is a list if dicts.
         example::
@@ -180,34 +180,131 @@ def dict_deep_update(
         return the updated dictionary
     """
 
-    dict_to_update, dict_with_update_values = d, u
-    if not isinstance(dict_to_update, collections.abc.Mapping):
+    if not isinstance(d, collections.abc.Mapping):
         warnings.warn("input to update should be a dict, returning output")
-        return dict_with_update_values
+        return u
+
+    # The input is copied once here; the nested dictionaries of the copy are then updated in place
+    dict_to_update = deepcopy(d) if copy else d
+    _dict_deep_update_in_place(
+        dict_to_update=dict_to_update,
+        dict_with_update_values=u,
+        append_list=append_list,
+        remove_repeats=remove_repeats,
+        compare_key=compare_key,
+        list_dict_deep_update=list_dict_deep_update,
+    )
 
-    if copy:
-        dict_to_update = deepcopy(dict_to_update)
+    return dict_to_update
+
+
+def _dict_deep_update_in_place(
+    dict_to_update: dict[str, Any],
+    dict_with_update_values: dict[str, Any],
+    append_list: bool = True,
+    remove_repeats: bool = True,
+    compare_key: str = "name",
+    list_dict_deep_update: bool = True,
+) -> None:
+    """
+    Perform the update of `dict_deep_update` on a dictionary that is owned by the caller, without copying it.
 
+    The values of `dict_with_update_values` are never modified; its nested dictionaries are rebuilt when they are
+    inserted, while other values (and the dictionaries appended to lists) are inserted by reference.
+    """
     for key_to_update, update_values in dict_with_update_values.items():
         # Update with a dict like object is recursive until an empty dict is found.
+        # As in previous versions, the compare key and list update mode are not propagated to the nested levels.
         if isinstance(update_values, collections.abc.Mapping):
-            sub_dict_to_update = dict_to_update.get(key_to_update, dict())
-            sub_dict_with_update_values = update_values
-            dict_to_update[key_to_update] = dict_deep_update(
-                sub_dict_to_update, sub_dict_with_update_values, append_list=append_list, remove_repeats=remove_repeats
+            sub_dict_to_update = dict_to_update[key_to_update] if key_to_update in dict_to_update else dict()
+            if not isinstance(sub_dict_to_update, collections.abc.Mapping):
+                warnings.warn("input to update should be a dict, returning output")
+                dict_to_update[key_to_update] = update_values
+                continue
+
+            _dict_deep_update_in_place(
+                dict_to_update=sub_dict_to_update,
+                dict_with_update_values=update_values,
+                append_list=append_list,
+                remove_repeats=remove_repeats,
             )
+            dict_to_update[key_to_update] = sub_dict_to_update
         # Update with list calls the append_replace_dict_in_list function
         elif append_list and isinstance(update_values, list):
-            for value in update_values:
-                dict_or_list_of_dicts = dict_to_update.get(key_to_update, [])
-                dict_to_update[key_to_update] = append_replace_dict_in_list(
-                    dict_or_list_of_dicts, value, compare_key, list_dict_deep_update, remove_repeats
-                )
+            if len(update_values) == 0:  # Nothing to append, so the key is left as is
+                continue
+
+            list_to_update = dict_to_update.get(key_to_update, [])
+            dict_to_update[key_to_update] = _update_list(
+                list_to_update=list_to_update,
+                update_values=update_values,
+                compare_key=compare_key,
+                list_dict_deep_update=list_dict_deep_update,
+                remove_repeats=remove_repeats,
+            )
         # Update with something else
         else:
             dict_to_update[key_to_update] = update_values
 
-    return dict_to_update
+
+def _update_list(
+    list_to_update: list[Any],
+    update_values: list[Any],
+    compare_key: str,
+    list_dict_deep_update: bool,
+    remove_repeats: bool,
+) -> list[Any]:
+    """
+    Update a list with each of the values of another as `append_replace_dict_in_list` does.
+
+    When both lists only hold dictionaries, those to update are looked up through an index of their `compare_key`
+    values instead of scanning the list for each of the update values.
+    """
+    positions_by_compare_value = None
+    if isinstance(list_to_update, list) and all(
+        isinstance(value, collections.abc.Mapping) for value in list_to_update + update_values
+    ):
+        try:
+            positions_by_compare_value = defaultdict(list)
+            for position, dict_in_list in enumerate(list_to_update):
+                positions_by_compare_value[dict_in_list[compare_key]].append(position)
+            for value in update_values:
+                hash(value[compare_key])
+        # Dictionaries without the compare key or with unhashable compare values are handled as before
+        except (KeyError, TypeError):
+            positions_by_compare_value = None
+
+    if positions_by_compare_value is None:
+        for value in update_values:
+            list_to_update = append_replace_dict_in_list(
+                list_to_update, value, compare_key, list_dict_deep_update, remove_repeats
+            )
+        return list_to_update
+
+    # The dictionaries appended from the update values, and those already updated (which may now hold some of the
+    # update values), are copied before being updated so that the update values are never modified
+    positions_to_copy = set()
+    for value in update_values:
+        compare_value = value[compare_key]
+        positions = positions_by_compare_value.get(compare_value, [])
+        if len(positions) == 0:
+            positions_by_compare_value[compare_value].append(len(list_to_update))
+            positions_to_copy.add(len(list_to_update))
+            list_to_update.append(value)
+            continue
+
+        for position in positions:
+            if list_dict_deep_update:
+                dict_in_list = list_to_update[position]
+                if position in positions_to_copy:
+                    dict_in_list = deepcopy(dict_in_list)
+                _dict_deep_update_in_place(dict_to_update=dict_in_list, dict_with_update_values=value)
+                list_to_update[position] = dict_in_list
+            else:
+                list_to_update[position] = value
+            positions_to_copy.add(position)
+
+    return list_to_update
 
 
 class DeepDict(defaultdict):
@@ -251,8 +348,17 @@ class DeepDict(defaultdict):
 
         return _to_dict(self)
 
-    def __deepcopy__(self, memodict: dict = {}) -> "DeepDict":
-        return DeepDict(deepcopy(self.to_dict()))
+    def __deepcopy__(self, memodict: dict | None = None) -> "DeepDict":
+        # Copy in a single pass instead of round-tripping through `to_dict` and the recursive conversion of `__init__`
+        memodict = {} if memodict is None else memodict
+        deep_dict_copy = DeepDict()
+        memodict[id(self)] = deep_dict_copy
+        for key, value in self.items():
+            if isinstance(value, dict) and not isinstance(value, DeepDict):
+                value = DeepDict(value)
+            deep_dict_copy[key] = deepcopy(value, memodict)
+
+        return deep_dict_copy
 
     def __repr__(self) -> str:
         return f"DeepDict({repr(self.to_dict())})"
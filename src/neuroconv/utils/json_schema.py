@@ -2,7 +2,10 @@ import collections.abc
 import inspect
 import json
 import warnings
+import weakref
+from copy import deepcopy
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Type
 
@@ -12,6 +15,9 @@ import numpy as np
 import pydantic
 import pynwb
 from jsonschema import validate
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 from pynwb.device import Device
 from pynwb.icephys import IntracellularElectrode
 
@@ -122,12 +128,19 @@ def get_base_schema(
     return base_schema
 
 
+# The JSON schemas of each method, keyed by the method and then by its excluded arguments
+_JSON_SCHEMAS_FROM_METHOD_SIGNATURES = weakref.WeakKeyDictionary()
+
+
 def get_json_schema_from_method_signature(method: Callable, exclude: list[str] | None = None) -> dict[str, Any]:
     """
     Get the equivalent JSON schema for a signature of a method.
 
     Also uses `docstring_parser` (NumPy style) to attempt to find descriptions for the arguments.
 
+    The schema of each method is generated once and a copy of it is returned on later calls, since building the
+    Pydantic model and parsing the docstring dominate the cost of creating and validating interfaces and converters.
+
     Parameters
     ----------
     method : callable
@@ -141,9 +154,29 @@ def get_json_schema_from_method_signature(method: Callable, exclude: list[str] |
     json_schema : dict
         The JSON schema corresponding to the method signature.
     """
-    exclude = exclude or []
-    exclude += ["self", "cls"]
+    exclude = tuple(exclude or []) + ("self", "cls")
+
+    # Bound methods are created on each attribute access, but share the schema of their underlying function
+    method_key = getattr(method, "__func__", method)
+    try:
+        schemas_of_method = _JSON_SCHEMAS_FROM_METHOD_SIGNATURES.setdefault(method_key, dict())
+    except TypeError:  # The method cannot be weakly referenced, so its schema is not cached
+        schemas_of_method = dict()
+
+    if exclude not in schemas_of_method:
+        schemas_of_method[exclude] = _get_json_schema_from_method_signature(method=method, exclude=exclude)
+    json_schema, docstring_warnings = schemas_of_method[exclude]
 
+    for message in docstring_warnings:
+        warnings.warn(message=message, stacklevel=2)
+
+    return deepcopy(json_schema)
+
+
+def _get_json_schema_from_method_signature(
+    method: Callable, exclude: tuple[str, ...]
+) -> tuple[dict[str, Any], list[str]]:
+    """Generate the JSON schema of a method along with the warnings about mismatches with its docstring."""
     split_qualname = method.__qualname__.split(".")[-2:]
     method_display = ".".join(split_qualname) if "<" not in split_qualname[0] else method.__name__
 
@@ -187,6 +220,7 @@ def get_json_schema_from_method_signature(method: Callable, exclude: list[str] |
     json_schema["additionalProperties"] = additional_properties
 
     # Attempt to find descriptions within the docstring of the method
+    docstring_warnings = []
     parsed_docstring = docstring_parser.parse(method.__doc__)
     for parameter_in_docstring in parsed_docstring.params:
         if parameter_in_docstring.arg_name in exclude:
@@ -197,7 +231,7 @@ def get_json_schema_from_method_signature(method: Callable, exclude: list[str] |
                 f"The argument_name '{parameter_in_docstring.arg_name}' from the docstring of method "
                 f"'{method_display}' does not occur in the signature, possibly due to a typo."
             )
-            warnings.warn(message=message, stacklevel=2)
+            docstring_warnings.append(message)
             continue
 
         if parameter_in_docstring.description is not None:
@@ -206,7 +240,7 @@ def get_json_schema_from_method_signature(method: Callable, exclude: list[str] |
             )
     # TODO: could also add Field support for more direct control over docstrings (and enhanced validation conditions)
 
-    return json_schema
+    return json_schema, docstring_warnings
 
 
 def _copy_without_title_keys(d: Any) -> dict[str, Any] | None:
@@ -404,6 +438,36 @@ def get_metadata_schema_for_icephys() -> dict[str, Any]:
     return schema
 
 
+@lru_cache(maxsize=128)
+def _get_compiled_validator(serialized_schema: str) -> Validator:
+    """Check a serialized JSON schema against its meta-schema and compile a validator for it, once per schema."""
+    schema = json.loads(serialized_schema)
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+
+    return validator_class(schema)
+
+
+def _validate_against_schema(instance: Any, schema: dict[str, Any]) -> None:
+    """
+    Validate an instance against a JSON schema, raising the same errors as `jsonschema.validate`.
+
+    Checking the schema against its meta-schema and building the validator dominate the cost of `jsonschema.validate`,
+    so the compiled validators (e.g. `Draft7Validator` instances) are reused for equal schemas.
+    """
+    try:
+        # The default values filled in the schemas may not be JSON serializable, but do not affect the validation
+        serialized_schema = json.dumps(schema, sort_keys=True, default=str)
+    except TypeError:  # Keys that cannot be sorted, such as a mix of strings and integers
+        validate(instance=instance, schema=schema)
+        return
+
+    validator = _get_compiled_validator(serialized_schema=serialized_schema)
+    error = best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
+
+
 def validate_metadata(metadata: dict[str, dict], schema: dict[str, dict], verbose: bool = False):
     """Validate metadata against a schema."""
     encoder = _NWBMetaDataEncoder()
@@ -411,6 +475,6 @@ def validate_metadata(metadata: dict[str, dict], schema: dict[str, dict], verbos
 
     serialized_metadata = encoder.encode(metadata)
     decoded_metadata = json.loads(serialized_metadata)
-    validate(instance=decoded_metadata, schema=schema)
+    _validate_against_schema(instance=decoded_metadata, schema=schema)
     if verbose:
         print("Metadata is valid!")
@@ -0,0 +1,9 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_metadata_cache(tmp_path_factory, monkeypatch):
+    """Never read from or write to the metadata cache of the user, which is only used if a test enables it."""
+    cache_directory = tmp_path_factory.mktemp("metadata_cache")
+    monkeypatch.setenv("NEUROCONV_METADATA_CACHE_DIRECTORY", str(cache_directory))
+    monkeypatch.delenv("NEUROCONV_ENABLE_METADATA_CACHE", raising=False)
@@ -43,10 +43,13 @@ class TestImportStructure(TestCase):
             "BaseDataInterface",
             "BaseTemporalAlignmentInterface",
             "BaseExtractorInterface",
-            "run_conversion_from_yaml",
             "get_format_summaries",
+            # Lazy loading of the YAML runner
+            "__getattr__",
+            "__dir__",
         ]
         assert sorted(current_structure) == sorted(expected_structure)
+        assert "run_conversion_from_yaml" in dir(neuroconv)
 
     def test_tools(self):
         """Python dir() calls (and __dict__ as well) update dynamically based on global imports."""
@@ -54,8 +57,6 @@ class TestImportStructure(TestCase):
 
         current_structure = _strip_magic_module_attributes(ls=tools.__dict__)
         expected_structure = [
-            # Sub-Packages
-            "yaml_conversion_specification",  # Attached to namespace  by top __init__ call of NWBConverter
             # Sub-modules
             "importing",  # Attached to namespace by importing get_package
             "hdmf",
@@ -69,7 +70,6 @@ class TestImportStructure(TestCase):
             "get_package_version",
             "is_package_installed",
             "deploy_process",
-            "data_transfers",
             "LocalPathExpander",
             "get_module",
             "configure_and_write_nwbfile",
@@ -77,15 +77,26 @@ class TestImportStructure(TestCase):
         assert sorted(current_structure) == sorted(expected_structure)
 
     def test_datainterfaces(self):
+        """The interfaces are imported lazily, so they are only listed by dir() until they are accessed."""
         from neuroconv import datainterfaces
 
         current_structure = _strip_magic_module_attributes(ls=datainterfaces.__dict__)
+        expected_structure = [
+            "_import_module",
+            "_INTERFACE_MODULES",
+            "_INTERFACE_NAMES",
+            "_get_interfaces_by_category",
+            "__getattr__",
+            "__dir__",
+        ]
+        assert sorted(current_structure) == sorted(expected_structure)
 
         from neuroconv.datainterfaces import interface_list
 
         interface_name_list = [interface.__name__ for interface in interface_list]
+        current_structure = [name for name in dir(datainterfaces) if not name.startswith("_")]
         expected_structure = [
-            # Sub-modules
+            # Sub-modules, attached to the namespace by the imports of the interfaces
             "behavior",
             "ecephys",
             "icephys",
@@ -160,3 +160,32 @@ class TestNWBConverterAndPipeInitialization(unittest.TestCase):
         data_interface_names = list(converter.data_interface_objects.keys())
         expected_interface_names = ["InterfaceA001", "InterfaceB", "InterfaceA002"]
         self.assertListEqual(data_interface_names, expected_interface_names)
+
+
+def test_run_conversion_gets_the_metadata_of_each_interface_once(tmp_path):
+    class CountingInterface(BaseDataInterface):
+        def __init__(self):
+            super().__init__()
+            self.number_of_metadata_calls = 0
+
+        def get_metadata(self):
+            self.number_of_metadata_calls += 1
+            metadata = super().get_metadata()
+            metadata["NWBFile"]["session_start_time"] = datetime(2020, 1, 1).astimezone()
+            return metadata
+
+        def add_to_nwbfile(self, nwbfile: NWBFile, metadata: dict):
+            pass
+
+    interface_a = CountingInterface()
+    interface_b = CountingInterface()
+    converter = ConverterPipe(data_interfaces=dict(InterfaceA=interface_a, InterfaceB=interface_b))
+
+    converter.run_conversion(nwbfile_path=tmp_path / "test.nwb")
+
+    assert interface_a.number_of_metadata_calls == 1
+    assert interface_b.number_of_metadata_calls == 1
+
+    # Outside of run_conversion, the metadata is not memoized
+    converter.get_metadata()
+    assert interface_a.number_of_metadata_calls == 2
@@ -12,6 +12,7 @@ from pynwb.image import ImageSeries
 from pynwb.misc import Units
 from pynwb.testing.mock.base import mock_TimeSeries
 from pynwb.testing.mock.behavior import mock_SpatialSeries
+from pynwb.testing.mock.ecephys import mock_ElectrodeGroup
 from pynwb.testing.mock.file import mock_NWBFile
 
 from neuroconv.tools.hdmf import SliceableDataChunkIterator
@@ -118,6 +119,21 @@ def test_configuration_on_dynamic_table(iterator: callable, backend: Literal["hd
         assert dataset_configuration.filter_options is None
 
 
+@pytest.mark.parametrize("backend", ["hdf5", "zarr"])
+def test_configuration_skips_link_valued_columns(backend: Literal["hdf5", "zarr"]):
+    nwbfile = mock_NWBFile()
+    electrode_group = mock_ElectrodeGroup(nwbfile=nwbfile)
+    for _ in range(3):
+        nwbfile.add_electrode(group=electrode_group, location="unknown")
+
+    dataset_configurations = list(get_default_dataset_io_configurations(nwbfile=nwbfile, backend=backend))
+
+    locations_in_file = [dataset_configuration.location_in_file for dataset_configuration in dataset_configurations]
+    assert "electrodes/group/data" not in locations_in_file
+    assert "electrodes/group_name/data" in locations_in_file
+    assert "electrodes/location/data" in locations_in_file
+
+
 @pytest.mark.parametrize("backend", ["hdf5", "zarr"])
 def test_configuration_on_ragged_units_table(backend: Literal["hdf5", "zarr"]):
     nwbfile = mock_NWBFile()
@@ -0,0 +1,210 @@
+"""Integration tests for writing HDF5 files with chunks compressed in parallel."""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import h5py
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+from pynwb import NWBHDF5IO
+from pynwb.testing.mock.base import mock_TimeSeries
+from pynwb.testing.mock.file import mock_NWBFile
+
+from neuroconv.tools.hdmf import (
+    ParallelHDF5IODataChunkIteratorQueue,
+    SliceableDataChunkIterator,
+)
+from neuroconv.tools.nwb_helpers import (
+    _metadata_and_file_helpers,
+    configure_and_write_nwbfile,
+    get_default_backend_configuration,
+)
+
+
+@pytest.mark.parametrize(
+    "shape,dtype,chunk_shape,buffer_shape",
+    [
+        ((1_000, 37), "int16", (100, 10), (300, 20)),  # Buffers and dataset edges do not align with chunks
+        ((1_000,), "float64", (128,), (512,)),
+        ((20, 15, 7), "uint8", (4, 15, 7), (8, 15, 7)),
+    ],
+)
+@pytest.mark.parametrize("compression_method", ["gzip", None])
+def test_parallel_hdf5_write_matches_serial_write(
+    tmp_path: Path,
+    shape: tuple[int, ...],
+    dtype: str,
+    chunk_shape: tuple[int, ...],
+    buffer_shape: tuple[int, ...],
+    compression_method: str | None,
+):
+    random_number_generator = np.random.default_rng(seed=0)
+    array = (random_number_generator.random(size=shape) * 100).astype(dtype)
+
+    nwbfile_paths = dict()
+    for number_of_jobs in (1, -1):
+        data = SliceableDataChunkIterator(data=array, chunk_shape=chunk_shape, buffer_shape=buffer_shape)
+        nwbfile = mock_NWBFile()
+        nwbfile.add_acquisition(mock_TimeSeries(name="TestTimeSeries", data=data))
+
+        backend_configuration = get_default_backend_configuration(nwbfile=nwbfile, backend="hdf5")
+        backend_configuration.number_of_jobs = number_of_jobs
+        dataset_configuration = backend_configuration.dataset_configurations["acquisition/TestTimeSeries/data"]
+        dataset_configuration.chunk_shape = chunk_shape
+        dataset_configuration.buffer_shape = buffer_shape
+        dataset_configuration.compression_method = compression_method
+
+        nwbfile_paths[number_of_jobs] = tmp_path / f"test_parallel_hdf5_write_{number_of_jobs}.nwb"
+        configure_and_write_nwbfile(
+            nwbfile=nwbfile, nwbfile_path=nwbfile_paths[number_of_jobs], backend_configuration=backend_configuration
+        )
+
+    with NWBHDF5IO(path=nwbfile_paths[-1], mode="r") as io:
+        written_data = io.read().acquisition["TestTimeSeries"].data
+
+        assert written_data.chunks == chunk_shape
+        assert written_data.compression == compression_method
+        assert_array_equal(written_data[:], array)
+
+    # Direct chunk writes should produce the same bytes on disk as the standard filter pipeline
+    with h5py.File(nwbfile_paths[1], mode="r") as serial_file, h5py.File(nwbfile_paths[-1], mode="r") as parallel_file:
+        serial_dataset = serial_file["acquisition/TestTimeSeries/data"]
+        parallel_dataset = parallel_file["acquisition/TestTimeSeries/data"]
+        assert serial_dataset.id.get_num_chunks() == parallel_dataset.id.get_num_chunks()
+        for chunk_index in range(serial_dataset.id.get_num_chunks()):
+            chunk_offset = serial_dataset.id.get_chunk_info(chunk_index).chunk_offset
+            assert serial_dataset.id.read_direct_chunk(chunk_offset) == parallel_dataset.id.read_direct_chunk(
+                chunk_offset
+            )
+
+
+@pytest.mark.parametrize("compression_method", ["gzip", None])
+def test_concurrent_streams_hdf5_write_matches_serial_write(
+    tmp_path: Path, compression_method: str | None, monkeypatch: pytest.MonkeyPatch
+):
+    # Record how many streams are pending each time they are exhausted concurrently
+    numbers_of_concurrent_streams = list()
+    exhaust_streams_concurrently = ParallelHDF5IODataChunkIteratorQueue._exhaust_streams_concurrently
+
+    def spy_exhaust_streams_concurrently(self, executor):
+        numbers_of_concurrent_streams.append(len(self))
+        return exhaust_streams_concurrently(self, executor=executor)
+
+    monkeypatch.setattr(
+        ParallelHDF5IODataChunkIteratorQueue, "_exhaust_streams_concurrently", spy_exhaust_streams_concurrently
+    )
+
+    random_number_generator = np.random.default_rng(seed=0)
+    arrays = {
+        f"TimeSeries{stream_index}": (random_number_generator.random(size=(1_000, 16)) * 100).astype("int16")
+        for stream_index in range(4)
+    }
+
+    nwbfile_paths = dict()
+    for number_of_streams in (1, 3):
+        nwbfile = mock_NWBFile()
+        for name, array in arrays.items():
+            data = SliceableDataChunkIterator(data=array, chunk_shape=(100, 16), buffer_shape=(300, 16))
+            nwbfile.add_acquisition(mock_TimeSeries(name=name, data=data))
+
+        backend_configuration = get_default_backend_configuration(nwbfile=nwbfile, backend="hdf5")
+        backend_configuration.number_of_streams = number_of_streams
+        for name in arrays:
+            dataset_configuration = backend_configuration.dataset_configurations[f"acquisition/{name}/data"]
+            dataset_configuration.chunk_shape = (100, 16)
+            dataset_configuration.buffer_shape = (300, 16)
+            dataset_configuration.compression_method = compression_method
+
+        nwbfile_paths[number_of_streams] = tmp_path / f"test_concurrent_streams_hdf5_write_{number_of_streams}.nwb"
+        configure_and_write_nwbfile(
+            nwbfile=nwbfile, nwbfile_path=nwbfile_paths[number_of_streams], backend_configuration=backend_configuration
+        )
+
+    # All four iterators are queued before the queue is exhausted, so they are written as concurrent streams
+    assert numbers_of_concurrent_streams == [4]
+
+    with h5py.File(nwbfile_paths[1], mode="r") as serial_file, h5py.File(nwbfile_paths[3], mode="r") as parallel_file:
+        for name, array in arrays.items():
+            serial_dataset = serial_file[f"acquisition/{name}/data"]
+            parallel_dataset = parallel_file[f"acquisition/{name}/data"]
+            assert_array_equal(parallel_dataset[:], array)
+            for chunk_index in range(serial_dataset.id.get_num_chunks()):
+                chunk_offset = serial_dataset.id.get_chunk_info(chunk_index).chunk_offset
+                assert serial_dataset.id.read_direct_chunk(chunk_offset) == parallel_dataset.id.read_direct_chunk(
+                    chunk_offset
+                )
+
+
+def test_concurrent_streams_hdf5_write_propagates_read_errors(tmp_path: Path):
+    class FailingDataChunkIterator(SliceableDataChunkIterator):
+        def _get_data(self, selection):
+            if selection[0].start >= 300:
+                raise RuntimeError("Could not read the source file.")
+            return super()._get_data(selection=selection)
+
+    nwbfile = mock_NWBFile()
+    array = np.zeros(shape=(1_000, 4), dtype="int16")
+    nwbfile.add_acquisition(mock_TimeSeries(name="Valid", data=SliceableDataChunkIterator(data=array)))
+    failing_data = FailingDataChunkIterator(data=array, chunk_shape=(100, 4), buffer_shape=(300, 4))
+    nwbfile.add_acquisition(mock_TimeSeries(name="Failing", data=failing_data))
+
+    backend_configuration = get_default_backend_configuration(nwbfile=nwbfile, backend="hdf5")
+    backend_configuration.number_of_streams = 2
+    with pytest.raises(RuntimeError, match="Could not read the source file."):
+        configure_and_write_nwbfile(
+            nwbfile=nwbfile,
+            nwbfile_path=tmp_path / "test_failing_stream.nwb",
+            backend_configuration=backend_configuration,
+        )
+
+
+def _write_nwbfile_with_parallel_hdf5_write(nwbfile_path: Path, array: np.ndarray):
+    data = SliceableDataChunkIterator(data=array, chunk_shape=(100, 10), buffer_shape=(300, 20))
+    nwbfile = mock_NWBFile()
+    nwbfile.add_acquisition(mock_TimeSeries(name="TestTimeSeries", data=data))
+
+    backend_configuration = get_default_backend_configuration(nwbfile=nwbfile, backend="hdf5")
+    backend_configuration.number_of_jobs = -1
+    configure_and_write_nwbfile(nwbfile=nwbfile, nwbfile_path=nwbfile_path, backend_configuration=backend_configuration)
+
+
+def test_parallel_hdf5_write_uses_the_parallel_queue(tmp_path: Path, monkeypatch):
+    """The parallel queue replaces a private attribute of HDF5IO, which would silently stop working if renamed."""
+    exhausted_queues = []
+    original_exhaust_queue = ParallelHDF5IODataChunkIteratorQueue.exhaust_queue
+
+    def exhaust_queue(self):
+        exhausted_queues.append(len(self))
+        original_exhaust_queue(self)
+
+    monkeypatch.setattr(ParallelHDF5IODataChunkIteratorQueue, "exhaust_queue", exhaust_queue)
+
+    array = np.random.default_rng(seed=0).integers(low=0, high=100, size=(1_000, 37), dtype="int16")
+    nwbfile_path = tmp_path / "test_parallel_hdf5_write_uses_the_parallel_queue.nwb"
+    _write_nwbfile_with_parallel_hdf5_write(nwbfile_path=nwbfile_path, array=array)
+
+    assert exhausted_queues == [1]
+    with NWBHDF5IO(path=nwbfile_path, mode="r") as io:
+        assert_array_equal(io.read().acquisition["TestTimeSeries"].data[:], array)
+
+
+def test_parallel_hdf5_write_falls_back_to_serial_write(tmp_path: Path, monkeypatch):
+    """If HDF5IO no longer exposes its queue under the expected name, the file is written serially with a warning."""
+    original_hasattr = hasattr
+
+    def hasattr_without_queue(obj, name: str) -> bool:
+        return name != "_HDF5IO__dci_queue" and original_hasattr(obj, name)
+
+    monkeypatch.setattr(_metadata_and_file_helpers, "hasattr", hasattr_without_queue, raising=False)
+    exhaust_queue_mock = Mock(side_effect=ParallelHDF5IODataChunkIteratorQueue.exhaust_queue)
+    monkeypatch.setattr(ParallelHDF5IODataChunkIteratorQueue, "exhaust_queue", exhaust_queue_mock)
+
+    array = np.random.default_rng(seed=0).integers(low=0, high=100, size=(1_000, 37), dtype="int16")
+    nwbfile_path = tmp_path / "test_parallel_hdf5_write_falls_back_to_serial_write.nwb"
+    with pytest.warns(UserWarning, match="written serially"):
+        _write_nwbfile_with_parallel_hdf5_write(nwbfile_path=nwbfile_path, array=array)
+
+    exhaust_queue_mock.assert_not_called()
+    with NWBHDF5IO(path=nwbfile_path, mode="r") as io:
+        assert_array_equal(io.read().acquisition["TestTimeSeries"].data[:], array)
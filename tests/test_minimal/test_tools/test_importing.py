@@ -1,6 +1,10 @@
 """Tests for neuroconv.tools.importing module."""
 
+import subprocess
+import sys
+
 from neuroconv import get_format_summaries
+from neuroconv.tools.importing import _compile_format_summaries
 
 
 def test_guide_attributes():
@@ -29,3 +33,38 @@ def test_guide_attributes():
                 ), f"{name} incorrectly specified GUIDE-related attribute 'associated_suffixes' (must be tuple)."
             if isinstance(value, tuple):
                 assert len(value) > 0, f"{name} is missing entries in GUIDE related attribute {key}."
+
+
+def test_format_summaries_manifest_is_up_to_date():
+    """The static manifest must match the attributes of the classes; regenerate it with _compile_format_summaries."""
+    assert get_format_summaries() == _compile_format_summaries()
+
+
+def _get_imported_modules_in_fresh_interpreter(code: str) -> list[str]:
+    code = f"import sys\n{code}\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return result.stdout.splitlines()
+
+
+def test_startup_does_not_import_interfaces():
+    """Importing neuroconv, its interface registry or the format summaries must not import any interface module."""
+    imported_modules = _get_imported_modules_in_fresh_interpreter(
+        code="import neuroconv\nimport neuroconv.datainterfaces\nimport neuroconv.converters\nneuroconv.get_format_summaries()"
+    )
+
+    imported_interface_modules = [
+        module for module in imported_modules if module.startswith("neuroconv.datainterfaces.")
+    ]
+    assert imported_interface_modules == []
+    assert "neuroconv.tools.yaml_conversion_specification" not in imported_modules
+
+
+def test_interface_import_is_lazy():
+    """Importing one interface only imports the modules of its own format."""
+    imported_modules = _get_imported_modules_in_fresh_interpreter(
+        code="from neuroconv.datainterfaces import SpikeGLXRecordingInterface"
+    )
+
+    assert "neuroconv.datainterfaces.ecephys.spikeglx.spikeglxdatainterface" in imported_modules
+    assert not any(module.startswith("neuroconv.datainterfaces.ophys") for module in imported_modules)
+    assert not any(module.startswith("neuroconv.datainterfaces.behavior") for module in imported_modules)
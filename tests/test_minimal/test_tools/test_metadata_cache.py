@@ -0,0 +1,190 @@
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from neuroconv.tools.metadata_cache import (
+    clear_metadata_cache,
+    get_cached_metadata,
+)
+
+
+@pytest.fixture
+def cache_directory(tmp_path, monkeypatch):
+    cache_directory = tmp_path / "metadata_cache"
+    monkeypatch.setenv("NEUROCONV_METADATA_CACHE_DIRECTORY", str(cache_directory))
+    monkeypatch.setenv("NEUROCONV_ENABLE_METADATA_CACHE", "1")
+    return cache_directory
+
+
+@pytest.fixture
+def source_file_path(tmp_path):
+    source_file_path = tmp_path / "data.bin"
+    source_file_path.write_bytes(b"\x00" * 16)
+    return source_file_path
+
+
+def test_cache_hit(cache_directory, source_file_path):
+    compute = Mock(return_value=np.arange(5))
+
+    first_value = get_cached_metadata(name="Timestamps", source_paths=[source_file_path], compute=compute)
+    second_value = get_cached_metadata(name="Timestamps", source_paths=[source_file_path], compute=compute)
+
+    compute.assert_called_once()
+    assert_array_equal(first_value, np.arange(5))
+    assert_array_equal(second_value, np.arange(5))
+    assert len(list(cache_directory.glob("*.npz"))) == 1
+
+
+@pytest.mark.parametrize(
+    "value",
+    [[np.arange(3), np.arange(4.0)], dict(shape=[480, 640, 3], dtype="|u1"), None],
+    ids=["list_of_arrays", "json", "none"],
+)
+def test_cache_hit_of_other_values(cache_directory, source_file_path, value):
+    compute = Mock(return_value=value)
+
+    get_cached_metadata(name="Value", source_paths=[source_file_path], compute=compute)
+    cached_value = get_cached_metadata(name="Value", source_paths=[source_file_path], compute=compute)
+
+    compute.assert_called_once()
+    if isinstance(value, list):
+        assert len(cached_value) == len(value)
+        for cached_array, array in zip(cached_value, value):
+            assert_array_equal(cached_array, array)
+    else:
+        assert cached_value == value
+
+
+def test_values_that_are_not_plain_data_are_not_cached(cache_directory, source_file_path):
+    compute = Mock(return_value=object())
+
+    get_cached_metadata(name="Value", source_paths=[source_file_path], compute=compute)
+    get_cached_metadata(name="Value", source_paths=[source_file_path], compute=compute)
+
+    assert compute.call_count == 2
+    assert not list(cache_directory.glob("*.npz"))
+
+
+class _PickledPayload:
+    """Creates a file when unpickled, standing for arbitrary code planted in the cache directory."""
+
+    def __init__(self, marker_path):
+        self.marker_path = marker_path
+
+    def __reduce__(self):
+        return (Path.touch, (self.marker_path,))
+
+
+def test_entries_are_never_unpickled(cache_directory, source_file_path, tmp_path):
+    get_cached_metadata(name="Timestamps", source_paths=[source_file_path], compute=lambda: np.arange(5))
+    (entry_path,) = cache_directory.glob("*.npz")
+    marker_path = tmp_path / "payload_was_unpickled"
+    with open(entry_path, mode="wb") as file:
+        np.savez(file, kind=np.array("array"), array_0=np.array([_PickledPayload(marker_path)], dtype=object))
+
+    value = get_cached_metadata(name="Timestamps", source_paths=[source_file_path], compute=lambda: np.arange(3))
+
+    assert not marker_path.exists()
+    assert_array_equal(value, np.arange(3))
+
+
+def test_cache_key_depends_on_name_and_parameters(cache_directory, source_file_path):
+    compute = Mock(return_value=1)
+
+    get_cached_metadata(name="Timestamps", source_paths=[source_file_path], compute=compute)
+    get_cached_metadata(name="FrameShape", source_paths=[source_file_path], compute=compute)
+    get_cached_metadata(name="Timestamps", source_paths=[source_file_path], compute=compute, parameters=dict(a=1))
+
+    assert compute.call_count == 3
+
+
+def test_cache_is_invalidated_when_the_source_file_changes(cache_directory, source_file_path):
+    compute = Mock(return_value=1)
+    get_cached_metadata(name="Timestamps", source_paths=[source_file_path], compute=compute)
+
+    source_file_stat = source_file_path.stat()
+    os.utime(source_file_path, ns=(source_file_stat.st_atime_ns, source_file_stat.st_mtime_ns + 1_000_000_000))
+    get_cached_metadata(name="Timestamps", source_paths=[source_file_path], compute=compute)
+
+    assert compute.call_count == 2
+
+
+def test_cache_of_folder_is_invalidated_when_a_file_is_added(cache_directory, tmp_path):
+    folder_path = tmp_path / "session"
+    folder_path.mkdir()
+    (folder_path / "first.bin").write_bytes(b"\x00")
+
+    compute = Mock(return_value=1)
+    get_cached_metadata(name="Timestamps", source_paths=[folder_path], compute=compute)
+    (folder_path / "second.bin").write_bytes(b"\x00")
+    get_cached_metadata(name="Timestamps", source_paths=[folder_path], compute=compute)
+
+    assert compute.call_count == 2
+
+
+def test_least_recently_used_entries_are_evicted(cache_directory, source_file_path):
+    maximum_cache_size_mb = 2.5  # Room for two entries of one MB
+    for index in range(3):
+        get_cached_metadata(
+            name="Timestamps",
+            source_paths=[source_file_path],
+            compute=lambda: np.zeros(shape=125_000),
+            parameters=dict(index=index),
+            maximum_cache_size_mb=maximum_cache_size_mb,
+        )
+
+    compute = Mock(return_value=np.zeros(shape=125_000))
+    for index in (2, 1):
+        get_cached_metadata(
+            name="Timestamps",
+            source_paths=[source_file_path],
+            compute=compute,
+            parameters=dict(index=index),
+            maximum_cache_size_mb=maximum_cache_size_mb,
+        )
+    compute.assert_not_called()
+
+    get_cached_metadata(
+        name="Timestamps",
+        source_paths=[source_file_path],
+        compute=compute,
+        parameters=dict(index=0),
+        maximum_cache_size_mb=maximum_cache_size_mb,
+    )
+    compute.assert_called_once()
+    assert len(list(cache_directory.glob("*.npz"))) == 2
+
+
+def test_corrupted_entry_is_recomputed(cache_directory, source_file_path):
+    get_cached_metadata(name="Timestamps", source_paths=[source_file_path], compute=lambda: 1)
+    (entry_path,) = cache_directory.glob("*.npz")
+    entry_path.write_bytes(b"not a numpy archive")
+
+    value = get_cached_metadata(name="Timestamps", source_paths=[source_file_path], compute=lambda: 2)
+
+    assert value == 2
+
+
+def test_cache_is_disabled_by_default(cache_directory, source_file_path, monkeypatch):
+    monkeypatch.delenv("NEUROCONV_ENABLE_METADATA_CACHE")
+    compute = Mock(return_value=1)
+
+    get_cached_metadata(name="Timestamps", source_paths=[source_file_path], compute=compute)
+    get_cached_metadata(name="Timestamps", source_paths=[source_file_path], compute=compute)
+
+    assert compute.call_count == 2
+    assert not cache_directory.exists()
+
+
+def test_clear_metadata_cache(cache_directory, source_file_path):
+    compute = Mock(return_value=1)
+    get_cached_metadata(name="Timestamps", source_paths=[source_file_path], compute=compute)
+
+    clear_metadata_cache()
+    get_cached_metadata(name="Timestamps", source_paths=[source_file_path], compute=compute)
+
+    assert compute.call_count == 2
@@ -4,7 +4,7 @@ import numpy as np
 import pytest
 from hdmf.testing import TestCase
 from numpy.testing import assert_array_equal
-from pynwb import get_manager
+from pynwb import get_manager, get_type_map
 from pynwb.behavior import BehavioralTimeSeries
 from pynwb.ophys import PlaneSegmentation
 from pynwb.testing.mock.base import mock_TimeSeries
@@ -18,6 +18,7 @@ from neuroconv.tools.hdmf import (
     get_dataset_builder,
     get_full_data_shape,
     has_compound_dtype,
+    has_compound_dtype_in_spec,
 )
 
 
@@ -218,6 +219,33 @@ def test_has_compound_dtype_False():
     assert not has_compound_dtype(builder=builder, location_in_file=location_in_file)
 
 
+def test_has_compound_dtype_in_spec_True():
+    nwbfile = mock_NWBFile()
+    imaging_plane = mock_ImagingPlane(nwbfile=nwbfile)
+    plane_segmentation = PlaneSegmentation(
+        name="PlaneSegmentation",
+        description="description",
+        imaging_plane=imaging_plane,
+    )
+    pixel_mask = [[0, 0, 1]]
+    plane_segmentation.add_roi(pixel_mask=pixel_mask)
+    nwbfile.processing["ophys"].add(plane_segmentation)
+
+    type_map = get_type_map()
+    pixel_mask_column = plane_segmentation["pixel_mask"].target
+    assert has_compound_dtype_in_spec(neurodata_object=pixel_mask_column, dataset_name="data", type_map=type_map)
+
+
+def test_has_compound_dtype_in_spec_False():
+    nwbfile = mock_NWBFile()
+    time_series = mock_TimeSeries(name="TimeSeries")
+    nwbfile.add_acquisition(time_series)
+
+    type_map = get_type_map()
+    assert not has_compound_dtype_in_spec(neurodata_object=time_series, dataset_name="data", type_map=type_map)
+    assert not has_compound_dtype_in_spec(neurodata_object=time_series, dataset_name="timestamps", type_map=type_map)
+
+
 def test_get_full_data_shape():
     nwbfile = mock_NWBFile()
     data = np.array(
@@ -275,3 +303,48 @@ def test_get_full_data_shape_no_builder():
     full_data_shape = get_full_data_shape(dataset=dataset, builder=None, location_in_file=location_in_file)
 
     assert full_data_shape == (2, 3)
+
+
+def test_sliceable_data_chunk_iterator_prefetch():
+    data = np.arange(10_000).reshape(100, 100)
+
+    iterator = SliceableDataChunkIterator(data=data, buffer_shape=(10, 50), chunk_shape=(10, 50), prefetch_buffers=3)
+    data_chunks = list(iterator)
+
+    reference_iterator = SliceableDataChunkIterator(data=data, buffer_shape=(10, 50), chunk_shape=(10, 50))
+    reference_data_chunks = list(reference_iterator)
+
+    assert len(data_chunks) == len(reference_data_chunks) == 20
+    for data_chunk, reference_data_chunk in zip(data_chunks, reference_data_chunks):
+        assert data_chunk.selection == reference_data_chunk.selection
+        assert_array_equal(data_chunk.data, reference_data_chunk.data)
+    assert iterator._prefetch_executor is None
+
+
+class _CountingSliceableDataChunkIterator(SliceableDataChunkIterator):
+    def __init__(self, **kwargs):
+        self.number_of_reads = 0
+        super().__init__(**kwargs)
+
+    def _get_data(self, selection: tuple[slice]) -> np.ndarray:
+        self.number_of_reads += 1
+        if self.number_of_reads == 5:
+            raise ValueError("Failed to read buffer!")
+        return super()._get_data(selection=selection)
+
+
+def test_prefetch_is_bounded():
+    data = np.arange(10_000).reshape(100, 100)
+    iterator = _CountingSliceableDataChunkIterator(
+        data=data, buffer_shape=(10, 100), chunk_shape=(10, 100), prefetch_buffers=2
+    )
+
+    next(iterator)
+    iterator._prefetch_queue[-1][1].result()  # Wait for the read-ahead to settle
+    assert iterator.number_of_reads == 3
+
+    for _ in range(3):
+        next(iterator)
+    with pytest.raises(ValueError, match="Failed to read buffer!"):
+        next(iterator)
+    assert iterator._prefetch_executor is None
@@ -56,3 +56,12 @@ class TestDeepDict(unittest.TestCase):
         dd2["a"]["b"]["c"] = 0
         self.assertEqual(dd2["a"]["b"]["c"], 0)
         self.assertEqual(self.dd["a"]["b"]["c"], 42)
+
+    def test_deepcopy_converts_nested_dicts(self):
+        self.dd["a"]["plain"] = {"d": {"e": [1, {"f": 2}]}}
+        dd2 = deepcopy(self.dd)
+        self.assertEqual(dd2, self.dd)
+        self.assertIsInstance(dd2["a"]["plain"], DeepDict)
+        self.assertIsInstance(dd2["a"]["plain"]["d"], DeepDict)
+        dd2["a"]["plain"]["d"]["e"][1]["f"] = 0
+        self.assertEqual(self.dd["a"]["plain"]["d"]["e"][1]["f"], 2)
@@ -1,6 +1,8 @@
+import unittest.mock
 from pathlib import Path
 from typing import Literal
 
+import pydantic
 import pytest
 from jsonschema import validate
 from pydantic import DirectoryPath, FilePath
@@ -470,3 +472,23 @@ def test_json_schema_raises_error_for_missing_type_annotations():
         ),
     ):
         get_json_schema_from_method_signature(method=test_method)
+
+
+def test_get_json_schema_from_method_signature_is_cached_per_method():
+    def test_method(integer: int, string: str = "hi"):
+        """
+        Parameters
+        ----------
+        integer : int
+            An integer.
+        """
+        pass
+
+    with unittest.mock.patch("pydantic.create_model", wraps=pydantic.create_model) as create_model:
+        first_json_schema = get_json_schema_from_method_signature(method=test_method)
+        first_json_schema["properties"]["integer"]["description"] = "Modified."  # The cached schema is unaffected
+        second_json_schema = get_json_schema_from_method_signature(method=test_method)
+        get_json_schema_from_method_signature(method=test_method, exclude=["string"])
+
+    assert create_model.call_count == 2
+    assert second_json_schema["properties"]["integer"]["description"] == "An integer."
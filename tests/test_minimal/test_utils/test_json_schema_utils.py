@@ -3,6 +3,8 @@ import os
 from copy import deepcopy
 
 import numpy as np
+import pytest
+from jsonschema import ValidationError
 from pynwb.ophys import ImagingPlane, TwoPhotonSeries
 
 from neuroconv.utils import (
@@ -11,7 +13,11 @@ from neuroconv.utils import (
     get_schema_from_hdmf_class,
     load_dict_from_file,
 )
-from neuroconv.utils.json_schema import _NWBMetaDataEncoder
+from neuroconv.utils.json_schema import (
+    _get_compiled_validator,
+    _NWBMetaDataEncoder,
+    _validate_against_schema,
+)
 
 
 def compare_dicts(a: dict, b: dict):
@@ -206,3 +212,48 @@ def test_np_array_encoding():
     np_array = np.array([1, 2, 3])
     encoded = json.dumps(np_array, cls=_NWBMetaDataEncoder)
     assert encoded == "[1, 2, 3]"
+
+
+def test_validate_against_schema_reuses_compiled_validator():
+    schema = {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "properties": {"rate": {"type": "number"}},
+        "required": ["rate"],
+    }
+
+    _validate_against_schema(instance={"rate": 30.0}, schema=schema)
+    cache_info_after_first_validation = _get_compiled_validator.cache_info()
+    _validate_against_schema(instance={"rate": 15.0}, schema=deepcopy(schema))
+    cache_info_after_second_validation = _get_compiled_validator.cache_info()
+
+    assert cache_info_after_second_validation.hits == cache_info_after_first_validation.hits + 1
+    assert cache_info_after_second_validation.misses == cache_info_after_first_validation.misses
+
+    with pytest.raises(ValidationError, match="'rate' is a required property"):
+        _validate_against_schema(instance={}, schema=schema)
+
+
+def test_dict_deep_update_list_of_dicts_does_not_modify_inputs():
+    electrode_groups = [dict(name=f"ElectrodeGroup{index}", description="description") for index in range(384)]
+    d = dict(Ecephys=dict(ElectrodeGroup=electrode_groups))
+    u = dict(
+        Ecephys=dict(
+            ElectrodeGroup=[
+                dict(name="ElectrodeGroup1", location="CA1"),
+                dict(name="NewElectrodeGroup", description="appended"),
+                dict(name="NewElectrodeGroup", location="CA3"),
+                dict(name="ElectrodeGroup1", description="updated"),
+            ]
+        )
+    )
+    d_before_update, u_before_update = deepcopy(d), deepcopy(u)
+
+    result = dict_deep_update(d, u)
+
+    updated_electrode_groups = result["Ecephys"]["ElectrodeGroup"]
+    assert len(updated_electrode_groups) == 385
+    assert updated_electrode_groups[1] == dict(name="ElectrodeGroup1", description="updated", location="CA1")
+    assert updated_electrode_groups[-1] == dict(name="NewElectrodeGroup", description="appended", location="CA3")
+    assert d == d_before_update
+    assert u == u_before_update
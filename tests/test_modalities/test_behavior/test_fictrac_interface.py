@@ -0,0 +1,54 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from neuroconv.datainterfaces import FicTracDataInterface
+from neuroconv.datainterfaces.behavior.fictrac import fictracdatainterface
+from neuroconv.datainterfaces.behavior.fictrac.fictracdatainterface import (
+    read_fictrac_columns,
+)
+
+
+@pytest.fixture
+def dat_file_data():
+    number_of_frames = 250
+    data = np.random.default_rng(seed=0).normal(size=(number_of_frames, 25))
+    data[:, 21] = 1690191055440.6 + 10.0 * np.arange(number_of_frames)  # Unix epoch timestamps in milliseconds
+
+    return data
+
+
+@pytest.fixture
+def dat_file_path(tmp_path, dat_file_data):
+    dat_file_path = tmp_path / "session.dat"
+    dat_file_path.write_text("\n".join(", ".join(repr(float(value)) for value in row) for row in dat_file_data) + "\n")
+
+    return dat_file_path
+
+
+def test_read_fictrac_columns(dat_file_path, dat_file_data):
+    column_indices = [21, 3, 4]
+
+    data = read_fictrac_columns(file_path=dat_file_path, column_indices=column_indices, chunk_size=100)
+
+    assert_allclose(data, dat_file_data[:, column_indices])
+    assert data.flags.f_contiguous
+
+
+def test_fictrac_interface_parses_the_dat_file_once(dat_file_path, dat_file_data, monkeypatch):
+    read_fictrac_columns_mock = Mock(wraps=read_fictrac_columns)
+    monkeypatch.setattr(fictracdatainterface, "read_fictrac_columns", read_fictrac_columns_mock)
+    interface = FicTracDataInterface(file_path=dat_file_path)
+
+    nwbfile = interface.create_nwbfile()
+    interface.get_original_timestamps()
+
+    read_fictrac_columns_mock.assert_called_once()
+    fictrac_position_container = nwbfile.processing["behavior"].data_interfaces["FicTrac"]
+    for data_dict in interface.column_to_nwb_mapping.values():
+        spatial_series = fictrac_position_container.spatial_series[data_dict["spatial_series_name"]]
+        column_indices = [interface.columns_in_dat_file.index(name) for name in data_dict["column_in_dat_file"]]
+        assert_allclose(spatial_series.data.data, dat_file_data[:, column_indices])
+        assert spatial_series.rate == pytest.approx(100.0)
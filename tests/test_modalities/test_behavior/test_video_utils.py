@@ -1,17 +1,22 @@
 import os
 import tempfile
 import unittest
+import unittest.mock
 from datetime import datetime
+from fractions import Fraction
 
 import numpy as np
 from numpy.testing import assert_array_equal
 from pynwb import NWBHDF5IO
 from pynwb.image import ImageSeries
 
+from neuroconv.datainterfaces.behavior.video import video_utils
 from neuroconv.datainterfaces.behavior.video.video_utils import (
     VideoCaptureContext,
     VideoDataChunkIterator,
+    get_video_timestamps,
 )
+from neuroconv.tools.importing import is_package_installed
 from neuroconv.tools.nwb_helpers import make_nwbfile_from_metadata
 
 try:
@@ -21,6 +26,8 @@ try:
 except:
     CV2_INSTALLED = False
 
+AV_INSTALLED = is_package_installed(package_name="av")
+
 
 @unittest.skipIf(not CV2_INSTALLED, "cv2 not installed")
 class TestVideoContext(unittest.TestCase):
@@ -58,6 +65,65 @@ class TestVideoContext(unittest.TestCase):
             ts = vcc.get_video_timestamps()
         self.assertEqual(len(ts), self.number_of_frames)
 
+    def test_timestamps_match_decoded_frames(self):
+        video_capture = cv2.VideoCapture(self.video_loc)
+        expected_timestamps = []
+        while video_capture.read()[0]:
+            expected_timestamps.append(video_capture.get(cv2.CAP_PROP_POS_MSEC))
+        video_capture.release()
+        expected_timestamps = np.array(expected_timestamps) / 1000
+
+        timestamps = get_video_timestamps(file_path=self.video_loc, display_progress=False)
+        np.testing.assert_allclose(timestamps, expected_timestamps)
+
+        stub_timestamps = get_video_timestamps(file_path=self.video_loc, max_frames=5, display_progress=False)
+        np.testing.assert_allclose(stub_timestamps, expected_timestamps[:5])
+
+    def test_timestamps_are_cached(self):
+        timestamps = get_video_timestamps(file_path=self.video_loc, display_progress=False)
+        timestamps[:] = -1.0  # The cached timestamps are not affected by changes to the returned copy
+
+        with unittest.mock.patch("cv2.VideoCapture") as video_capture:
+            cached_timestamps = get_video_timestamps(file_path=self.video_loc, display_progress=False)
+        video_capture.assert_not_called()
+        self.assertEqual(len(cached_timestamps), self.number_of_frames)
+        self.assertTrue(np.all(cached_timestamps >= 0.0))
+
+    def test_timestamps_cache_is_bounded(self):
+        with unittest.mock.patch.object(video_utils, "_VIDEO_TIMESTAMPS_CACHE", dict()) as timestamps_cache:
+            with unittest.mock.patch.object(video_utils, "_MAXIMUM_NUMBER_OF_CACHED_VIDEO_TIMESTAMPS", 2):
+                for max_frames in [5, 10, 15]:
+                    get_video_timestamps(file_path=self.video_loc, max_frames=max_frames, display_progress=False)
+        self.assertEqual([cache_key[3] for cache_key in timestamps_cache], [10, 15])
+
+    @unittest.skipIf(not AV_INSTALLED, "av not installed")
+    def test_absolute_timestamps_without_packet_timestamps(self):
+        """Without packet timestamps, the frames are decoded with PyAV rather than read relative to the stream start."""
+        import av
+
+        video_file = os.path.join(self.test_dir, "test_delayed_start.mp4")
+        with av.open(video_file, mode="w") as container:
+            stream = container.add_stream("mpeg4", rate=self.fps)
+            stream.width, stream.height = self.frame_shape[1], self.frame_shape[0]
+            for frame_index in range(self.number_of_frames):
+                frame = av.VideoFrame.from_ndarray(self.video_frames[frame_index], format="rgb24")
+                frame.pts = 50 + frame_index  # The stream starts two seconds after the start of the container
+                frame.time_base = Fraction(1, self.fps)
+                container.mux(stream.encode(frame))
+            container.mux(stream.encode())
+        expected_timestamps = 2.0 + np.arange(self.number_of_frames) / self.fps
+
+        with (
+            unittest.mock.patch.object(video_utils, "_get_video_timestamps_from_packets", return_value=None),
+            unittest.mock.patch.object(video_utils, "_get_video_timestamps_from_grabbed_frames") as grabbed_frames,
+        ):
+            timestamps = video_utils._get_cached_video_timestamps(
+                file_path=video_file, display_progress=False, relative_to_stream_start=False
+            )
+
+        grabbed_frames.assert_not_called()
+        np.testing.assert_allclose(timestamps, expected_timestamps)
+
     def test_fps(self):
         with VideoCaptureContext(self.video_loc) as vcc:
             fps = vcc.get_video_fps()
@@ -68,6 +134,12 @@ class TestVideoContext(unittest.TestCase):
             frame_shape = vcc.get_frame_shape()
         assert_array_equal(frame_shape, self.frame_shape)
 
+    def test_frame_properties_of_undecodable_video(self):
+        with VideoCaptureContext(self.video_loc) as vcc:
+            with unittest.mock.patch.object(vcc, "get_video_frame", return_value=None):
+                self.assertIsNone(vcc.get_frame_shape())
+                self.assertIsNone(vcc.get_video_frame_dtype())
+
     def test_frame_value(self):
         frames = []
         with VideoCaptureContext(self.video_loc) as vcc:
@@ -187,6 +259,102 @@ class TestVideoInterface(unittest.TestCase):
             image_series = nwbfile.acquisition["imageseries"]
             assert image_series.data.chunks == expected_chunk_shape
 
+    def test_parallel_decode_matches_sequential_decode(self):
+        video_file = self.create_video(self.fps, (40, 30, 3), self.number_of_frames)
+        sequential_iterator = VideoDataChunkIterator(
+            video_file, buffer_shape=(20, 40, 30, 3), chunk_shape=(5, 40, 30, 3)
+        )
+        parallel_iterator = VideoDataChunkIterator(
+            video_file, buffer_shape=(20, 40, 30, 3), chunk_shape=(5, 40, 30, 3), number_of_jobs=2
+        )
+
+        sequential_data = np.empty(shape=sequential_iterator.maxshape, dtype=sequential_iterator.dtype)
+        for data_chunk in sequential_iterator:
+            sequential_data[data_chunk.selection] = data_chunk.data
+        parallel_data = np.zeros(shape=parallel_iterator.maxshape, dtype=parallel_iterator.dtype)
+        parallel_selections = []
+        for data_chunk in parallel_iterator:
+            parallel_data[data_chunk.selection] = data_chunk.data
+            parallel_selections.append(data_chunk.selection[0])
+
+        assert_array_equal(parallel_data, sequential_data)
+        self.assertEqual(parallel_selections, [slice(0, 20), slice(40, 50), slice(20, 40)])
+        self.assertIsNone(parallel_iterator._decoder_executors)
+
+    def test_parallel_decode_assigns_contiguous_ranges_to_workers(self):
+        video_file = self.create_video(self.fps, (40, 30, 3), self.number_of_frames)
+        iterator = VideoDataChunkIterator(
+            video_file, buffer_shape=(10, 40, 30, 3), chunk_shape=(5, 40, 30, 3), number_of_jobs=2
+        )
+
+        self.assertEqual(iterator._worker_buffer_start_frames, [[0, 10, 20], [30, 40]])
+        buffer_start_frames = [selection[0].start for selection in iterator.buffer_selection_generator]
+        self.assertEqual(buffer_start_frames, [0, 30, 10, 40, 20])
+
+    def create_long_gop_video(self, number_of_frames):
+        """MPEG-4 encodes a keyframe every 12 frames, followed by frames predicted from the previous ones."""
+        frame = np.random.randint(0, 255, size=(40, 30, 3), dtype="uint8")
+        video_file = os.path.join(self.test_dir, "test_long_gop.mp4")
+        writer = cv2.VideoWriter(
+            filename=video_file,
+            apiPreference=None,
+            fourcc=cv2.VideoWriter_fourcc(*"mp4v"),
+            fps=self.fps,
+            frameSize=(30, 40),
+            params=None,
+        )
+        for k in range(number_of_frames):
+            writer.write(np.roll(frame, shift=k, axis=0))
+        writer.release()
+        return video_file
+
+    def test_parallel_decode_of_long_gop_video_matches_sequential_decode(self):
+        video_file = self.create_long_gop_video(number_of_frames=self.number_of_frames)
+        sequential_iterator = VideoDataChunkIterator(
+            video_file, buffer_shape=(10, 40, 30, 3), chunk_shape=(5, 40, 30, 3)
+        )
+        # The ranges of the second and third workers start on frames 20 and 40, between the keyframes
+        parallel_iterator = VideoDataChunkIterator(
+            video_file, buffer_shape=(10, 40, 30, 3), chunk_shape=(5, 40, 30, 3), number_of_jobs=3
+        )
+
+        sequential_data = np.empty(shape=sequential_iterator.maxshape, dtype=sequential_iterator.dtype)
+        for data_chunk in sequential_iterator:
+            sequential_data[data_chunk.selection] = data_chunk.data
+        parallel_data = np.zeros(shape=parallel_iterator.maxshape, dtype=parallel_iterator.dtype)
+        for data_chunk in parallel_iterator:
+            parallel_data[data_chunk.selection] = data_chunk.data
+
+        assert_array_equal(parallel_data, sequential_data)
+
+    def test_decoding_starts_over_when_the_seek_misses_the_keyframe(self):
+        video_file = self.create_long_gop_video(number_of_frames=self.number_of_frames)
+        with VideoCaptureContext(video_file) as video_capture_context:
+            expected_frames = np.stack([video_capture_context.get_video_frame(frame) for frame in range(20, 25)])
+
+        # A keyframe timestamp that the seek cannot match makes the capture decode from the first frame instead
+        with unittest.mock.patch.object(video_utils, "_DECODER_CAPTURES", dict()) as decoder_captures:
+            frames = video_utils._decode_video_frames(
+                file_path=video_file, start_frame=20, end_frame=25, keyframe_index=12, keyframe_timestamp=100.0
+            )
+            decoder_captures[video_file][0].release()
+
+        assert_array_equal(frames, expected_frames)
+
+    @unittest.skipIf(not AV_INSTALLED, "av not installed")
+    def test_parallel_decode_starts_workers_on_keyframes(self):
+        video_file = self.create_long_gop_video(number_of_frames=self.number_of_frames)
+        iterator = VideoDataChunkIterator(
+            video_file, buffer_shape=(10, 40, 30, 3), chunk_shape=(5, 40, 30, 3), number_of_jobs=3
+        )
+
+        timestamps = get_video_timestamps(file_path=video_file, display_progress=False)
+        self.assertEqual([keyframe_index for keyframe_index, _ in iterator._worker_keyframes], [0, 12, 36])
+        self.assertEqual(
+            [keyframe_timestamp for _, keyframe_timestamp in iterator._worker_keyframes[1:]],
+            [timestamps[12], timestamps[36]],
+        )
+
     def test_custom_chunk_shape(self):
         custom_frame_shape = (1, 100, 100, 3)
         video_file = self.create_video(self.fps, self.frame_shape, self.number_of_frames)
@@ -0,0 +1,64 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+from pynwb import NWBHDF5IO
+
+from neuroconv.datainterfaces import AxonaLFPDataInterface
+from neuroconv.datainterfaces.ecephys.axona.axona_utils import (
+    get_all_file_paths,
+    read_all_eeg_file_lfp_data,
+)
+
+CHANNEL_SUFFIXES = [".eeg", ".eeg2", ".eeg3", ".eeg4", ".eeg10"]
+
+
+@pytest.fixture
+def lfp_data():
+    return np.random.default_rng(seed=0).integers(low=-128, high=127, size=(len(CHANNEL_SUFFIXES), 100), dtype="int8")
+
+
+@pytest.fixture
+def eeg_file_path(tmp_path, lfp_data):
+    for channel_suffix, channel_data in zip(CHANNEL_SUFFIXES, lfp_data):
+        file_content = b"sample_rate 250.0 hz\r\ndata_start" + channel_data.tobytes() + b"\r\ndata_end\r\n"
+        (tmp_path / f"session{channel_suffix}").write_bytes(file_content)
+    (tmp_path / "session.set").write_bytes(b"")
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "other_session.eeg").write_bytes(b"")
+
+    return tmp_path / "session.eeg"
+
+
+def test_get_all_file_paths_orders_channels(eeg_file_path):
+    file_names = get_all_file_paths(file_path=eeg_file_path)
+
+    assert file_names == [f"session{channel_suffix}" for channel_suffix in CHANNEL_SUFFIXES]
+
+
+def test_read_all_eeg_file_lfp_data_is_a_lazy_view(eeg_file_path, lfp_data):
+    lfp_array = read_all_eeg_file_lfp_data(file_path=eeg_file_path)
+
+    assert lfp_array.shape == lfp_data.shape
+    assert isinstance(lfp_array[1], np.memmap)
+    assert_array_equal(np.asarray(lfp_array), lfp_data)
+    assert_array_equal(lfp_array[1:3, 10:20], lfp_data[1:3, 10:20])
+    assert_array_equal(lfp_array.T[10:20, [0, 4]], lfp_data.T[10:20, [0, 4]])
+    assert lfp_array.T[5, 2] == lfp_data[2, 5]
+
+
+def test_axona_lfp_interface(eeg_file_path, lfp_data, tmp_path):
+    interface = AxonaLFPDataInterface(file_path=eeg_file_path)
+    assert_array_equal(interface.recording_extractor.get_traces(), lfp_data.T)
+
+    metadata = interface.get_metadata()
+    metadata["NWBFile"]["session_start_time"] = datetime(2020, 1, 1)
+    nwbfile_path = tmp_path / "axona_lfp.nwb"
+    interface.run_conversion(nwbfile_path=nwbfile_path, metadata=metadata)
+
+    with NWBHDF5IO(path=nwbfile_path, mode="r") as io:
+        nwbfile = io.read()
+        electrical_series = nwbfile.processing["ecephys"]["LFP"]["ElectricalSeriesLFP"]
+        assert_array_equal(electrical_series.data[:], lfp_data.T)
+        assert list(nwbfile.electrodes["group_name"][:]) == ["ElectrodeGroup"] * len(CHANNEL_SUFFIXES)
@@ -1,8 +1,13 @@
 from datetime import datetime
 
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 from pynwb import NWBHDF5IO
 
+from neuroconv.tools.signal_processing import (
+    get_falling_frames_from_ttl,
+    get_rising_frames_from_ttl,
+    get_ttl_frames_from_recording,
+)
 from neuroconv.tools.testing import MockSpikeGLXNIDQInterface
 
 
@@ -40,6 +45,33 @@ def test_custom_inferred_ttl_times():
         assert_array_almost_equal(inferred_ttl_times, custom_ttl_times[channel_index], decimal=4)
 
 
+def test_buffered_ttl_frames_match_whole_trace():
+    custom_ttl_times = [[1.2], [3.6], [0.7, 4.5], [5.1]]
+    recording = MockSpikeGLXNIDQInterface(ttl_times=custom_ttl_times).recording_extractor
+    channel_ids = ["nidq#XA0", "nidq#XA1", "nidq#XA2", "nidq#XA3"]
+
+    # Buffers of a prime number of frames so that some edges fall right at the boundaries
+    ttl_frames = get_ttl_frames_from_recording(
+        recording=recording, channel_ids=channel_ids, frames_per_buffer=12_497, number_of_jobs=2
+    )
+
+    for channel_id in channel_ids:
+        trace = recording.get_traces(channel_ids=[channel_id])
+        assert_array_equal(ttl_frames[channel_id]["rising"], get_rising_frames_from_ttl(trace=trace))
+        assert_array_equal(ttl_frames[channel_id]["falling"], get_falling_frames_from_ttl(trace=trace))
+
+
+def test_buffered_ttl_frames_at_buffer_boundary():
+    recording = MockSpikeGLXNIDQInterface(ttl_times=[[1.2]]).recording_extractor
+    (rising_frame,) = get_rising_frames_from_ttl(trace=recording.get_traces(channel_ids=["nidq#XA0"]))
+
+    for frames_per_buffer in (rising_frame - 1, rising_frame, rising_frame + 1):
+        ttl_frames = get_ttl_frames_from_recording(
+            recording=recording, channel_ids=["nidq#XA0"], frames_per_buffer=frames_per_buffer
+        )
+        assert_array_equal(ttl_frames["nidq#XA0"]["rising"], [rising_frame])
+
+
 def test_mock_metadata():
     interface = MockSpikeGLXNIDQInterface()
 
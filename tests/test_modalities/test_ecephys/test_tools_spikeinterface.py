@@ -11,7 +11,7 @@ import psutil
 import pynwb.ecephys
 import pytest
 from hdmf.testing import TestCase
-from pynwb import NWBFile
+from pynwb import NWBHDF5IO, NWBFile
 from pynwb.testing.mock.file import mock_NWBFile
 from spikeinterface.core.generate import (
     generate_ground_truth_recording,
@@ -35,6 +35,9 @@ from neuroconv.tools.spikeinterface import (
 from neuroconv.tools.spikeinterface.spikeinterfacerecordingdatachunkiterator import (
     SpikeInterfaceRecordingDataChunkIterator,
 )
+from neuroconv.tools.spikeinterface.spikeinterfacesortingdatachunkiterator import (
+    SpikeInterfaceSortingSpikeTimesDataChunkIterator,
+)
 
 testing_session_time = datetime.now().astimezone()
 
@@ -665,6 +668,24 @@ class TestAddElectrodes(TestCase):
         expected_properties_in_electrodes_table = ["value_1", "value_1", "value_1", "value_1", "value_2", "value_2"]
         self.assertListEqual(actual_properties_in_electrodes_table, expected_properties_in_electrodes_table)
 
+    def test_ragged_and_scalar_properties_for_many_channels(self):
+        """The electrodes are appended column-wise; check that all columns stay aligned row by row."""
+        num_channels = 64
+        recording = generate_recording(num_channels=num_channels, durations=[0.1])
+        scalar_values = np.arange(num_channels) * 2.0
+        ragged_values = [np.arange(channel_index % 3 + 1) for channel_index in range(num_channels)]
+        recording.set_property(key="scalar_property", values=scalar_values)
+        recording.set_property(key="ragged_property", values=np.array(ragged_values, dtype=object))
+
+        add_electrodes_to_nwbfile(recording=recording, nwbfile=self.nwbfile)
+
+        electrodes = self.nwbfile.electrodes
+        self.assertListEqual(list(electrodes.id[:]), list(range(num_channels)))
+        self.assertListEqual(list(electrodes["channel_name"][:]), [str(id) for id in recording.channel_ids])
+        np.testing.assert_array_equal(electrodes["scalar_property"][:], scalar_values)
+        for row_index, expected_values in enumerate(ragged_values):
+            self.assertListEqual(list(electrodes["ragged_property"][row_index]), list(expected_values))
+
     def test_add_electrodes_addition_to_nwbfile(self):
         """
         Keep the old logic of not allowing integer channel_ids to match electrodes.table.ids
@@ -1505,6 +1526,110 @@ class TestAddUnitsTable(TestCase):
         add_sorting_to_nwbfile(sorting=self.sorting_1, nwbfile=self.nwbfile)
         self.assertEqual(len(self.nwbfile.units), len(self.sorting_1.unit_ids))
 
+    def test_spike_times_across_segments(self):
+        """The spike times of each unit are the concatenation of its spike trains over all segments."""
+        unit_ids = self.multiple_segment_sorting.get_unit_ids()
+        sorting_1 = self.multiple_segment_sorting.select_units(unit_ids=unit_ids, renamed_unit_ids=["a", "b", "c", "d"])
+        sorting_2 = self.multiple_segment_sorting.select_units(unit_ids=unit_ids, renamed_unit_ids=["c", "d", "e", "f"])
+        add_sorting_to_nwbfile(sorting=sorting_1, nwbfile=self.nwbfile)
+        add_sorting_to_nwbfile(sorting=sorting_2, nwbfile=self.nwbfile)
+
+        expected_unit_names = ["a", "b", "c", "d", "e", "f"]
+        self.assertListEqual(list(self.nwbfile.units["unit_name"][:]), expected_unit_names)
+        for row_index, unit_name in enumerate(expected_unit_names):
+            sorting = sorting_1 if unit_name in sorting_1.unit_ids else sorting_2
+            expected_spike_times = np.concatenate(
+                [
+                    sorting.get_unit_spike_train(unit_id=unit_name, segment_index=segment_index, return_times=True)
+                    for segment_index in range(sorting.get_num_segments())
+                ]
+            )
+            np.testing.assert_array_equal(self.nwbfile.units.get_unit_spike_times(row_index), expected_spike_times)
+
+    def test_spike_times_iterator(self):
+        """Streaming the spike times with an iterator writes the same Units table as the in-memory path."""
+        nwbfile_in_memory = mock_NWBFile()
+        add_sorting_to_nwbfile(sorting=self.multiple_segment_sorting, nwbfile=nwbfile_in_memory)
+        add_sorting_to_nwbfile(
+            sorting=self.multiple_segment_sorting,
+            nwbfile=self.nwbfile,
+            iterator_type="v2",
+            iterator_opts=dict(buffer_shape=(7,), chunk_shape=(7,)),
+        )
+
+        spike_times = self.nwbfile.units["spike_times"].target.data
+        assert isinstance(spike_times, SpikeInterfaceSortingSpikeTimesDataChunkIterator)
+
+        nwbfile_path = Path(mkdtemp()) / "test_spike_times_iterator.nwb"
+        with NWBHDF5IO(nwbfile_path, mode="w") as io:
+            io.write(self.nwbfile)
+        with NWBHDF5IO(nwbfile_path, mode="r") as io:
+            units = io.read().units
+            self.assertListEqual(list(units["unit_name"][:]), list(nwbfile_in_memory.units["unit_name"][:]))
+            for row_index in range(self.num_units):
+                np.testing.assert_array_equal(
+                    units.get_unit_spike_times(row_index), nwbfile_in_memory.units.get_unit_spike_times(row_index)
+                )
+        rmtree(nwbfile_path.parent)
+
+    def test_spike_times_keep_their_dtype(self):
+        add_sorting_to_nwbfile(sorting=self.multiple_segment_sorting, nwbfile=self.nwbfile)
+
+        spike_times = self.nwbfile.units["spike_times"].target.data
+        assert all(isinstance(spike_time, np.float64) for spike_time in spike_times)
+
+    def test_spike_times_without_segment_start_times(self):
+        """The spike trains are requested through the public API if the segments do not expose their start time."""
+        sorting = generate_sorting(num_units=self.num_units, durations=[3, 4])
+        spike_trains = {
+            (unit_id, segment_index): sorting.get_unit_spike_train(
+                unit_id=unit_id, segment_index=segment_index, return_times=True
+            )
+            for unit_id in sorting.unit_ids
+            for segment_index in range(sorting.get_num_segments())
+        }
+        sorting.get_unit_spike_train = Mock(
+            side_effect=lambda unit_id, segment_index, return_times: spike_trains[(unit_id, segment_index)]
+        )
+        for sorting_segment in sorting._sorting_segments:
+            del sorting_segment._t_start
+
+        add_sorting_to_nwbfile(sorting=sorting, nwbfile=self.nwbfile)
+
+        self.assertEqual(sorting.get_unit_spike_train.call_count, len(spike_trains))
+        for row_index, unit_id in enumerate(sorting.unit_ids):
+            expected_spike_times = np.concatenate([spike_trains[(unit_id, 0)], spike_trains[(unit_id, 1)]])
+            np.testing.assert_array_equal(self.nwbfile.units.get_unit_spike_times(row_index), expected_spike_times)
+
+    def test_spike_times_iterator_reads_the_spike_trains_without_caching_them(self):
+        # The spike trains are read once to be written, and once more to count the spikes without a spike vector
+        for has_spike_vector, number_of_reads_per_unit in ((True, 1), (False, 2)):
+            sorting = generate_sorting(num_units=self.num_units, durations=[3, 4])
+            if not has_spike_vector:
+                sorting._cached_spike_vector = None
+            for sorting_segment in sorting._sorting_segments:
+                sorting_segment.get_unit_spike_train = Mock(wraps=sorting_segment.get_unit_spike_train)
+
+            iterator = SpikeInterfaceSortingSpikeTimesDataChunkIterator(sorting=sorting)
+            spike_times = np.concatenate([data_chunk.data for data_chunk in iterator])
+
+            for sorting_segment in sorting._sorting_segments:
+                self.assertEqual(
+                    sorting_segment.get_unit_spike_train.call_count, number_of_reads_per_unit * self.num_units
+                )
+            self.assertEqual(sorting._cached_spike_trains, dict())
+            self.assertEqual(len(spike_times), sum(sorting.count_num_spikes_per_unit(outputs="array")))
+
+    def test_spike_times_iterator_on_existing_units_table(self):
+        add_sorting_to_nwbfile(sorting=self.sorting_1, nwbfile=self.nwbfile)
+
+        expected_error = (
+            "Writing the spike times with an iterator (iterator_type='v2') is only supported for a new "
+            "Units table, but the table 'units' already contains 4 units."
+        )
+        with self.assertRaisesWith(ValueError, expected_error):
+            add_sorting_to_nwbfile(sorting=self.sorting_2, nwbfile=self.nwbfile, iterator_type="v2")
+
     def test_property_matching_by_unit_name_with_new_property(self):
         """
         Add some units to the units tables before using the add_sorting_to_nwbfile function.
@@ -1,4 +1,5 @@
 import math
+from unittest.mock import Mock
 
 import numpy as np
 from hdmf.testing import TestCase
@@ -170,6 +171,23 @@ class TestImagingExtractorDataChunkIterator(TestCase):
         expected_frames = imaging_extractor.get_series().transpose((0, 2, 1))
         assert_array_equal(data_chunks, expected_frames)
 
+    def test_spatial_tiles_are_read_once_per_temporal_block(self):
+        """Test that the frames of a temporal block are read once for all the spatial tiles of the buffer."""
+        imaging_extractor = generate_dummy_imaging_extractor(num_frames=30, num_columns=10, num_rows=10)
+        imaging_extractor.get_series = Mock(wraps=imaging_extractor.get_series)
+
+        data_chunk_iterator = ImagingExtractorDataChunkIterator(
+            imaging_extractor=imaging_extractor, buffer_shape=(10, 5, 5), chunk_shape=(5, 5, 5)
+        )
+        imaging_extractor.get_series.reset_mock()
+        data_chunks = np.zeros(data_chunk_iterator.maxshape)
+        for data_chunk in data_chunk_iterator:
+            data_chunks[data_chunk.selection] = data_chunk.data
+
+        assert imaging_extractor.get_series.call_count == 3
+        expected_frames = imaging_extractor.get_series().transpose((0, 2, 1))
+        assert_array_equal(data_chunks, expected_frames)
+
     def test_progress_bar(self):
         """Test that the progress bar can be used with the iterator."""
         dci = ImagingExtractorDataChunkIterator(
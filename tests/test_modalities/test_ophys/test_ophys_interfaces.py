@@ -1,4 +1,5 @@
 import numpy as np
+from pynwb import NWBHDF5IO
 
 from neuroconv.tools.testing.data_interface_mixins import (
     ImagingExtractorInterfaceTestMixin,
@@ -33,3 +34,23 @@ class TestMockSegmentationInterface(SegmentationExtractorInterfaceTestMixin):
 
     data_interface_cls = MockSegmentationInterface
     interface_kwargs = dict()
+
+    def test_image_mask_iterator_options(self, tmp_path):
+        interface = MockSegmentationInterface(num_rois=4, num_rows=12, num_columns=9)
+        nwbfile_path = tmp_path / "test_image_mask_iterator_options.nwb"
+        interface.run_conversion(
+            nwbfile_path=nwbfile_path,
+            image_mask_iterator_type="v2",
+            image_mask_iterator_options=dict(buffer_shape=(2, 9, 12), chunk_shape=(1, 9, 12)),
+            iterator_options=dict(buffer_shape=(10, 4), chunk_shape=(5, 2)),
+        )
+
+        with NWBHDF5IO(path=nwbfile_path, mode="r") as io:
+            nwbfile = io.read()
+            plane_segmentation = nwbfile.processing["ophys"]["ImageSegmentation"]["PlaneSegmentation"]
+            image_masks = plane_segmentation["image_mask"].data
+            assert image_masks.chunks == (1, 9, 12)
+            expected_image_masks = interface.segmentation_extractor.get_roi_image_masks().T
+            np.testing.assert_array_equal(image_masks[:], expected_image_masks)
+            roi_response_series = nwbfile.processing["ophys"]["Fluorescence"]["RoiResponseSeries"]
+            assert roi_response_series.data.chunks == (5, 2)
@@ -14,6 +14,7 @@ import psutil
 import pytest
 from hdmf.data_utils import DataChunkIterator
 from hdmf.testing import TestCase
+from numpy.lib.recfunctions import structured_to_unstructured
 from numpy.testing import assert_array_equal, assert_raises
 from numpy.typing import ArrayLike
 from parameterized import param, parameterized
@@ -36,6 +37,9 @@ from neuroconv.tools.roiextractors import (
     add_plane_segmentation_to_nwbfile,
     add_summary_images_to_nwbfile,
 )
+from neuroconv.tools.roiextractors.imagemaskdatachunkiterator import (
+    ImageMaskDataChunkIterator,
+)
 from neuroconv.tools.roiextractors.imagingextractordatachunkiterator import (
     ImagingExtractorDataChunkIterator,
 )
@@ -350,10 +354,15 @@ def _generate_casted_test_masks(num_rois: int, mask_type: Literal["pixel", "voxe
 def assert_masks_equal(mask: list[list[tuple[int, int, int]]], expected_mask: list[list[tuple[int, int, int]]]):
     """
     Asserts that two lists of pixel masks of inhomogeneous shape are equal.
+
+    The masks of each ROI may be structured arrays with the compound dtype of the NWB specification.
     """
     assert len(mask) == len(expected_mask)
     for mask_ind in range(len(mask)):
-        assert_array_equal(mask[mask_ind], expected_mask[mask_ind])
+        per_roi_mask = np.asarray(mask[mask_ind])
+        if per_roi_mask.dtype.names is not None:
+            per_roi_mask = structured_to_unstructured(per_roi_mask)
+        assert_array_equal(per_roi_mask, expected_mask[mask_ind])
 
 
 class TestAddPlaneSegmentation(TestCase):
@@ -696,6 +705,77 @@ class TestAddPlaneSegmentation(TestCase):
         true_voxel_masks = _generate_casted_test_masks(num_rois=self.num_rois, mask_type="voxel")
         assert_masks_equal(plane_segmentation["voxel_mask"][:], true_voxel_masks)
 
+    def test_image_masks_with_iterator(self):
+        """Test that the image masks written through the ImageMaskDataChunkIterator match the in-memory image masks."""
+        image_mask_iterator_options = dict(buffer_shape=(3, self.num_columns, self.num_rows), chunk_shape=(1, 10, 5))
+        add_plane_segmentation_to_nwbfile(
+            segmentation_extractor=self.segmentation_extractor,
+            nwbfile=self.nwbfile,
+            metadata=self.metadata,
+            plane_segmentation_name=self.plane_segmentation_name,
+            image_mask_iterator_type="v2",
+            image_mask_iterator_options=image_mask_iterator_options,
+        )
+
+        image_segmentation = self.nwbfile.processing["ophys"].get(self.image_segmentation_name)
+        plane_segmentation = image_segmentation.plane_segmentations[self.plane_segmentation_name]
+        image_mask_iterator = plane_segmentation["image_mask"].data
+        assert isinstance(image_mask_iterator, ImageMaskDataChunkIterator)
+        assert image_mask_iterator.maxshape == (self.num_rois, self.num_columns, self.num_rows)
+
+        image_masks = np.zeros(shape=image_mask_iterator.maxshape, dtype=image_mask_iterator.dtype)
+        for data_chunk in image_mask_iterator:
+            image_masks[data_chunk.selection] = data_chunk.data
+
+        expected_image_masks = self.segmentation_extractor.get_roi_image_masks().T
+        assert_array_equal(image_masks, expected_image_masks)
+
+    def test_image_mask_iterator_builds_buffers_from_pixel_masks(self):
+        """Test that the buffers are built from the pixel masks rather than from the dense image masks of the ROIs."""
+        expected_image_masks = self.segmentation_extractor.get_roi_image_masks().T
+        roi_ids = self.segmentation_extractor.get_roi_ids()
+        pixel_masks = dict(zip(roi_ids, self.segmentation_extractor.get_roi_pixel_masks(roi_ids=roi_ids)))
+        self.segmentation_extractor.get_roi_pixel_masks = Mock(
+            side_effect=lambda roi_ids: [pixel_masks[roi_id] for roi_id in roi_ids]
+        )
+        self.segmentation_extractor.get_roi_image_masks = Mock(wraps=self.segmentation_extractor.get_roi_image_masks)
+
+        image_mask_iterator = ImageMaskDataChunkIterator(
+            segmentation_extractor=self.segmentation_extractor,
+            buffer_shape=(3, self.num_columns, self.num_rows),
+            chunk_shape=(1, 10, 5),
+        )
+        image_masks = np.zeros(shape=image_mask_iterator.maxshape, dtype=image_mask_iterator.dtype)
+        for data_chunk in image_mask_iterator:
+            image_masks[data_chunk.selection] = data_chunk.data
+
+        assert_array_equal(image_masks, expected_image_masks)
+        # Only the mask of the first ROI is read as an image, to determine the shape and dtype of the masks
+        self.segmentation_extractor.get_roi_image_masks.assert_called_once_with(roi_ids=roi_ids[:1])
+
+    def test_no_image_mask_column_without_rois(self):
+        """Test that a plane segmentation without ROIs does not get an empty image mask column."""
+        segmentation_extractor = generate_dummy_segmentation_extractor(
+            num_rois=0,
+            num_frames=self.num_frames,
+            num_rows=self.num_rows,
+            num_columns=self.num_columns,
+        )
+        # The masks of an extractor without ROIs cannot be stacked by roiextractors
+        segmentation_extractor.get_roi_image_masks = Mock(return_value=np.empty((self.num_rows, self.num_columns, 0)))
+        add_plane_segmentation_to_nwbfile(
+            segmentation_extractor=segmentation_extractor,
+            nwbfile=self.nwbfile,
+            metadata=self.metadata,
+            plane_segmentation_name=self.plane_segmentation_name,
+            include_roi_centroids=False,
+        )
+
+        image_segmentation = self.nwbfile.processing["ophys"].get(self.image_segmentation_name)
+        plane_segmentation = image_segmentation.plane_segmentations[self.plane_segmentation_name]
+        assert len(plane_segmentation.id) == 0
+        assert "image_mask" not in plane_segmentation.colnames
+
     def test_not_overwriting_plane_segmentation_if_same_name(self):
         """Test that adding a plane segmentation with the same name will not overwrite
         the existing plane segmentation."""
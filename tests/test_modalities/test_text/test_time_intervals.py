@@ -1,14 +1,18 @@
 import os
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
+import pytest
 from numpy.testing import assert_array_equal
 from pynwb import NWBHDF5IO
+from pynwb.epoch import TimeIntervals
 
 from neuroconv.datainterfaces import (
     CsvTimeIntervalsInterface,
     ExcelTimeIntervalsInterface,
 )
+from neuroconv.datainterfaces.text.timeintervalsinterface import TimeIntervalsInterface
 from neuroconv.tools.nwb_helpers import make_nwbfile_from_metadata
 from neuroconv.tools.text import convert_df_to_time_intervals
 
@@ -42,6 +46,33 @@ def test_convert_df_to_time_intervals_():
     assert time_intervals["condition"].description == "This is a custom description"
 
 
+def test_convert_df_to_time_intervals_matches_row_by_row_construction():
+    df = pd.DataFrame(
+        dict(
+            start_time=[0.0, 1.0, 2.0],
+            stop_time=[1.0, 2.0, 3.0],
+            trial=[1, 2, 3],
+            condition=["a", "b", "a"],
+            correct=[True, False, True],
+            tags=[["left"], ["right", "rewarded"], []],
+        )
+    )
+    time_intervals = convert_df_to_time_intervals(df.copy())
+
+    expected_time_intervals = TimeIntervals(name="trials", description="experimental trials")
+    for column_name in ("trial", "condition", "correct", "tags"):
+        expected_time_intervals.add_column(column_name, column_name)
+    for _, row in df.iterrows():
+        expected_time_intervals.add_row(row.to_dict())
+
+    assert time_intervals.colnames == expected_time_intervals.colnames
+    assert list(time_intervals.id.data) == list(expected_time_intervals.id.data)
+    for column, expected_column in zip(time_intervals.columns, expected_time_intervals.columns):
+        assert type(column) is type(expected_column)
+        assert [type(value) for value in column.data] == [type(value) for value in expected_column.data]
+        assert_array_equal(np.asarray(column.data, dtype=object), np.asarray(expected_column.data, dtype=object))
+
+
 def test_excel_time_intervals():
     interface = ExcelTimeIntervalsInterface(trials_xls_path)
     metadata = interface.get_metadata()
@@ -96,3 +127,61 @@ def test_csv_round_trip_rename(tmp_path):
 def test_get_metadata_schema():
     interface = CsvTimeIntervalsInterface(trials_csv_path)
     interface.get_metadata_schema()
+
+
+def test_csv_streaming_matches_in_memory(tmp_path):
+    number_of_rows = 250
+    dataframe = pd.DataFrame(
+        dict(
+            start_time=np.arange(number_of_rows) * 1.0,
+            reward_time=np.arange(number_of_rows) + 0.5,
+            trial=np.arange(number_of_rows),
+            condition=["left", "right"] * (number_of_rows // 2),
+        )
+    )
+    file_path = tmp_path / "events.csv"
+    dataframe.to_csv(file_path, index=False)
+
+    tables = dict()
+    for rows_per_chunk in (None, 40):
+        interface = CsvTimeIntervalsInterface(file_path=file_path, rows_per_chunk=rows_per_chunk)
+        interface.set_aligned_starting_time(aligned_starting_time=1.5)
+        interface.align_by_interpolation(
+            unaligned_timestamps=np.arange(number_of_rows + 2) * 1.0,
+            aligned_timestamps=np.arange(number_of_rows + 2) * 2.0,
+            column="reward_time",
+        )
+
+        metadata = interface.get_metadata()
+        metadata["NWBFile"] = dict(session_start_time=datetime.now().astimezone())
+        nwbfile_path = tmp_path / f"streaming_{rows_per_chunk}.nwb"
+        interface.run_conversion(nwbfile_path=nwbfile_path, metadata=metadata)
+
+        with NWBHDF5IO(nwbfile_path, "r") as io:
+            tables[rows_per_chunk] = io.read().trials.to_dataframe()
+
+    pd.testing.assert_frame_equal(tables[40], tables[None])
+    assert_array_equal(tables[40]["reward_time"], (np.arange(number_of_rows) + 2.0) * 2.0)
+
+
+def test_csv_streaming_get_timestamps(tmp_path):
+    file_path = tmp_path / "events.csv"
+    pd.DataFrame(dict(start_time=[0.0, 1.0, 2.0], stop_time=[0.5, 1.5, 2.5])).to_csv(file_path, index=False)
+    interface = CsvTimeIntervalsInterface(file_path=file_path, rows_per_chunk=2)
+
+    interface.set_aligned_timestamps(aligned_timestamps=np.array([10.0, 11.0, 12.0]), column="start_time")
+
+    assert_array_equal(interface.get_original_timestamps(column="start_time"), [0.0, 1.0, 2.0])
+    assert_array_equal(interface.get_timestamps(column="start_time"), [10.0, 11.0, 12.0])
+    assert_array_equal(interface.get_timestamps(column="stop_time"), [0.5, 1.5, 2.5])
+
+
+def test_rows_per_chunk_requires_reading_in_chunks():
+    class ExcelTimeIntervalsInterfaceWithRowsPerChunk(ExcelTimeIntervalsInterface):
+        def __init__(self, file_path, rows_per_chunk):
+            TimeIntervalsInterface.__init__(self, file_path=file_path, rows_per_chunk=rows_per_chunk)
+
+    with pytest.raises(ValueError, match="cannot read its file in chunks"):
+        ExcelTimeIntervalsInterfaceWithRowsPerChunk(file_path=trials_xls_path, rows_per_chunk=10)
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        CsvTimeIntervalsInterface(file_path=trials_csv_path, rows_per_chunk=0)
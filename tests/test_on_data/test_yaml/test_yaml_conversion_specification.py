@@ -3,6 +3,7 @@ from datetime import datetime
 from pathlib import Path
 
 import pytest
+import yaml
 from hdmf.testing import TestCase
 from jsonschema import validate
 from pynwb import NWBHDF5IO
@@ -90,6 +91,58 @@ def test_run_conversion_from_yaml():
         assert "spike_times" in nwbfile.units
 
 
+def test_run_conversion_from_yaml_parallel(tmp_path):
+    path_to_test_yml_files = Path(__file__).parent / "conversion_specifications"
+    yaml_file_path = path_to_test_yml_files / "GIN_conversion_specification.yml"
+    run_conversion_from_yaml(
+        specification_file_path=yaml_file_path,
+        data_folder_path=DATA_PATH,
+        output_folder_path=tmp_path,
+        overwrite=True,
+        number_of_jobs=2,
+    )
+
+    for nwbfile_name, subject_id in [
+        ("example_converter_spec_1.nwb", "1"),
+        ("example_converter_spec_2.nwb", "002"),
+        ("example_converter_spec_3.nwb", "Subject Name"),
+    ]:
+        nwbfile_path = tmp_path / nwbfile_name
+        assert nwbfile_path.exists(), f"`run_conversion_from_yaml` failed to create the file at '{nwbfile_path}'!"
+        with NWBHDF5IO(path=nwbfile_path, mode="r") as io:
+            nwbfile = io.read()
+            assert nwbfile.lab == "My Lab"
+            assert nwbfile.subject.subject_id == subject_id
+
+
+@pytest.mark.parametrize("number_of_jobs", [1, 2])
+def test_run_conversion_from_yaml_failure_isolation(tmp_path, number_of_jobs):
+    specification = load_dict_from_file(
+        file_path=Path(__file__).parent / "conversion_specifications" / "GIN_conversion_specification.yml"
+    )
+    specification["number_of_jobs"] = number_of_jobs
+    specification["experiments"]["ymaze"]["sessions"][0]["source_data"]["ap"]["file_path"] = "not_a_file.ap.bin"
+    yaml_file_path = tmp_path / "failing_specification.yml"
+    with open(file=yaml_file_path, mode="w") as file:
+        yaml.dump(specification, file)
+
+    output_folder_path = tmp_path / "output"
+    with pytest.raises(RuntimeError, match="1 of 3 sessions failed to convert") as error:
+        run_conversion_from_yaml(
+            specification_file_path=yaml_file_path,
+            data_folder_path=DATA_PATH,
+            output_folder_path=output_folder_path,
+            overwrite=True,
+        )
+
+    # The full traceback of the failing session is reported, not only its exception message
+    assert "Traceback (most recent call last)" in str(error.value)
+
+    assert not (output_folder_path / "example_converter_spec_1.nwb").exists()
+    assert (output_folder_path / "example_converter_spec_2.nwb").exists()
+    assert (output_folder_path / "example_converter_spec_3.nwb").exists()
+
+
 class TestYAMLConversionSpecification(TestCase):
     test_folder = OUTPUT_PATH
 